@@ -177,14 +177,14 @@ def cmd_report(args):
         db = DatabaseManager.from_config(args.config)
         categories = db.list_categories()
         
+        report_items = []
         for category in categories:
             logger.info(f"Processing category: {category.name}")
             analysis = analyzer.analyze_category(category.name)
-            report_path = reporter.generate_report(
-                analysis,
-                subdirectory=category.name,
-                filename=f"aggregated_{category.name}_ALL.txt"
-            )
+            report_items.append((analysis, category.name, f"aggregated_{category.name}_ALL.txt"))
+        
+        # Write all category reports in one batch
+        for report_path in reporter.generate_reports(report_items):
             logger.info(f"  ✓ Saved to: {report_path}")
 
 
@@ -23,6 +23,9 @@ from models import (
 
 logger = logging.getLogger(__name__)
 
+# Photo rows removed per transaction when deleting sessions
+PHOTO_DELETE_BATCH_SIZE = 5000
+
 
 class DatabaseManager:
     """
@@ -42,16 +45,21 @@ class DatabaseManager:
         >>> photos = db.get_photos_by_session(session.id)
     """
     
-    def __init__(self, db_type: str = 'sqlite', connection_string: str = 'metadata.db'):
+    def __init__(self, db_type: str = 'sqlite', connection_string: str = 'metadata.db',
+                 check_same_thread: bool = True):
         """
         Initialize database manager.
         
         Args:
             db_type: Type of database ('sqlite', 'postgresql', 'mysql')
             connection_string: Connection string or path for SQLite
+            check_same_thread: For SQLite, restrict the connection to the thread
+                that created it. Pass False only if callers make sure a single
+                thread uses the manager at a time (e.g. a connection pool).
         """
         self.db_type = db_type
         self.connection_string = connection_string
+        self.check_same_thread = check_same_thread
         self.conn = None
         
         # Initialize connection
@@ -61,12 +69,14 @@ class DatabaseManager:
         self._initialize_schema()
     
     @classmethod
-    def from_config(cls, config_path: str = 'config.yaml') -> 'DatabaseManager':
+    def from_config(cls, config_path: str = 'config.yaml',
+                    check_same_thread: bool = True) -> 'DatabaseManager':
         """
         Create DatabaseManager from configuration file.
         
         Args:
             config_path: Path to YAML configuration file
+            check_same_thread: See __init__
         
         Returns:
             Configured DatabaseManager instance
@@ -88,15 +98,30 @@ class DatabaseManager:
         else:
             raise ValueError(f"Unsupported database type: {db_type}")
         
-        return cls(db_type=db_type, connection_string=connection_string)
+        return cls(db_type=db_type, connection_string=connection_string,
+                   check_same_thread=check_same_thread)
     
     def _connect(self):
         """Establish database connection."""
         if self.db_type == 'sqlite':
-            self.conn = sqlite3.connect(self.connection_string)
+            # Filtered queries vary with the filters and IN-list lengths, so
+            # keep more than the default 128 statements prepared on
+            # long-lived (pooled) connections
+            self.conn = sqlite3.connect(self.connection_string,
+                                        check_same_thread=self.check_same_thread,
+                                        cached_statements=256)
             self.conn.row_factory = sqlite3.Row
             # Enable foreign key constraints
             self.conn.execute("PRAGMA foreign_keys = ON")
+            # Write-ahead logging lets readers proceed while an extraction is
+            # writing; NORMAL sync is safe from corruption in WAL mode
+            self.conn.execute("PRAGMA journal_mode = WAL")
+            self.conn.execute("PRAGMA synchronous = NORMAL")
+            self.conn.execute("PRAGMA temp_store = MEMORY")
+            # The workload is read-mostly: keep up to 64 MB of pages cached
+            # per connection and read the file through a memory map
+            self.conn.execute("PRAGMA cache_size = -65536")
+            self.conn.execute("PRAGMA mmap_size = 268435456")
             logger.info(f"Connected to SQLite database: {self.connection_string}")
         elif self.db_type == 'postgresql':
             # TODO: Implement PostgreSQL connection
@@ -697,6 +722,50 @@ class DatabaseManager:
             cursor.execute("SELECT DISTINCT group_name FROM sessions WHERE group_name IS NOT NULL ORDER BY group_name")
             return [row[0] for row in cursor.fetchall()]
     
+    def _delete_sessions_in_batches(self, cursor, session_ids: List[int]) -> int:
+        """
+        Delete sessions and their photos, committing every batch of photos.
+        
+        Short transactions keep the write lock (and the WAL) small while a
+        large session is removed, instead of one ON DELETE CASCADE holding
+        both. Each session's last batch of photos is deleted in the same
+        transaction as the session row, so the cascade is only a safety net.
+        
+        This is not atomic: until its last batch commits, a session is still
+        visible with only some of its photos. If a batch fails, the session
+        keeps its remaining photos and deleting it again finishes the job.
+        
+        Returns:
+            Number of sessions deleted
+        """
+        deleted = 0
+        for session_id in session_ids:
+            while True:
+                cursor.execute(
+                    "DELETE FROM photos WHERE id IN "
+                    "(SELECT id FROM photos WHERE session_id = ? LIMIT ?)",
+                    (session_id, PHOTO_DELETE_BATCH_SIZE)
+                )
+                if cursor.rowcount < PHOTO_DELETE_BATCH_SIZE:
+                    break
+                self.conn.commit()  # type: ignore
+            cursor.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+            deleted += cursor.rowcount
+            self.conn.commit()  # type: ignore
+        return deleted
+    
+    def delete_session(self, session_id: int) -> bool:
+        """Delete a session and its photos.
+        
+        Args:
+            session_id: ID of the session to delete
+            
+        Returns:
+            True if the session existed
+        """
+        with self.get_cursor() as cursor:
+            return self._delete_sessions_in_batches(cursor, [session_id]) > 0
+    
     def delete_sessions_by_category(self, categories: List[str]) -> int:
         """Delete sessions and their photos by category.
         
@@ -718,13 +787,8 @@ class DatabaseManager:
             if not session_ids:
                 return 0
             
-            # Delete photos first (foreign key constraint)
-            id_placeholders = ','.join('?' * len(session_ids))
-            cursor.execute(f"DELETE FROM photos WHERE session_id IN ({id_placeholders})", session_ids)
-            
-            # Delete sessions
-            cursor.execute(f"DELETE FROM sessions WHERE category IN ({placeholders})", categories)
-            self.conn.commit()
+            # Delete photos in batches, each session with its last batch
+            self._delete_sessions_in_batches(cursor, session_ids)
             
             logger.info(f"Deleted {len(session_ids)} sessions from categories: {categories}")
             return len(session_ids)
@@ -750,13 +814,8 @@ class DatabaseManager:
             if not session_ids:
                 return 0
             
-            # Delete photos first (foreign key constraint)
-            id_placeholders = ','.join('?' * len(session_ids))
-            cursor.execute(f"DELETE FROM photos WHERE session_id IN ({id_placeholders})", session_ids)
-            
-            # Delete sessions
-            cursor.execute(f"DELETE FROM sessions WHERE group_name IN ({placeholders})", groups)
-            self.conn.commit()
+            # Delete photos in batches, each session with its last batch
+            self._delete_sessions_in_batches(cursor, session_ids)
             
             logger.info(f"Deleted {len(session_ids)} sessions from groups: {groups}")
             return len(session_ids)
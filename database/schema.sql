@@ -131,6 +131,8 @@ CREATE INDEX IF NOT EXISTS idx_photos_lens_name ON photos(lens_name);
 CREATE INDEX IF NOT EXISTS idx_sessions_category ON sessions(category);
 CREATE INDEX IF NOT EXISTS idx_sessions_group ON sessions(group_name);
 CREATE INDEX IF NOT EXISTS idx_sessions_date ON sessions(date);
+-- Sessions of one category/group in date order (wrapped, session lists)
+CREATE INDEX IF NOT EXISTS idx_sessions_category_group_date ON sessions(category, group_name, date);
 CREATE INDEX IF NOT EXISTS idx_groups_category_id ON groups(category_id);
 CREATE INDEX IF NOT EXISTS idx_aggregated_stats_type ON aggregated_stats(aggregation_type);
 
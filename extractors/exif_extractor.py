@@ -12,6 +12,7 @@ import re
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from fractions import Fraction
+from concurrent.futures import ThreadPoolExecutor
 try:
     import exiftool  # type: ignore
 except ImportError:
@@ -26,6 +27,16 @@ from storage import StorageProvider, create_storage_provider
 
 logger = logging.getLogger(__name__)
 
+# The only tags extract_metadata_from_file reads; asking ExifTool for just
+# these (see fast mode) keeps it from formatting and sending everything else
+_EXIF_TAG_ARGS = (
+    "-EXIF:Make", "-EXIF:Model", "-EXIF:LensModel", "-EXIF:FocalLength",
+    "-EXIF:ISO", "-EXIF:FNumber", "-EXIF:ExposureTime", "-EXIF:ExposureProgram",
+    "-EXIF:ExposureBiasValue", "-EXIF:Flash", "-EXIF:DateTimeOriginal",
+    "-EXIF:CreateDate", "-EXIF:ImageWidth", "-EXIF:ImageHeight",
+    "-File:FileSize", "-File:ImageWidth", "-File:ImageHeight",
+)
+
 
 class ExifExtractor:
     """
@@ -66,12 +77,14 @@ class ExifExtractor:
         ]
     
     @classmethod
-    def from_config(cls, config_path: str = 'config.yaml') -> 'ExifExtractor':
+    def from_config(cls, config_path: str = 'config.yaml',
+                    db: Optional[DatabaseManager] = None) -> 'ExifExtractor':
         """
         Create ExifExtractor from configuration file.
         
         Args:
             config_path: Path to YAML configuration file
+            db: Existing DatabaseManager to use (defaults to a new one from config_path)
         
         Returns:
             Configured ExifExtractor instance
@@ -81,7 +94,8 @@ class ExifExtractor:
         with open(config_path, 'r') as f:
             config = yaml.safe_load(f)
         
-        db = DatabaseManager.from_config(config_path)
+        if db is None:
+            db = DatabaseManager.from_config(config_path)
         storage = create_storage_provider(config_path)
         
         extraction_config = config.get('extraction', {})
@@ -220,12 +234,18 @@ class ExifExtractor:
         
         return most_common_date, f"{len(unique_dates)} different dates, using most common ({count}/{len(found_dates)} files)"
     
-    def extract_metadata_from_file(self, file_path: str) -> Optional[Dict[str, Any]]:
+    def extract_metadata_from_file(self, file_path: str,
+                                   et: Optional[exiftool.ExifTool] = None,
+                                   fast: bool = True) -> Optional[Dict[str, Any]]:
         """
         Extract EXIF metadata from a single image file.
         
         Args:
             file_path: Path or URI to image file
+            et: Running ExifTool instance to use (defaults to starting one
+                just for this file)
+            fast: Read only the tags used here, and let ExifTool skip maker
+                notes and trailers (-fast2). Set False to read every tag.
         
         Returns:
             Dictionary with extracted metadata, or None if extraction fails
@@ -235,89 +255,97 @@ class ExifExtractor:
             >>> print(metadata['Camera'])
             'SONY ILCE-7SM3'
         """
-        try:
-            with exiftool.ExifTool() as et:
-                output = et.execute("-j", file_path)
-                
-                metadata_list = json.loads(output)
-                if not metadata_list:
-                    logger.warning(f"No metadata found for: {file_path}")
-                    return None
-                
-                metadata = metadata_list[0]
-                
-                # Convert exposure time to fraction
-                exposure_time = metadata.get("EXIF:ExposureTime", "")
-                if exposure_time and isinstance(exposure_time, (int, float, str)):
-                    try:
-                        exposure_time_float = float(exposure_time)
-                        exposure_time_fraction = Fraction(exposure_time_float).limit_denominator()
-                        exposure_time_str = f"{exposure_time_fraction.numerator}/{exposure_time_fraction.denominator}"
-                    except (ValueError, ZeroDivisionError):
-                        exposure_time_str = str(exposure_time)
-                else:
-                    exposure_time_str = ""
-                
-                # Map exposure program codes
-                exposure_program_map = {
-                    0: "Not defined", 1: "Manual", 2: "Normal program",
-                    3: "Aperture priority", 4: "Shutter priority", 5: "Creative program",
-                    6: "Action program", 7: "Portrait mode", 8: "Landscape mode"
-                }
-                exposure_program = metadata.get("EXIF:ExposureProgram", "")
-                exposure_program_str = exposure_program_map.get(
-                    exposure_program, 
-                    f"Unknown ({exposure_program})" if exposure_program else ""
-                )
-                
-                # Map flash mode codes
-                flash_mode_map = {
-                    0: "Flash off, no flash function", 1: "Flash fired", 
-                    5: "Flash fired, return not detected",
-                    7: "Flash fired, return detected", 
-                    9: "Flash on, compulsory flash mode",
-                    13: "Flash on, return not detected", 
-                    16: "Flash off, no flash function"
-                }
-                flash_mode = metadata.get("EXIF:Flash", "")
-                flash_mode_str = flash_mode_map.get(
-                    flash_mode, 
-                    f"Unknown ({flash_mode})" if flash_mode != "" else ""
-                )
-                
-                # Extract date taken
-                date_taken = None
-                date_str = metadata.get("EXIF:DateTimeOriginal") or metadata.get("EXIF:CreateDate")
-                if date_str:
-                    try:
-                        date_taken = datetime.strptime(date_str, "%Y:%m:%d %H:%M:%S")
-                    except ValueError:
-                        pass
-                
-                # Get file info
-                file_size = metadata.get("File:FileSize")
-                if isinstance(file_size, str) and "bytes" in file_size:
-                    file_size = int(file_size.split()[0])
-                
-                return {
-                    "File": os.path.basename(file_path),
-                    "FilePath": file_path,
-                    "Camera": (metadata.get("EXIF:Make", "") + " " + 
-                              metadata.get("EXIF:Model", "")).strip(),
-                    "Lens": metadata.get('EXIF:LensModel', "Unknown"),
-                    "FocalLength": metadata.get("EXIF:FocalLength", ""),
-                    "ISO": metadata.get("EXIF:ISO", ""),
-                    "Aperture": metadata.get("EXIF:FNumber", ""),
-                    "ShutterSpeed": exposure_time_str,
-                    "ExposureProgram": exposure_program_str,
-                    "ExposureBias": metadata.get("EXIF:ExposureBiasValue", ""),
-                    "FlashMode": flash_mode_str,
-                    "DateTaken": date_taken,
-                    "FileSize": file_size,
-                    "Width": metadata.get("EXIF:ImageWidth") or metadata.get("File:ImageWidth"),
-                    "Height": metadata.get("EXIF:ImageHeight") or metadata.get("File:ImageHeight"),
-                }
+        if fast:
+            args = ("-j", "-fast2") + _EXIF_TAG_ARGS + (file_path,)
+        else:
+            args = ("-j", file_path)
         
+        try:
+            if et is None:
+                with exiftool.ExifTool() as et:
+                    output = et.execute(*args)
+            else:
+                output = et.execute(*args)
+            
+            metadata_list = json.loads(output)
+            if not metadata_list:
+                logger.warning(f"No metadata found for: {file_path}")
+                return None
+            
+            metadata = metadata_list[0]
+            
+            # Convert exposure time to fraction
+            exposure_time = metadata.get("EXIF:ExposureTime", "")
+            if exposure_time and isinstance(exposure_time, (int, float, str)):
+                try:
+                    exposure_time_float = float(exposure_time)
+                    exposure_time_fraction = Fraction(exposure_time_float).limit_denominator()
+                    exposure_time_str = f"{exposure_time_fraction.numerator}/{exposure_time_fraction.denominator}"
+                except (ValueError, ZeroDivisionError):
+                    exposure_time_str = str(exposure_time)
+            else:
+                exposure_time_str = ""
+            
+            # Map exposure program codes
+            exposure_program_map = {
+                0: "Not defined", 1: "Manual", 2: "Normal program",
+                3: "Aperture priority", 4: "Shutter priority", 5: "Creative program",
+                6: "Action program", 7: "Portrait mode", 8: "Landscape mode"
+            }
+            exposure_program = metadata.get("EXIF:ExposureProgram", "")
+            exposure_program_str = exposure_program_map.get(
+                exposure_program, 
+                f"Unknown ({exposure_program})" if exposure_program else ""
+            )
+            
+            # Map flash mode codes
+            flash_mode_map = {
+                0: "Flash off, no flash function", 1: "Flash fired", 
+                5: "Flash fired, return not detected",
+                7: "Flash fired, return detected", 
+                9: "Flash on, compulsory flash mode",
+                13: "Flash on, return not detected", 
+                16: "Flash off, no flash function"
+            }
+            flash_mode = metadata.get("EXIF:Flash", "")
+            flash_mode_str = flash_mode_map.get(
+                flash_mode, 
+                f"Unknown ({flash_mode})" if flash_mode != "" else ""
+            )
+            
+            # Extract date taken
+            date_taken = None
+            date_str = metadata.get("EXIF:DateTimeOriginal") or metadata.get("EXIF:CreateDate")
+            if date_str:
+                try:
+                    date_taken = datetime.strptime(date_str, "%Y:%m:%d %H:%M:%S")
+                except ValueError:
+                    pass
+            
+            # Get file info
+            file_size = metadata.get("File:FileSize")
+            if isinstance(file_size, str) and "bytes" in file_size:
+                file_size = int(file_size.split()[0])
+            
+            return {
+                "File": os.path.basename(file_path),
+                "FilePath": file_path,
+                "Camera": (metadata.get("EXIF:Make", "") + " " + 
+                          metadata.get("EXIF:Model", "")).strip(),
+                "Lens": metadata.get('EXIF:LensModel', "Unknown"),
+                "FocalLength": metadata.get("EXIF:FocalLength", ""),
+                "ISO": metadata.get("EXIF:ISO", ""),
+                "Aperture": metadata.get("EXIF:FNumber", ""),
+                "ShutterSpeed": exposure_time_str,
+                "ExposureProgram": exposure_program_str,
+                "ExposureBias": metadata.get("EXIF:ExposureBiasValue", ""),
+                "FlashMode": flash_mode_str,
+                "DateTaken": date_taken,
+                "FileSize": file_size,
+                "Width": metadata.get("EXIF:ImageWidth") or metadata.get("File:ImageWidth"),
+                "Height": metadata.get("EXIF:ImageHeight") or metadata.get("File:ImageHeight"),
+            }
+    
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse ExifTool output for {file_path}: {e}")
             return None
@@ -325,6 +353,56 @@ class ExifExtractor:
             logger.error(f"Error extracting metadata from {file_path}: {e}")
             return None
     
+    def extract_metadata_from_files(self, file_paths: List[str],
+                                    workers: Optional[int] = None,
+                                    fast: bool = True) -> List[Optional[Dict[str, Any]]]:
+        """
+        Extract EXIF metadata from many image files in parallel.
+        
+        The files are split into one contiguous batch per worker thread, and
+        each thread runs a single ExifTool process for its whole batch instead
+        of starting one per file (restarting it if it dies on a file). Threads
+        spend their time waiting on ExifTool, so they overlap well despite
+        the GIL.
+        
+        Args:
+            file_paths: Paths or URIs to image files
+            workers: Number of worker threads (defaults to the CPU count)
+            fast: See extract_metadata_from_file
+        
+        Returns:
+            Metadata dicts as returned by extract_metadata_from_file (None
+            for files that failed), in the same order as file_paths
+        """
+        if not file_paths:
+            return []
+        
+        workers = max(1, min(workers or os.cpu_count() or 1, len(file_paths)))
+        batch_size = -(-len(file_paths) // workers)
+        batches = [file_paths[i:i + batch_size] for i in range(0, len(file_paths), batch_size)]
+        
+        def _extract_batch(batch: List[str]) -> List[Optional[Dict[str, Any]]]:
+            et = exiftool.ExifTool()
+            results = []
+            try:
+                for file_path in batch:
+                    # A file that crashes ExifTool must not fail the rest of
+                    # the batch, so start a new process if the last one died
+                    if not et.running:
+                        et.run()
+                    results.append(self.extract_metadata_from_file(file_path, et, fast))
+            except Exception as e:
+                logger.error(f"Error running ExifTool for {len(batch) - len(results)} files: {e}")
+                results.extend([None] * (len(batch) - len(results)))
+            finally:
+                if et.running:
+                    et.terminate()
+            return results
+        
+        with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+            return [metadata for batch_results in executor.map(_extract_batch, batches)
+                    for metadata in batch_results]
+    
     def count_raw_photos(self, raw_folder_path: str) -> Optional[int]:
         """
         Count RAW photos in a folder.
@@ -377,7 +455,9 @@ class ExifExtractor:
                       calculate_hit_rate: bool = True,
                       date: Optional[datetime] = None,
                       use_date_heuristics: bool = True,
-                      use_filename_dates: bool = True) -> Optional[Session]:
+                      use_filename_dates: bool = True,
+                      workers: Optional[int] = None,
+                      fast_exif: bool = True) -> Optional[Session]:
         """
         Extract metadata from all photos in a folder and create session.
         
@@ -390,6 +470,9 @@ class ExifExtractor:
             calculate_hit_rate: Whether to calculate hit rate (requires RAW folder)
             date: Optional explicit date for the session
             use_date_heuristics: Whether to extract date from session name if not provided
+            workers: Number of threads extracting metadata (defaults to the CPU count)
+            fast_exif: Read only the EXIF tags that are stored (see
+                extract_metadata_from_file)
         
         Returns:
             Created Session instance with all photos
@@ -485,11 +568,13 @@ class ExifExtractor:
         session = self.db.create_session(session)
         logger.info(f"Created session: {session.name} (ID: {session.id})")
         
-        # Extract and save photo metadata
+        # Extract metadata in parallel, then save photos in file order (the
+        # database connection belongs to this thread)
+        metadata_dicts = self.extract_metadata_from_files(image_files, workers, fast_exif)
+        
         photo_count = 0
-        for file_path in image_files:
+        for file_path, metadata_dict in zip(image_files, metadata_dicts):
             try:
-                metadata_dict = self.extract_metadata_from_file(file_path)
                 if not metadata_dict:
                     continue
                 
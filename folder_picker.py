@@ -0,0 +1,40 @@
+"""
+Folder Picker Helper
+
+Long-lived helper process behind run_local.py's /api/browse-folder endpoint.
+
+Creating a Tk interpreter for every dialog is slow and unreliable from the
+web server's request threads, so the server starts this script once and
+keeps it running. It holds a single hidden Tk root and, for every "PICK"
+line read from stdin, opens a folder dialog and writes the selected path to
+stdout as a JSON string ("" if the dialog was cancelled). It exits when
+stdin is closed.
+"""
+
+import sys
+import json
+import tkinter as tk
+from tkinter import filedialog
+
+
+def main():
+    """Serve folder picks until stdin is closed."""
+    root = tk.Tk()
+    root.withdraw()
+    root.attributes('-topmost', True)
+    
+    for line in sys.stdin:
+        if line.strip() != 'PICK':
+            continue
+        
+        folder_path = filedialog.askdirectory(parent=root, title='Select Folder')
+        
+        # askdirectory returns '' or () when cancelled, depending on platform
+        sys.stdout.write(json.dumps(folder_path or '') + '\n')
+        sys.stdout.flush()
+    
+    root.destroy()
+
+
+if __name__ == '__main__':
+    main()
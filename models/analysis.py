@@ -6,9 +6,18 @@ Represents aggregated analysis results across sessions, groups, or categories.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from collections import Counter
 import json
+import re
+from operator import itemgetter
+
+
+# Focal range such as "24-70mm"; the same pattern Lens.classify_type uses
+_ZOOM_RE = re.compile(r'\d+-\d+mm')
+
+# Sort key for (name, count) pairs
+_BY_COUNT = itemgetter(1)
 
 
 @dataclass
@@ -240,6 +249,36 @@ class Analysis:
         self.prime_count += session_stats.get('prime_count', 0)
         self.zoom_count += session_stats.get('zoom_count', 0)
     
+    def lenses_by_type(self) -> Tuple[List[Tuple[str, int]], List[Tuple[str, int]]]:
+        """
+        Split lens usage into prime and zoom lenses.
+        
+        A lens counts as a zoom when its name has a focal range such as
+        "24-70mm" (matching Lens.classify_type); everything else is treated
+        as a prime.
+        
+        Returns:
+            Tuple of (prime_lenses, zoom_lenses), each a list of
+            (lens_name, count) sorted by count, most used first
+        
+        Example:
+            >>> primes, zooms = analysis.lenses_by_type()
+            >>> primes[0]
+            ('FE 135mm F1.8 GM', 86)
+        """
+        prime_lenses = []
+        zoom_lenses = []
+        
+        for lens, count in self.lens_freq.items():
+            if _ZOOM_RE.search(lens):
+                zoom_lenses.append((lens, count))
+            else:
+                prime_lenses.append((lens, count))
+        
+        prime_lenses.sort(key=_BY_COUNT, reverse=True)
+        zoom_lenses.sort(key=_BY_COUNT, reverse=True)
+        return prime_lenses, zoom_lenses
+    
     def calculate_aggregated_hit_rate(self, total_raw: int):
         """
         Calculate overall hit rate for aggregated sessions.
@@ -5,6 +5,15 @@ from tkinter import filedialog
 from collections import defaultdict
 from fractions import Fraction
 
+# Patterns used by parse_metadata_file, compiled once for all files
+_LENS_SPLIT_RE = re.compile(r'\nLens: (.+?) \(Used (\d+) times\)\n')
+_SHUTTER_RE = re.compile(r'Shutter Speeds:(.*?)(?=Apertures:|$)', re.DOTALL)
+_APERTURE_RE = re.compile(r'Apertures:(.*?)(?=ISOs:|$)', re.DOTALL)
+_ISO_RE = re.compile(r'ISOs:(.*?)(?=Exposure Programs:|$)', re.DOTALL)
+_PROGRAM_RE = re.compile(r'Exposure Programs:(.*?)(?=Flash Modes:|$)', re.DOTALL)
+_FLASH_RE = re.compile(r'Flash Modes:(.*?)$', re.DOTALL)
+_ROW_RE = re.compile(r'\s+(.+?):\s+(\d+)\s+times')
+
 def parse_metadata_file(filepath):
     """Parse a metadata analysis text file and extract the data."""
     with open(filepath, 'r', encoding='utf-8') as f:
@@ -22,7 +31,7 @@ def parse_metadata_file(filepath):
     }
     
     # Split into lens sections
-    lens_sections = re.split(r'\nLens: (.+?) \(Used (\d+) times\)\n', content)
+    lens_sections = _LENS_SPLIT_RE.split(content)
     
     # Process each lens section (skip first element which is the overall summary)
     for i in range(1, len(lens_sections), 3):
@@ -37,46 +46,46 @@ def parse_metadata_file(filepath):
         lens_data['count'] += lens_count
         
         # Parse shutter speeds
-        shutter_match = re.search(r'Shutter Speeds:(.*?)(?=Apertures:|$)', lens_content, re.DOTALL)
+        shutter_match = _SHUTTER_RE.search(lens_content)
         if shutter_match:
             for line in shutter_match.group(1).strip().split('\n'):
-                match = re.match(r'\s+(.+?):\s+(\d+)\s+times', line)
+                match = _ROW_RE.match(line)
                 if match:
                     speed, count = match.groups()
                     lens_data['shutter_speeds'][speed] += int(count)
         
         # Parse apertures
-        aperture_match = re.search(r'Apertures:(.*?)(?=ISOs:|$)', lens_content, re.DOTALL)
+        aperture_match = _APERTURE_RE.search(lens_content)
         if aperture_match:
             for line in aperture_match.group(1).strip().split('\n'):
-                match = re.match(r'\s+(.+?):\s+(\d+)\s+times', line)
+                match = _ROW_RE.match(line)
                 if match:
                     aperture, count = match.groups()
                     lens_data['apertures'][float(aperture)] += int(count)
         
         # Parse ISOs
-        iso_match = re.search(r'ISOs:(.*?)(?=Exposure Programs:|$)', lens_content, re.DOTALL)
+        iso_match = _ISO_RE.search(lens_content)
         if iso_match:
             for line in iso_match.group(1).strip().split('\n'):
-                match = re.match(r'\s+(.+?):\s+(\d+)\s+times', line)
+                match = _ROW_RE.match(line)
                 if match:
                     iso, count = match.groups()
                     lens_data['isos'][int(iso)] += int(count)
         
         # Parse exposure programs
-        program_match = re.search(r'Exposure Programs:(.*?)(?=Flash Modes:|$)', lens_content, re.DOTALL)
+        program_match = _PROGRAM_RE.search(lens_content)
         if program_match:
             for line in program_match.group(1).strip().split('\n'):
-                match = re.match(r'\s+(.+?):\s+(\d+)\s+times', line)
+                match = _ROW_RE.match(line)
                 if match:
                     program, count = match.groups()
                     lens_data['exposure_programs'][program] += int(count)
         
         # Parse flash modes
-        flash_match = re.search(r'Flash Modes:(.*?)$', lens_content, re.DOTALL)
+        flash_match = _FLASH_RE.search(lens_content)
         if flash_match:
             for line in flash_match.group(1).strip().split('\n'):
-                match = re.match(r'\s+(.+?):\s+(\d+)\s+times', line)
+                match = _ROW_RE.match(line)
                 if match:
                     mode, count = match.groups()
                     lens_data['flash_modes'][mode] += int(count)
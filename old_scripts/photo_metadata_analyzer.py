@@ -9,86 +9,178 @@ Two modes:
 
 import os
 import sys
+import atexit
 import json
+import hashlib
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import tkinter as tk
 from tkinter import filedialog, simpledialog
 from collections import defaultdict, Counter
 from fractions import Fraction
+from functools import lru_cache
+from operator import itemgetter
+from pathlib import Path
 from datetime import datetime
 import exiftool
 import re
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # ============================================================================
 # EXIF EXTRACTION
 # ============================================================================
 
+# One long-running ExifTool (-stay_open) per process, shared by every folder
+# that process handles. Worker processes don't run atexit hooks, but their
+# ExifTool exits on its own once the worker's end of the pipe closes.
+_exiftool = None
+
+
+def get_exiftool():
+    """Return this process's ExifTool instance, starting it on first use."""
+    global _exiftool
+    if _exiftool is None or not _exiftool.running:
+        _exiftool = exiftool.ExifTool()
+        _exiftool.run()
+    return _exiftool
+
+
+def close_exiftool():
+    """Stop the shared ExifTool instance if it is running."""
+    global _exiftool
+    if _exiftool is not None:
+        try:
+            if _exiftool.running:
+                _exiftool.terminate()
+        finally:
+            _exiftool = None
+
+
+atexit.register(close_exiftool)
+
+
+def _execute_exiftool(*args):
+    """Run one command on the shared ExifTool, restarting it next time if it fails."""
+    try:
+        return get_exiftool().execute(*args)
+    except Exception:
+        close_exiftool()
+        raise
+
+
 def extract_metadata(file_path):
     """Extract EXIF metadata from a single image file."""
-    with exiftool.ExifTool() as et:
-        output = et.execute("-j", file_path)
+    output = _execute_exiftool("-j", file_path)
+    
+    try:
+        metadata_list = json.loads(output)
+        if not metadata_list:
+            raise ValueError(f"No metadata found for: {file_path}")
         
+        return build_metadata_record(metadata_list[0], file_path)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Failed to parse ExifTool output for {file_path}: {e}")
+
+
+def extract_metadata_batch(file_paths):
+    """Extract EXIF metadata from many image files with a single ExifTool call.
+    
+    Per-command overhead dominates the cost of reading one file, so a whole
+    folder is passed in one command to the shared ExifTool and the results are
+    matched back to files via ExifTool's SourceFile field.
+    
+    Returns:
+        Dict mapping each file's basename to its metadata record. Files that
+        ExifTool could not read are missing from the dict.
+    """
+    output = _execute_exiftool("-j", *file_paths)
+    
+    try:
+        raw_records = json.loads(output) if output else []
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Failed to parse ExifTool output: {e}")
+    
+    records = {}
+    for raw in raw_records:
+        # ExifTool may normalize separators in SourceFile; the basename is stable
+        file_name = os.path.basename(raw.get("SourceFile", ""))
+        records[file_name] = build_metadata_record(raw, file_name)
+    return records
+
+
+def build_metadata_record(metadata, file_path):
+    """Convert one raw ExifTool JSON record into the analyzer's metadata dict."""
+    # Convert exposure time to fraction
+    exposure_time = metadata.get("EXIF:ExposureTime", "")
+    if exposure_time and isinstance(exposure_time, (int, float, str)):
         try:
-            metadata_list = json.loads(output)
-            if not metadata_list:
-                raise ValueError(f"No metadata found for: {file_path}")
-            
-            metadata = metadata_list[0]
-            
-            # Convert exposure time to fraction
-            exposure_time = metadata.get("EXIF:ExposureTime", "")
-            if exposure_time and isinstance(exposure_time, (int, float, str)):
-                try:
-                    exposure_time_float = float(exposure_time)
-                    exposure_time_fraction = Fraction(exposure_time_float).limit_denominator()
-                    exposure_time_str = f"{exposure_time_fraction.numerator}/{exposure_time_fraction.denominator}"
-                except (ValueError, ZeroDivisionError):
-                    exposure_time_str = str(exposure_time)
-            else:
-                exposure_time_str = ""
-            
-            # Map exposure program codes
-            exposure_program_map = {
-                0: "Not defined", 1: "Manual", 2: "Normal program",
-                3: "Aperture priority", 4: "Shutter priority", 5: "Creative program",
-                6: "Action program", 7: "Portrait mode", 8: "Landscape mode"
-            }
-            exposure_program = metadata.get("EXIF:ExposureProgram", "")
-            exposure_program_str = exposure_program_map.get(exposure_program, f"Unknown ({exposure_program})")
-            
-            # Map flash mode codes
-            flash_mode_map = {
-                0: "No flash", 1: "Flash fired", 5: "Flash fired, return not detected",
-                7: "Flash fired, return detected", 9: "Flash on, compulsory flash mode",
-                13: "Flash on, return not detected", 16: "Flash off, no flash function"
-            }
-            flash_mode = metadata.get("EXIF:Flash", "")
-            flash_mode_str = flash_mode_map.get(flash_mode, f"Unknown ({flash_mode})")
-            
-            return {
-                "File": os.path.basename(file_path),
-                "Camera": metadata.get("EXIF:Make", "") + " " + metadata.get("EXIF:Model", ""),
-                "Lens": metadata.get('EXIF:LensModel', "Unknown"),
-                "FocalLength": metadata.get("EXIF:FocalLength", ""),
-                "ISO": metadata.get("EXIF:ISO", ""),
-                "Aperture": metadata.get("EXIF:FNumber", ""),
-                "ShutterSpeed": exposure_time_str,
-                "ExposureProgram": exposure_program_str,
-                "ExposureBias": metadata.get("EXIF:ExposureBiasValue", ""),
-                "FlashMode": flash_mode_str
-            }
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Failed to parse ExifTool output for {file_path}: {e}")
+            exposure_time_float = float(exposure_time)
+            exposure_time_fraction = Fraction(exposure_time_float).limit_denominator()
+            exposure_time_str = f"{exposure_time_fraction.numerator}/{exposure_time_fraction.denominator}"
+        except (ValueError, ZeroDivisionError):
+            exposure_time_str = str(exposure_time)
+    else:
+        exposure_time_str = ""
+    
+    # Map exposure program codes
+    exposure_program_map = {
+        0: "Not defined", 1: "Manual", 2: "Normal program",
+        3: "Aperture priority", 4: "Shutter priority", 5: "Creative program",
+        6: "Action program", 7: "Portrait mode", 8: "Landscape mode"
+    }
+    exposure_program = metadata.get("EXIF:ExposureProgram", "")
+    exposure_program_str = exposure_program_map.get(exposure_program, f"Unknown ({exposure_program})")
+    
+    # Map flash mode codes
+    flash_mode_map = {
+        0: "No flash", 1: "Flash fired", 5: "Flash fired, return not detected",
+        7: "Flash fired, return detected", 9: "Flash on, compulsory flash mode",
+        13: "Flash on, return not detected", 16: "Flash off, no flash function"
+    }
+    flash_mode = metadata.get("EXIF:Flash", "")
+    flash_mode_str = flash_mode_map.get(flash_mode, f"Unknown ({flash_mode})")
+    
+    return {
+        "File": os.path.basename(file_path),
+        "Camera": metadata.get("EXIF:Make", "") + " " + metadata.get("EXIF:Model", ""),
+        "Lens": metadata.get('EXIF:LensModel', "Unknown"),
+        "FocalLength": metadata.get("EXIF:FocalLength", ""),
+        "ISO": metadata.get("EXIF:ISO", ""),
+        "Aperture": metadata.get("EXIF:FNumber", ""),
+        "ShutterSpeed": exposure_time_str,
+        "ExposureProgram": exposure_program_str,
+        "ExposureBias": metadata.get("EXIF:ExposureBiasValue", ""),
+        "FlashMode": flash_mode_str
+    }
+
+
+_IMAGE_EXTENSIONS = ('.arw', '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp')
 
 
+def iter_image_files(folder_path):
+    """Yield the names of image files directly inside a folder.
+    
+    Uses os.scandir so the file-type check comes from the directory listing
+    itself rather than an extra stat call per entry.
+    """
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            if entry.name.lower().endswith(_IMAGE_EXTENSIONS) and entry.is_file():
+                yield entry.name
+
+
+@lru_cache(maxsize=256)
 def count_image_files(folder_path):
     """Count only image files in a folder (excluding .xml and other non-image files)."""
-    image_extensions = ('.arw', '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp')
     count = 0
     
-    for filename in os.listdir(folder_path):
-        if filename.lower().endswith(image_extensions):
-            count += 1
+    for _ in iter_image_files(folder_path):
+        count += 1
     
     return count
 
@@ -106,8 +198,10 @@ def calculate_hit_rate(edited_folder_path, raw_folder_path):
     if not os.path.exists(raw_folder_path):
         return None
     
-    edited_count = count_image_files(edited_folder_path)
-    raw_count = count_image_files(raw_folder_path)
+    # Counts are cached, so sibling Edited folders sharing one RAW folder
+    # only list it once; the returned dict is still built fresh per call.
+    edited_count = count_image_files(os.path.abspath(edited_folder_path))
+    raw_count = count_image_files(os.path.abspath(raw_folder_path))
     
     if raw_count == 0:
         return None
@@ -121,6 +215,26 @@ def calculate_hit_rate(edited_folder_path, raw_folder_path):
     }
 
 
+def hit_rate_from_totals(total_edited, total_raw):
+    """Build a combined hit rate from edited/RAW totals accumulated across folders.
+    
+    Args:
+        total_edited: Number of edited images across the combined folders
+        total_raw: Number of RAW images across the combined folders
+    
+    Returns:
+        Dict with 'edited', 'raw', and 'percentage' keys, or None if there are no RAW images
+    """
+    if total_raw == 0:
+        return None
+    
+    return {
+        'edited': total_edited,
+        'raw': total_raw,
+        'percentage': (total_edited / total_raw) * 100
+    }
+
+
 def detect_raw_folder(edited_folder_path):
     """Try to find a corresponding RAW folder for an Edited folder.
     
@@ -132,8 +246,12 @@ def detect_raw_folder(edited_folder_path):
     Returns:
         Path to RAW folder if found, None otherwise
     """
-    parent_dir = os.path.dirname(edited_folder_path)
-    
+    return _find_raw_folder_in(os.path.dirname(os.path.abspath(edited_folder_path)))
+
+
+@lru_cache(maxsize=256)
+def _find_raw_folder_in(parent_dir):
+    """Return the first RAW folder under parent_dir (cached per parent directory)."""
     # Check for common RAW folder names
     raw_folder_names = ['RAW', 'Raw', 'raw', 'RAW Files', 'Raws']
     
@@ -145,20 +263,81 @@ def detect_raw_folder(edited_folder_path):
     return None
 
 
+# Output files are serialized in memory and written with a single call
+# through a large buffer (fewer syscalls, notably on network drives).
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def save_metadata_json(json_path, metadata_list):
+    """Write extracted metadata to a UTF-8 JSON file, using orjson when it is installed.
+    
+    Both paths write 2-space indented JSON with non-ASCII characters (e.g.
+    "ƒ/1.4") unescaped, so the file is the same with or without orjson.
+    """
+    if orjson is not None:
+        with open(json_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(orjson.dumps(metadata_list, option=orjson.OPT_INDENT_2))
+    else:
+        write_text_file(json_path, json.dumps(metadata_list, indent=2, ensure_ascii=False))
+
+
+_CLEAN_TABLE = str.maketrans(' -', '__')
+_CLEAN_TABLE_DOTS = str.maketrans(' -.', '___')
+
+
+def _clean_name(name, replace_dots=False):
+    """Turn a category/group/folder name into a lowercase file-name fragment.
+    
+    Spaces and hyphens become underscores (and dots too when replace_dots is set).
+    """
+    return name.translate(_CLEAN_TABLE_DOTS if replace_dots else _CLEAN_TABLE).lower()
+
+
+# String fields that repeat across nearly every photo in a shoot
+_INTERNED_FIELDS = ("Camera", "Lens", "ShutterSpeed", "ExposureProgram", "FlashMode")
+
+
+def write_text_file(path, text):
+    """Write a text report to disk as UTF-8."""
+    with open(path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write(text)
+
+
 def process_folder(folder_path):
     """Extract metadata from all images in a folder."""
     all_metadata = []
-    image_extensions = ('.arw', '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp')
     
-    for filename in os.listdir(folder_path):
-        if filename.lower().endswith(image_extensions):
-            file_path = os.path.join(folder_path, filename)
-            try:
-                metadata = extract_metadata(file_path)
-                all_metadata.append(metadata)
-                print(f"  Processed: {filename}")
-            except Exception as e:
-                print(f"  Error processing {filename}: {e}")
+    # Share one string object per distinct value so large folders don't keep
+    # thousands of copies of the same lens/camera/setting names alive
+    intern_pool = {}
+    
+    filenames = list(iter_image_files(folder_path))
+    if not filenames:
+        return all_metadata
+    
+    # Read the whole folder with one ExifTool call; if that fails, fall back
+    # to one call per file so a single bad image can't sink the folder
+    try:
+        records = extract_metadata_batch([os.path.join(folder_path, filename) for filename in filenames])
+    except Exception as e:
+        print(f"  Batch extraction failed ({e}); processing files individually")
+        records = None
+    
+    for filename in filenames:
+        try:
+            if records is None:
+                metadata = extract_metadata(os.path.join(folder_path, filename))
+            elif filename in records:
+                metadata = records[filename]
+            else:
+                raise ValueError(f"No metadata found for: {filename}")
+            for field in _INTERNED_FIELDS:
+                value = metadata[field]
+                metadata[field] = intern_pool.setdefault(value, value)
+            all_metadata.append(metadata)
+            print(f"  Processed: {filename}")
+        except Exception as e:
+            print(f"  Error processing {filename}: {e}")
     
     return all_metadata
 
@@ -167,6 +346,19 @@ def process_folder(folder_path):
 # ANALYSIS
 # ============================================================================
 
+# Sort key for (name, count) pairs
+_by_count = itemgetter(1)
+
+# Zoom lenses carry a focal range in their name, e.g. "FE 24-70mm F2.8 GM II"
+# or, on compact cameras, "5.2-20.8 mm"
+_ZOOM_RE = re.compile(r'\d+(?:\.\d+)?-\d+(?:\.\d+)?\s*mm', re.IGNORECASE)
+
+
+def is_zoom_lens(lens_name):
+    """Return True if the lens name contains a focal range (e.g. '24-70mm')."""
+    return _ZOOM_RE.search(lens_name) is not None
+
+
 def parse_shutter_speed(speed_str):
     """Parse shutter speed string (e.g., '1/200') into a float for comparison."""
     if not speed_str or speed_str == "":
@@ -180,8 +372,30 @@ def parse_shutter_speed(speed_str):
         return None
 
 
+_FREQ_FIELDS = ('lens_freq', 'shutter_speed_freq', 'aperture_freq', 'iso_freq',
+                'exposure_program_freq', 'flash_mode_freq')
+
+
+def _empty_analysis(analysis_name):
+    """Return the analyze_metadata result for a folder with no images."""
+    analysis = {'name': analysis_name, 'total_count': 0}
+    analysis.update((field, Counter()) for field in _FREQ_FIELDS)
+    analysis['lens_breakdowns'] = {}
+    analysis['lens_kind'] = {}
+    return analysis
+
+
+def _drop_empty_keys(counter):
+    """Remove blank/zero setting values (e.g. '' for a missing ISO) from a Counter."""
+    for key in [key for key in counter if not key]:
+        del counter[key]
+
+
 def analyze_metadata(metadata_list, analysis_name):
     """Analyze metadata and return frequency statistics."""
+    if not metadata_list:
+        return _empty_analysis(analysis_name)
+    
     # Overall counters
     lens_freq = Counter()
     shutter_speed_freq = Counter()
@@ -209,9 +423,10 @@ def analyze_metadata(metadata_list, analysis_name):
         exposure_program_freq[exposure_program] += 1
         flash_mode_freq[flash_mode] += 1
         
-        # Build lens-specific breakdowns
-        if lens not in lens_breakdowns:
-            lens_breakdowns[lens] = {
+        # Build lens-specific breakdowns (look the lens entry up once per photo)
+        breakdown = lens_breakdowns.get(lens)
+        if breakdown is None:
+            breakdown = lens_breakdowns[lens] = {
                 "ShutterSpeed": Counter(),
                 "Aperture": Counter(),
                 "ISO": Counter(),
@@ -220,12 +435,22 @@ def analyze_metadata(metadata_list, analysis_name):
                 "Count": 0
             }
         
-        lens_breakdowns[lens]["ShutterSpeed"][shutter_speed] += 1
-        lens_breakdowns[lens]["Aperture"][aperture] += 1
-        lens_breakdowns[lens]["ISO"][iso] += 1
-        lens_breakdowns[lens]["ExposureProgram"][exposure_program] += 1
-        lens_breakdowns[lens]["FlashMode"][flash_mode] += 1
-        lens_breakdowns[lens]["Count"] += 1
+        breakdown["ShutterSpeed"][shutter_speed] += 1
+        breakdown["Aperture"][aperture] += 1
+        breakdown["ISO"][iso] += 1
+        breakdown["ExposureProgram"][exposure_program] += 1
+        breakdown["FlashMode"][flash_mode] += 1
+        breakdown["Count"] += 1
+    
+    # Missing settings are never reported, so drop them once here rather than
+    # filtering them out in every formatting loop
+    _drop_empty_keys(shutter_speed_freq)
+    _drop_empty_keys(aperture_freq)
+    _drop_empty_keys(iso_freq)
+    for breakdown in lens_breakdowns.values():
+        _drop_empty_keys(breakdown["ShutterSpeed"])
+        _drop_empty_keys(breakdown["Aperture"])
+        _drop_empty_keys(breakdown["ISO"])
     
     return {
         'name': analysis_name,
@@ -236,22 +461,27 @@ def analyze_metadata(metadata_list, analysis_name):
         'iso_freq': iso_freq,
         'exposure_program_freq': exposure_program_freq,
         'flash_mode_freq': flash_mode_freq,
-        'lens_breakdowns': lens_breakdowns
+        'lens_breakdowns': lens_breakdowns,
+        'lens_kind': {lens: 'zoom' if is_zoom_lens(lens) else 'prime' for lens in lens_freq}
     }
 
 
 def format_analysis_output(analysis_data, hit_rate=None):
     """Format analysis data into readable text output."""
-    lines = []
+    return "\n".join(_analysis_output_lines(analysis_data, hit_rate))
+
+
+def _analysis_output_lines(analysis_data, hit_rate=None):
+    """Yield the lines of format_analysis_output one at a time."""
     name = analysis_data['name']
     total = analysis_data['total_count']
     
-    lines.append(f"Analysis: {name}")
-    lines.append("=" * 80)
-    lines.append(f"\nTotal photos analyzed: {total}")
+    yield f"Analysis: {name}"
+    yield "=" * 80
+    yield f"\nTotal photos analyzed: {total}"
     if hit_rate is not None:
-        lines.append(f"Hit Rate (Edited/RAW): {hit_rate['edited']}/{hit_rate['raw']} = {hit_rate['percentage']:.1f}%")
-    lines.append("\n" + "=" * 80)
+        yield f"Hit Rate (Edited/RAW): {hit_rate['edited']}/{hit_rate['raw']} = {hit_rate['percentage']:.1f}%"
+    yield "\n" + "=" * 80
     
     # Calculate prime vs zoom
     prime_count = 0
@@ -259,8 +489,9 @@ def format_analysis_output(analysis_data, hit_rate=None):
     prime_lenses = []
     zoom_lenses = []
     
+    lens_kind = analysis_data['lens_kind']
     for lens, count in analysis_data['lens_freq'].items():
-        if '-' in lens and 'mm' in lens:
+        if lens_kind[lens] == 'zoom':
             zoom_count += count
             zoom_lenses.append((lens, count))
         else:
@@ -268,124 +499,118 @@ def format_analysis_output(analysis_data, hit_rate=None):
             prime_lenses.append((lens, count))
     
     # Overall metrics
-    lines.append("\nOVERALL METRICS")
-    lines.append("-" * 80)
+    yield "\nOVERALL METRICS"
+    yield "-" * 80
     
-    lines.append(f"\nLens Type Distribution:")
-    lines.append(f"  Prime Lenses: {prime_count} photos ({prime_count/total*100:.1f}%)")
-    for lens, count in sorted(prime_lenses, key=lambda x: x[1], reverse=True):
-        lines.append(f"    - {lens}: {count} photos")
-    lines.append(f"  Zoom Lenses: {zoom_count} photos ({zoom_count/total*100:.1f}%)")
-    for lens, count in sorted(zoom_lenses, key=lambda x: x[1], reverse=True):
-        lines.append(f"    - {lens}: {count} photos")
+    yield f"\nLens Type Distribution:"
+    yield f"  Prime Lenses: {prime_count} photos ({prime_count/total*100:.1f}%)"
+    for lens, count in sorted(prime_lenses, key=_by_count, reverse=True):
+        yield f"    - {lens}: {count} photos"
+    yield f"  Zoom Lenses: {zoom_count} photos ({zoom_count/total*100:.1f}%)"
+    for lens, count in sorted(zoom_lenses, key=_by_count, reverse=True):
+        yield f"    - {lens}: {count} photos"
     
     # Shutter Speeds
-    lines.append(f"\nOverall Shutter Speed Distribution:")
+    yield f"\nOverall Shutter Speed Distribution:"
     for speed, count in sorted(analysis_data['shutter_speed_freq'].items(), 
                                 key=lambda x: parse_shutter_speed(x[0]) or 0):
-        if speed:
-            lines.append(f"  {speed}: {count} times ({count / total * 100:.1f}%)")
+        yield f"  {speed}: {count} times ({count / total * 100:.1f}%)"
     
     # Apertures
-    lines.append(f"\nOverall Aperture Distribution:")
+    yield f"\nOverall Aperture Distribution:"
     for aperture, count in sorted(analysis_data['aperture_freq'].items(), 
                                    key=lambda x: float(x[0]) if x[0] and isinstance(x[0], (int, float)) else float('inf')):
-        if aperture and aperture != "":
-            lines.append(f"  f/{aperture}: {count} times ({count / total * 100:.1f}%)")
+        yield f"  f/{aperture}: {count} times ({count / total * 100:.1f}%)"
     
     # ISOs
-    lines.append(f"\nOverall ISO Distribution:")
+    yield f"\nOverall ISO Distribution:"
     for iso, count in sorted(analysis_data['iso_freq'].items(), 
                             key=lambda x: int(x[0]) if x[0] and isinstance(x[0], (int, float)) else float('inf')):
-        if iso and iso != "":
-            lines.append(f"  ISO {iso}: {count} times ({count / total * 100:.1f}%)")
+        yield f"  ISO {iso}: {count} times ({count / total * 100:.1f}%)"
     
     # Exposure Programs
-    lines.append(f"\nOverall Exposure Program Distribution:")
-    for program, count in analysis_data['exposure_program_freq'].items():
-        lines.append(f"  {program}: {count} times ({count / total * 100:.1f}%)")
+    yield f"\nOverall Exposure Program Distribution:"
+    for program, count in analysis_data['exposure_program_freq'].most_common():
+        yield f"  {program}: {count} times ({count / total * 100:.1f}%)"
     
     # Flash Modes
-    lines.append(f"\nOverall Flash Mode Distribution:")
-    for mode, count in analysis_data['flash_mode_freq'].items():
-        lines.append(f"  {mode}: {count} times ({count / total * 100:.1f}%)")
+    yield f"\nOverall Flash Mode Distribution:"
+    for mode, count in analysis_data['flash_mode_freq'].most_common():
+        yield f"  {mode}: {count} times ({count / total * 100:.1f}%)"
     
     # Lens breakdowns
-    lines.append("\n" + "=" * 80)
-    lines.append("DETAILED BREAKDOWN BY LENS")
-    lines.append("=" * 80)
+    yield "\n" + "=" * 80
+    yield "DETAILED BREAKDOWN BY LENS"
+    yield "=" * 80
     
     for lens, breakdown in analysis_data['lens_breakdowns'].items():
         lens_count = breakdown['Count']
-        lines.append(f"\n{'-' * 80}")
-        lines.append(f"Lens: {lens} (Used {lens_count} times)")
-        lines.append(f"{'-' * 80}")
+        yield f"\n{'-' * 80}"
+        yield f"Lens: {lens} (Used {lens_count} times)"
+        yield f"{'-' * 80}"
         
-        lines.append("Shutter Speeds:")
+        yield "Shutter Speeds:"
         for speed, count in sorted(breakdown["ShutterSpeed"].items(), 
                                    key=lambda x: parse_shutter_speed(x[0]) or 0):
-            if speed:
-                lines.append(f"  {speed}: {count} times ({count / lens_count * 100:.1f}%)")
+            yield f"  {speed}: {count} times ({count / lens_count * 100:.1f}%)"
         
-        lines.append("Apertures:")
+        yield "Apertures:"
         for aperture, count in sorted(breakdown["Aperture"].items(), 
                                       key=lambda x: float(x[0]) if x[0] and isinstance(x[0], (int, float)) else float('inf')):
-            if aperture and aperture != "":
-                lines.append(f"  f/{aperture}: {count} times ({count / lens_count * 100:.1f}%)")
+            yield f"  f/{aperture}: {count} times ({count / lens_count * 100:.1f}%)"
         
-        lines.append("ISOs:")
+        yield "ISOs:"
         for iso, count in sorted(breakdown["ISO"].items(), 
                                 key=lambda x: int(x[0]) if x[0] and isinstance(x[0], (int, float)) else float('inf')):
-            if iso and iso != "":
-                lines.append(f"  ISO {iso}: {count} times ({count / lens_count * 100:.1f}%)")
+            yield f"  ISO {iso}: {count} times ({count / lens_count * 100:.1f}%)"
         
-        lines.append("Exposure Programs:")
-        for program, count in breakdown["ExposureProgram"].items():
-            lines.append(f"  {program}: {count} times ({count / lens_count * 100:.1f}%)")
+        yield "Exposure Programs:"
+        for program, count in breakdown["ExposureProgram"].most_common():
+            yield f"  {program}: {count} times ({count / lens_count * 100:.1f}%)"
         
-        lines.append("Flash Modes:")
-        for mode, count in breakdown["FlashMode"].items():
-            lines.append(f"  {mode}: {count} times ({count / lens_count * 100:.1f}%)")
-    
-    return "\n".join(lines)
+        yield "Flash Modes:"
+        for mode, count in breakdown["FlashMode"].most_common():
+            yield f"  {mode}: {count} times ({count / lens_count * 100:.1f}%)"
 
 
 # ============================================================================
 # AGGREGATION
 # ============================================================================
 
+class LensAgg:
+    """Settings counts for one lens, merged across several analyses."""
+    
+    __slots__ = ('count', 'shutter_speeds', 'apertures', 'isos', 'exposure_programs', 'flash_modes')
+    
+    def __init__(self):
+        self.count = 0
+        self.shutter_speeds = Counter()
+        self.apertures = Counter()
+        self.isos = Counter()
+        self.exposure_programs = Counter()
+        self.flash_modes = Counter()
+
+
 def aggregate_analyses(analyses_list):
     """Aggregate multiple analysis results into one comprehensive summary."""
-    aggregated = {
-        'lenses': defaultdict(lambda: {
-            'count': 0,
-            'shutter_speeds': defaultdict(int),
-            'apertures': defaultdict(float),
-            'isos': defaultdict(int),
-            'exposure_programs': defaultdict(int),
-            'flash_modes': defaultdict(int)
-        })
-    }
+    aggregated = {'lenses': defaultdict(LensAgg)}
     
     for analysis in analyses_list:
         for lens_name, lens_data in analysis['lens_breakdowns'].items():
             agg_lens = aggregated['lenses'][lens_name]
-            agg_lens['count'] += lens_data['Count']
+            agg_lens.count += lens_data['Count']
             
-            for speed, count in lens_data['ShutterSpeed'].items():
-                agg_lens['shutter_speeds'][speed] += count
+            agg_lens.shutter_speeds.update(lens_data['ShutterSpeed'])
+            agg_lens.exposure_programs.update(lens_data['ExposureProgram'])
+            agg_lens.flash_modes.update(lens_data['FlashMode'])
             
+            # Apertures and ISOs are normalized to numbers, and different raw
+            # keys can collapse onto the same number, so merge them one by one
             for aperture, count in lens_data['Aperture'].items():
-                agg_lens['apertures'][float(aperture) if aperture else 0] += count
+                agg_lens.apertures[float(aperture) if aperture else 0] += count
             
             for iso, count in lens_data['ISO'].items():
-                agg_lens['isos'][int(iso) if iso else 0] += count
-            
-            for program, count in lens_data['ExposureProgram'].items():
-                agg_lens['exposure_programs'][program] += count
-            
-            for mode, count in lens_data['FlashMode'].items():
-                agg_lens['flash_modes'][mode] += count
+                agg_lens.isos[int(iso) if iso else 0] += count
     
     return aggregated
 
@@ -401,7 +626,14 @@ def format_aggregated_output(aggregated, folder_names, group_structure=None, ana
         hit_rate: Optional dict with 'edited', 'raw', and 'percentage' keys for overall hit rate display
         individual_hit_rates: Optional dict mapping folder names to their individual hit rates
     """
-    lines = ["Aggregated Metadata Analysis", "=" * 80]
+    return "\n".join(_aggregated_output_lines(aggregated, folder_names, group_structure,
+                                               analyses_list, hit_rate, individual_hit_rates))
+
+
+def _aggregated_output_lines(aggregated, folder_names, group_structure=None, analyses_list=None, hit_rate=None, individual_hit_rates=None):
+    """Yield the lines of format_aggregated_output one at a time."""
+    yield "Aggregated Metadata Analysis"
+    yield "=" * 80
     
     # Create photo count lookup if analyses_list provided
     photo_counts = {}
@@ -412,13 +644,13 @@ def format_aggregated_output(aggregated, folder_names, group_structure=None, ana
     if group_structure:
         # Hierarchical display with groups
         total_folders = sum(len(folders) for folders in group_structure.values())
-        lines.append(f"\nFolders analyzed: {total_folders}")
+        yield f"\nFolders analyzed: {total_folders}"
         if hit_rate is not None:
-            lines.append(f"Hit Rate (Edited/RAW): {hit_rate['edited']}/{hit_rate['raw']} = {hit_rate['percentage']:.1f}%")
-        lines.append(f"Groups: {len(group_structure)}")
+            yield f"Hit Rate (Edited/RAW): {hit_rate['edited']}/{hit_rate['raw']} = {hit_rate['percentage']:.1f}%"
+        yield f"Groups: {len(group_structure)}"
         for group_name in sorted(group_structure.keys()):
             folders = group_structure[group_name]
-            lines.append(f"  - {group_name}: {len(folders)} folder(s)")
+            yield f"  - {group_name}: {len(folders)} folder(s)"
             for folder in sorted(folders):
                 line_parts = [f"      - {folder}"]
                 if folder in photo_counts:
@@ -428,12 +660,12 @@ def format_aggregated_output(aggregated, folder_names, group_structure=None, ana
                         line_parts.append(f" | Hit Rate: {hr['percentage']:.1f}%)")
                     else:
                         line_parts[-1] += ")"
-                lines.append("".join(line_parts))
+                yield "".join(line_parts)
     else:
         # Simple flat list (backward compatibility)
-        lines.append(f"\nFolders analyzed: {len(folder_names)}")
+        yield f"\nFolders analyzed: {len(folder_names)}"
         if hit_rate is not None:
-            lines.append(f"Hit Rate (Edited/RAW): {hit_rate['edited']}/{hit_rate['raw']} = {hit_rate['percentage']:.1f}%")
+            yield f"Hit Rate (Edited/RAW): {hit_rate['edited']}/{hit_rate['raw']} = {hit_rate['percentage']:.1f}%"
         for name in sorted(folder_names):
             line_parts = [f"  - {name}"]
             if name in photo_counts:
@@ -443,162 +675,148 @@ def format_aggregated_output(aggregated, folder_names, group_structure=None, ana
                     line_parts.append(f" | Hit Rate: {hr['percentage']:.1f}%)")
                 else:
                     line_parts[-1] += ")"
-            lines.append("".join(line_parts))
-    
-    lines.append("\n" + "=" * 80)
+            yield "".join(line_parts)
     
-    # Calculate overall metrics across all lenses
-    total_photos = sum(lens_data['count'] for lens_data in aggregated['lenses'].values())
+    yield "\n" + "=" * 80
     
-    # Aggregate all settings across lenses
-    overall_shutter_speeds = defaultdict(int)
-    overall_apertures = defaultdict(int)
-    overall_isos = defaultdict(int)
-    overall_exposure_programs = defaultdict(int)
-    overall_flash_modes = defaultdict(int)
+    # Calculate overall metrics across all lenses in a single pass: photo
+    # total, settings summed over every lens, and prime vs zoom split
+    total_photos = 0
+    overall_shutter_speeds = Counter()
+    overall_apertures = Counter()
+    overall_isos = Counter()
+    overall_exposure_programs = Counter()
+    overall_flash_modes = Counter()
     
-    # Prime vs Zoom classification
     prime_count = 0
     zoom_count = 0
     prime_lenses = []
     zoom_lenses = []
     
     for lens_name, lens_data in aggregated['lenses'].items():
+        total_photos += lens_data.count
+        
         # Aggregate settings
-        for speed, count in lens_data['shutter_speeds'].items():
-            overall_shutter_speeds[speed] += count
-        for aperture, count in lens_data['apertures'].items():
-            overall_apertures[aperture] += count
-        for iso, count in lens_data['isos'].items():
-            overall_isos[iso] += count
-        for program, count in lens_data['exposure_programs'].items():
-            overall_exposure_programs[program] += count
-        for mode, count in lens_data['flash_modes'].items():
-            overall_flash_modes[mode] += count
+        overall_shutter_speeds.update(lens_data.shutter_speeds)
+        overall_apertures.update(lens_data.apertures)
+        overall_isos.update(lens_data.isos)
+        overall_exposure_programs.update(lens_data.exposure_programs)
+        overall_flash_modes.update(lens_data.flash_modes)
         
-        # Classify as prime or zoom (zoom lenses typically have 'mm-' or 'mm F' in the name)
-        if '-' in lens_name and 'mm' in lens_name:
-            zoom_count += lens_data['count']
-            zoom_lenses.append((lens_name, lens_data['count']))
+        # Classify as prime or zoom (zoom lenses have a focal range like '24-70mm')
+        if is_zoom_lens(lens_name):
+            zoom_count += lens_data.count
+            zoom_lenses.append((lens_name, lens_data.count))
         else:
-            prime_count += lens_data['count']
-            prime_lenses.append((lens_name, lens_data['count']))
+            prime_count += lens_data.count
+            prime_lenses.append((lens_name, lens_data.count))
     
     # Display overall metrics
-    lines.append("\nOVERALL METRICS")
-    lines.append("-" * 80)
-    lines.append(f"Total photos analyzed: {total_photos}")
-    lines.append(f"\nLens Type Distribution:")
-    lines.append(f"  Prime Lenses: {prime_count} photos ({prime_count/total_photos*100:.1f}%)")
-    for lens, count in sorted(prime_lenses, key=lambda x: x[1], reverse=True):
-        lines.append(f"    - {lens}: {count} photos")
-    lines.append(f"  Zoom Lenses: {zoom_count} photos ({zoom_count/total_photos*100:.1f}%)")
-    for lens, count in sorted(zoom_lenses, key=lambda x: x[1], reverse=True):
-        lines.append(f"    - {lens}: {count} photos")
+    yield "\nOVERALL METRICS"
+    yield "-" * 80
+    yield f"Total photos analyzed: {total_photos}"
+    yield f"\nLens Type Distribution:"
+    yield f"  Prime Lenses: {prime_count} photos ({prime_count/total_photos*100:.1f}%)"
+    for lens, count in sorted(prime_lenses, key=_by_count, reverse=True):
+        yield f"    - {lens}: {count} photos"
+    yield f"  Zoom Lenses: {zoom_count} photos ({zoom_count/total_photos*100:.1f}%)"
+    for lens, count in sorted(zoom_lenses, key=_by_count, reverse=True):
+        yield f"    - {lens}: {count} photos"
     
     # Overall shutter speeds
-    lines.append(f"\nOverall Shutter Speed Distribution:")
+    yield f"\nOverall Shutter Speed Distribution:"
     sorted_speeds = sorted(overall_shutter_speeds.items(), 
                           key=lambda x: parse_shutter_speed(x[0]) or 0,
                           reverse=True)
     for speed, count in sorted_speeds:
-        if speed:
-            percentage = (count / total_photos) * 100
-            lines.append(f"  {speed}: {count} times ({percentage:.1f}%)")
+        percentage = (count / total_photos) * 100
+        yield f"  {speed}: {count} times ({percentage:.1f}%)"
     
     # Overall apertures
-    lines.append(f"\nOverall Aperture Distribution:")
+    yield f"\nOverall Aperture Distribution:"
     sorted_apertures = sorted(overall_apertures.items())
     for aperture, count in sorted_apertures:
-        if aperture:
-            percentage = (count / total_photos) * 100
-            lines.append(f"  f/{aperture}: {int(count)} times ({percentage:.1f}%)")
+        percentage = (count / total_photos) * 100
+        yield f"  f/{aperture}: {int(count)} times ({percentage:.1f}%)"
     
     # Overall ISOs
-    lines.append(f"\nOverall ISO Distribution:")
+    yield f"\nOverall ISO Distribution:"
     sorted_isos = sorted(overall_isos.items())
     for iso, count in sorted_isos:
-        if iso:
-            percentage = (count / total_photos) * 100
-            lines.append(f"  ISO {iso}: {count} times ({percentage:.1f}%)")
+        percentage = (count / total_photos) * 100
+        yield f"  ISO {iso}: {count} times ({percentage:.1f}%)"
     
     # Overall exposure programs
-    lines.append(f"\nOverall Exposure Program Distribution:")
-    sorted_programs = sorted(overall_exposure_programs.items(), 
-                            key=lambda x: x[1], 
-                            reverse=True)
-    for program, count in sorted_programs:
+    yield f"\nOverall Exposure Program Distribution:"
+    for program, count in overall_exposure_programs.most_common():
         percentage = (count / total_photos) * 100
-        lines.append(f"  {program}: {count} times ({percentage:.1f}%)")
+        yield f"  {program}: {count} times ({percentage:.1f}%)"
     
     # Overall flash modes
-    lines.append(f"\nOverall Flash Mode Distribution:")
-    sorted_modes = sorted(overall_flash_modes.items(), 
-                         key=lambda x: x[1], 
-                         reverse=True)
-    for mode, count in sorted_modes:
+    yield f"\nOverall Flash Mode Distribution:"
+    for mode, count in overall_flash_modes.most_common():
         percentage = (count / total_photos) * 100
-        lines.append(f"  {mode}: {count} times ({percentage:.1f}%)")
+        yield f"  {mode}: {count} times ({percentage:.1f}%)"
     
-    lines.append("\n" + "=" * 80)
-    lines.append("DETAILED BREAKDOWN BY LENS")
-    lines.append("=" * 80)
+    yield "\n" + "=" * 80
+    yield "DETAILED BREAKDOWN BY LENS"
+    yield "=" * 80
     
     sorted_lenses = sorted(aggregated['lenses'].items(), 
-                          key=lambda x: x[1]['count'], 
+                          key=lambda x: x[1].count, 
                           reverse=True)
     
     for lens_name, lens_data in sorted_lenses:
-        lines.append(f"\n{'-' * 80}")
-        lines.append(f"Lens: {lens_name} (Used {lens_data['count']} times)")
-        lines.append(f"{'-' * 80}")
+        yield f"\n{'-' * 80}"
+        yield f"Lens: {lens_name} (Used {lens_data.count} times)"
+        yield f"{'-' * 80}"
         
-        lines.append("Shutter Speeds:")
-        sorted_speeds = sorted(lens_data['shutter_speeds'].items(), 
+        yield "Shutter Speeds:"
+        sorted_speeds = sorted(lens_data.shutter_speeds.items(), 
                               key=lambda x: parse_shutter_speed(x[0]) or 0,
                               reverse=True)
         for speed, count in sorted_speeds:
-            if speed:
-                percentage = (count / lens_data['count']) * 100
-                lines.append(f"  {speed}: {count} times ({percentage:.1f}%)")
+            percentage = (count / lens_data.count) * 100
+            yield f"  {speed}: {count} times ({percentage:.1f}%)"
         
-        lines.append("Apertures:")
-        sorted_apertures = sorted(lens_data['apertures'].items())
+        yield "Apertures:"
+        sorted_apertures = sorted(lens_data.apertures.items())
         for aperture, count in sorted_apertures:
-            if aperture:
-                percentage = (count / lens_data['count']) * 100
-                lines.append(f"  f/{aperture}: {int(count)} times ({percentage:.1f}%)")
+            percentage = (count / lens_data.count) * 100
+            yield f"  f/{aperture}: {int(count)} times ({percentage:.1f}%)"
         
-        lines.append("ISOs:")
-        sorted_isos = sorted(lens_data['isos'].items())
+        yield "ISOs:"
+        sorted_isos = sorted(lens_data.isos.items())
         for iso, count in sorted_isos:
-            if iso:
-                percentage = (count / lens_data['count']) * 100
-                lines.append(f"  ISO {iso}: {count} times ({percentage:.1f}%)")
+            percentage = (count / lens_data.count) * 100
+            yield f"  ISO {iso}: {count} times ({percentage:.1f}%)"
         
-        lines.append("Exposure Programs:")
-        sorted_programs = sorted(lens_data['exposure_programs'].items(), 
-                                key=lambda x: x[1], 
+        yield "Exposure Programs:"
+        sorted_programs = sorted(lens_data.exposure_programs.items(), 
+                                key=_by_count, 
                                 reverse=True)
         for program, count in sorted_programs:
-            percentage = (count / lens_data['count']) * 100
-            lines.append(f"  {program}: {count} times ({percentage:.1f}%)")
+            percentage = (count / lens_data.count) * 100
+            yield f"  {program}: {count} times ({percentage:.1f}%)"
         
-        lines.append("Flash Modes:")
-        sorted_modes = sorted(lens_data['flash_modes'].items(), 
-                             key=lambda x: x[1], 
+        yield "Flash Modes:"
+        sorted_modes = sorted(lens_data.flash_modes.items(), 
+                             key=_by_count, 
                              reverse=True)
         for mode, count in sorted_modes:
-            percentage = (count / lens_data['count']) * 100
-            lines.append(f"  {mode}: {count} times ({percentage:.1f}%)")
-    
-    return "\n".join(lines)
+            percentage = (count / lens_data.count) * 100
+            yield f"  {mode}: {count} times ({percentage:.1f}%)"
 
 
 # ============================================================================
 # BATCH CRAWL MODE
 # ============================================================================
 
+# Directories that never hold photos and aren't worth descending into
+# (hidden folders such as .git or Lightroom previews are skipped separately)
+_SKIP_DIRS = frozenset({'__pycache__', 'node_modules', '$RECYCLE.BIN', 'System Volume Information'})
+
+
 def find_photo_folders(parent_dir, target_folder_name="edited"):
     """
     Recursively find all folders with a specific name (e.g., 'edited').
@@ -607,14 +825,36 @@ def find_photo_folders(parent_dir, target_folder_name="edited"):
     photo_folders = []
     target_lower = target_folder_name.lower()
     
-    for root, dirs, files in os.walk(parent_dir):
-        for dir_name in dirs:
-            if dir_name.lower() == target_lower:
-                photo_folders.append(os.path.join(root, dir_name))
+    # Only directory entries matter here, so scan with os.scandir and never
+    # look at the (often thousands of) image files in each folder. Matches in
+    # a directory are recorded before descending, same order as os.walk.
+    def scan(path):
+        subdirs = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith('.') or name in _SKIP_DIRS or not entry.is_dir():
+                        continue
+                    if name == target_folder_name or name.lower() == target_lower:
+                        photo_folders.append(entry.path)
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+        except OSError:
+            return
+        
+        for subdir in subdirs:
+            scan(subdir)
     
+    scan(parent_dir)
     return photo_folders
 
 
+# Generic folder names that never identify a group on their own
+_SKIP_PARTS = frozenset({'photos', 'edited', 'raw', 'jpg', 'jpeg', 'images'})
+
+
+@lru_cache(maxsize=None)
 def extract_group_name_from_path(folder_path, parent_dir):
     """
     Extract a meaningful group name from the folder path.
@@ -628,13 +868,37 @@ def extract_group_name_from_path(folder_path, parent_dir):
     # Use the first meaningful part (skip generic folders like 'photos', 'edited')
     for part in path_parts:
         part_lower = part.lower()
-        if part_lower not in ['photos', 'edited', 'raw', 'jpg', 'jpeg', 'images']:
+        if part_lower not in _SKIP_PARTS:
             return part.replace(' ', '_')
     
     # Fallback to first part
     return path_parts[0].replace(' ', '_')
 
 
+def _process_one_folder(folder_path, analysis_name):
+    """Extract and analyze a single folder.
+    
+    Runs in a worker process, so it must stay at module level and must not
+    touch Tkinter. Returns (analysis_name, metadata_list, hit_rate, analysis_data);
+    analysis_data is None when the folder contains no images.
+    """
+    # Check if this is an Edited folder and look for RAW folder
+    hit_rate = None
+    if 'edited' in os.path.basename(folder_path).lower():
+        raw_folder = detect_raw_folder(folder_path)
+        if raw_folder:
+            hit_rate = calculate_hit_rate(folder_path, raw_folder)
+    
+    # Extract metadata
+    metadata_list = process_folder(folder_path)
+    
+    analysis_data = None
+    if metadata_list:
+        analysis_data = analyze_metadata(metadata_list, analysis_name)
+    
+    return analysis_name, metadata_list, hit_rate, analysis_data
+
+
 def batch_crawl_mode():
     """Batch mode: crawl a parent directory and process all matching subfolders."""
     
@@ -652,7 +916,7 @@ def batch_crawl_mode():
         print("No category name provided. Exiting.")
         return
     
-    category_clean = category_name.replace(' ', '_').replace('-', '_').lower()
+    category_clean = _clean_name(category_name)
     print(f"\nBatch Crawl Mode - Category: {category_name}\n")
     
     # Select parent directory
@@ -683,8 +947,8 @@ def batch_crawl_mode():
         return
     
     print(f"Found {len(photo_folders)} folders:\n")
-    for folder in photo_folders:
-        group_name = extract_group_name_from_path(folder, parent_dir)
+    group_names = [extract_group_name_from_path(folder, parent_dir) for folder in photo_folders]
+    for group_name, folder in zip(group_names, photo_folders):
         print(f"  {group_name}: {folder}")
     
     # Confirm processing
@@ -708,62 +972,66 @@ def batch_crawl_mode():
     
     all_analyses = []
     group_structure = {}
-    all_hit_rates = []  # Track hit rates across all folders
+    total_edited = total_raw = 0  # Hit-rate totals across all folders
     individual_hit_rates = {}  # Map folder names to hit rates
     
-    for folder_path in photo_folders:
-        group_name = extract_group_name_from_path(folder_path, parent_dir)
-        group_clean = group_name.lower()
+    # Extraction and analysis are independent per folder, so fan them out across
+    # worker processes. Results come back in folder order; all file output and
+    # progress reporting stays in the main process. Analysis text files are
+    # written on a small thread pool so the next result can be handled while
+    # the previous one is still being flushed to disk.
+    write_futures = {}  # analysis path -> pending write
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor, \
+            ThreadPoolExecutor(max_workers=4) as io_pool:
+        results = executor.map(_process_one_folder, photo_folders, group_names, chunksize=1)
         
-        # Create group directory
-        group_json_dir = os.path.join("metadata_json", category_clean, group_clean)
-        group_analysis_dir = os.path.join("metadata_analysis", category_clean, group_clean)
-        os.makedirs(group_json_dir, exist_ok=True)
-        os.makedirs(group_analysis_dir, exist_ok=True)
-        
-        print(f"Processing: {group_name}")
-        
-        # Check if this is an Edited folder and look for RAW folder
-        hit_rate = None
-        if 'edited' in os.path.basename(folder_path).lower():
-            raw_folder = detect_raw_folder(folder_path)
-            if raw_folder:
-                hit_rate = calculate_hit_rate(folder_path, raw_folder)
-                if hit_rate:
-                    print(f"  Hit Rate: {hit_rate['edited']}/{hit_rate['raw']} = {hit_rate['percentage']:.1f}%")
-                    all_hit_rates.append(hit_rate)
-                    individual_hit_rates[group_name] = hit_rate
-        
-        # Extract metadata
-        metadata_list = process_folder(folder_path)
-        
-        if not metadata_list:
-            print(f"  No images found\n")
-            continue
-        
-        print(f"  Found {len(metadata_list)} images")
-        
-        # Save raw metadata JSON
-        json_path = os.path.join(group_json_dir, f"metadata_{group_clean}.json")
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata_list, f, indent=4)
-        print(f"  Saved: {json_path}")
-        
-        # Analyze metadata
-        analysis_data = analyze_metadata(metadata_list, group_name)
-        all_analyses.append(analysis_data)
-        
-        # Track for group structure
-        if category_name not in group_structure:
-            group_structure[category_name] = []
-        group_structure[category_name].append(group_name)
-        
-        # Save individual analysis
-        analysis_text = format_analysis_output(analysis_data, hit_rate)
-        analysis_path = os.path.join(group_analysis_dir, f"analysis_{group_clean}.txt")
-        with open(analysis_path, 'w', encoding='utf-8') as f:
-            f.write(analysis_text)
-        print(f"  Saved: {analysis_path}\n")
+        for group_name, metadata_list, hit_rate, analysis_data in results:
+            group_clean = group_name.lower()
+            
+            # Create group directory
+            group_json_dir = os.path.join("metadata_json", category_clean, group_clean)
+            group_analysis_dir = os.path.join("metadata_analysis", category_clean, group_clean)
+            os.makedirs(group_json_dir, exist_ok=True)
+            os.makedirs(group_analysis_dir, exist_ok=True)
+            
+            print(f"Processing: {group_name}")
+            
+            if hit_rate:
+                print(f"  Hit Rate: {hit_rate['edited']}/{hit_rate['raw']} = {hit_rate['percentage']:.1f}%")
+                total_edited += hit_rate['edited']
+                total_raw += hit_rate['raw']
+                individual_hit_rates[group_name] = hit_rate
+            
+            if not metadata_list:
+                print(f"  No images found\n")
+                continue
+            
+            print(f"  Found {len(metadata_list)} images")
+            
+            # Save raw metadata JSON
+            json_path = os.path.join(group_json_dir, f"metadata_{group_clean}.json")
+            save_metadata_json(json_path, metadata_list)
+            print(f"  Saved: {json_path}")
+            
+            all_analyses.append(analysis_data)
+            
+            # Track for group structure
+            if category_name not in group_structure:
+                group_structure[category_name] = []
+            group_structure[category_name].append(group_name)
+            
+            # Save individual analysis
+            analysis_text = format_analysis_output(analysis_data, hit_rate)
+            analysis_path = os.path.join(group_analysis_dir, f"analysis_{group_clean}.txt")
+            if analysis_path in write_futures:
+                # Two folders mapped to the same group; keep the later one
+                write_futures[analysis_path].result()
+            write_futures[analysis_path] = io_pool.submit(write_text_file, analysis_path, analysis_text)
+            print(f"  Saved: {analysis_path}\n")
+    
+    # Surface any write errors from the background pool
+    for future in write_futures.values():
+        future.result()
     
     # Create category-level aggregation
     if len(all_analyses) > 1:
@@ -772,23 +1040,13 @@ def batch_crawl_mode():
         folder_names = [a['name'] for a in all_analyses]
         
         # Calculate combined hit rate for category if applicable
-        category_hit_rate = None
-        if all_hit_rates:
-            total_edited = sum(hr['edited'] for hr in all_hit_rates)
-            total_raw = sum(hr['raw'] for hr in all_hit_rates)
-            if total_raw > 0:
-                category_hit_rate = {
-                    'edited': total_edited,
-                    'raw': total_raw,
-                    'percentage': (total_edited / total_raw) * 100
-                }
+        category_hit_rate = hit_rate_from_totals(total_edited, total_raw)
         
         category_text = format_aggregated_output(category_aggregated, folder_names, group_structure, all_analyses, category_hit_rate, individual_hit_rates)
         
         # Save category aggregation
         category_agg_path = os.path.join("metadata_analysis", category_clean, f"aggregated_{category_clean}_ALL.txt")
-        with open(category_agg_path, 'w', encoding='utf-8') as f:
-            f.write(category_text)
+        write_text_file(category_agg_path, category_text)
         print(f"Saved category aggregation: {category_agg_path}\n")
     
     # Display summary
@@ -812,6 +1070,16 @@ def batch_crawl_mode():
 # MAIN WORKFLOW
 # ============================================================================
 
+# Folder names too generic to identify a shoot on their own, and parent
+# folders that should not be used to qualify them.
+_GENERIC_DIRS = frozenset({'edited', 'photos', 'raw', 'jpg', 'jpeg', 'images', 'rd1', 'rd2', 'rd3'})
+_EXCLUDE_PARENTS = frozenset({'concerts', 'photos & videos', 'photos', 'videos', 'edited', 'raw'})
+
+
+# (folder_path, display_name, future) -> display_name
+_display_name_of = itemgetter(1)
+
+
 def main():
     """Main workflow: select folders, extract metadata, analyze, and aggregate."""
     
@@ -830,20 +1098,27 @@ def main():
         print("No category name provided. Exiting.")
         return
     
-    category_clean = category_name.replace(' ', '_').replace('-', '_').lower()
+    category_clean = _clean_name(category_name)
     print(f"\nAnalysis Category: {category_name}\n")
     
-    # Setup output directories
-    os.makedirs("metadata_json", exist_ok=True)
-    os.makedirs("metadata_analysis", exist_ok=True)
-    os.makedirs(os.path.join("metadata_json", category_clean), exist_ok=True)
-    os.makedirs(os.path.join("metadata_analysis", category_clean), exist_ok=True)
+    # Raw per-folder JSON is only needed for later inspection; aggregation
+    # works from the in-memory metadata, so let the user skip writing it.
+    save_json_answer = simpledialog.askstring(
+        "Save JSON?",
+        "Save per-folder raw metadata JSON? (yes/no, default yes):"
+    )
+    save_json = (save_json_answer or 'yes').strip().lower() in ['yes', 'y']
     
     # Select folders and assign group names
     print("Select folders one at a time. After each selection, assign a group name.")
     print("Use the same group name to aggregate multiple shoots together.\n")
     
-    folder_data = []  # List of (folder_path, group_name, display_name)
+    folder_data = []  # List of (folder_path, group_name, display_name, future)
+    
+    # Each folder starts extracting in a worker process as soon as it has a
+    # group name, so processing overlaps with the remaining selections.
+    # (Worker processes are only started on the first submit.)
+    executor = ProcessPoolExecutor(max_workers=os.cpu_count())
     
     while True:
         folder = filedialog.askdirectory(title="Select a folder to analyze (Cancel when done)")
@@ -861,29 +1136,24 @@ def main():
             continue
         
         # Create display name for this specific folder
-        current_folder = os.path.basename(folder)
-        if current_folder.lower() in ['edited', 'photos', 'raw', 'jpg', 'jpeg', 'images', 'rd1', 'rd2', 'rd3']:
-            path_parts = []
-            temp_path = folder
-            for _ in range(3):
-                parent = os.path.dirname(temp_path)
-                if parent == temp_path:
+        # (qualify generic names with the nearest meaningful parent folder,
+        # looking at most three levels up)
+        folder_path = Path(folder)
+        parts = folder_path.parts
+        current_folder = parts[-1]
+        display_name = current_folder
+        if current_folder.lower() in _GENERIC_DIRS:
+            for parent_name in reversed(parts[-4:-1]):
+                if parent_name != folder_path.anchor and parent_name.lower() not in _EXCLUDE_PARENTS:
+                    display_name = f"{parent_name}_{current_folder}"
                     break
-                parent_name = os.path.basename(parent)
-                if parent_name.lower() not in ['concerts', 'photos & videos', 'photos', 'videos', 'edited', 'raw']:
-                    path_parts.insert(0, parent_name)
-                temp_path = parent
-                if len(path_parts) >= 1:
-                    break
-            path_parts.append(current_folder)
-            display_name = '_'.join(path_parts)
-        else:
-            display_name = current_folder
         
-        folder_data.append((folder, group_name.strip(), display_name))
+        future = executor.submit(_process_one_folder, folder, display_name)
+        folder_data.append((folder, group_name.strip(), display_name, future))
         print(f"Added: {folder} -> Group: {group_name}")
     
     if not folder_data:
+        executor.shutdown()
         print("\nNo folders selected. Exiting.")
         return
     
@@ -891,99 +1161,102 @@ def main():
     
     # Group folders by group_name
     groups = defaultdict(list)
-    for folder_path, group_name, display_name in folder_data:
-        groups[group_name].append((folder_path, display_name))
+    for folder_path, group_name, display_name, future in folder_data:
+        groups[group_name].append((folder_path, display_name, future))
+    
+    # Display names per group, shared by the group and category aggregations
+    group_structure = {group_name: list(map(_display_name_of, folder_list))
+                       for group_name, folder_list in groups.items()}
+    
+    # Setup output directories in one pass; only the group (leaf) directories
+    # are needed since makedirs creates the shared parents along the way
+    output_dirs = set()
+    for group_name in groups:
+        group_clean = _clean_name(group_name)
+        output_dirs.add(os.path.join("metadata_analysis", category_clean, group_clean))
+        if save_json:
+            output_dirs.add(os.path.join("metadata_json", category_clean, group_clean))
+    for output_dir in sorted(output_dirs):
+        os.makedirs(output_dir, exist_ok=True)
     
     # Process each folder and organize by group
     all_group_analyses = {}  # {group_name: [analysis_data, ...]}
+    all_group_aggregates = {}  # {group_name: aggregated} for multi-folder groups
     all_individual_names = []  # Track all folder names for category-level aggregation
     all_individual_hit_rates = {}  # Track hit rates by folder name
+    category_edited_total = category_raw_total = 0
     
-    for group_name, folder_list in groups.items():
-        group_clean = group_name.replace(' ', '_').replace('-', '_').lower()
-        
-        # Create group directories
-        group_json_dir = os.path.join("metadata_json", category_clean, group_clean)
-        group_analysis_dir = os.path.join("metadata_analysis", category_clean, group_clean)
-        os.makedirs(group_json_dir, exist_ok=True)
-        os.makedirs(group_analysis_dir, exist_ok=True)
-        
-        print(f"Processing Group: {group_name} ({len(folder_list)} folder(s))")
-        
-        group_analyses = []
-        group_hit_rates = []  # Track hit rates for this group
-        
-        for folder_path, display_name in folder_list:
-            clean_name = display_name.replace(' ', '_').replace('-', '_').replace('.', '_').lower()
-            
-            print(f"  Processing: {display_name}")
-            
-            # Check if this is an Edited folder and look for RAW folder
-            hit_rate = None
-            if 'edited' in os.path.basename(folder_path).lower():
-                raw_folder = detect_raw_folder(folder_path)
-                if raw_folder:
-                    hit_rate = calculate_hit_rate(folder_path, raw_folder)
-                    if hit_rate:
-                        print(f"    Hit Rate: {hit_rate['edited']}/{hit_rate['raw']} = {hit_rate['percentage']:.1f}%")
-                        group_hit_rates.append(hit_rate)
-                        all_individual_hit_rates[display_name] = hit_rate
-            
-            # Extract metadata
-            metadata_list = process_folder(folder_path)
-            
-            if not metadata_list:
-                print(f"    No images found\n")
-                continue
+    # Extraction, hit-rate detection and analysis ran in worker processes
+    # (submitted above); results are collected here in group/folder order.
+    # Tkinter and all file output stay in this process.
+    with executor:
+        for group_name, folder_list in groups.items():
+            group_clean = _clean_name(group_name)
             
-            print(f"    Found {len(metadata_list)} images")
+            # Group directories (created above)
+            group_json_dir = os.path.join("metadata_json", category_clean, group_clean)
+            group_analysis_dir = os.path.join("metadata_analysis", category_clean, group_clean)
             
-            # Save raw metadata JSON in group folder
-            json_path = os.path.join(group_json_dir, f"metadata_{clean_name}.json")
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(metadata_list, f, indent=4)
-            print(f"    Saved: {json_path}")
+            print(f"Processing Group: {group_name} ({len(folder_list)} folder(s))")
             
-            # Analyze metadata
-            analysis_data = analyze_metadata(metadata_list, display_name)
-            group_analyses.append(analysis_data)
-            all_individual_names.append(display_name)
+            group_analyses = []
+            group_edited_total = group_raw_total = 0  # Hit-rate totals for this group
             
-            # Save individual analysis in group folder
-            analysis_text = format_analysis_output(analysis_data, hit_rate)
-            analysis_path = os.path.join(group_analysis_dir, f"analysis_{clean_name}.txt")
-            with open(analysis_path, 'w', encoding='utf-8') as f:
-                f.write(analysis_text)
-            print(f"    Saved: {analysis_path}\n")
-        
-        # Aggregate within group if multiple folders
-        if len(group_analyses) > 1:
-            print(f"  Aggregating group: {group_name}")
-            group_aggregated = aggregate_analyses(group_analyses)
-            group_folder_names = [name for _, name in folder_list]
-            
-            # Calculate combined hit rate for group if applicable
-            group_hit_rate = None
-            if group_hit_rates:
-                total_edited = sum(hr['edited'] for hr in group_hit_rates)
-                total_raw = sum(hr['raw'] for hr in group_hit_rates)
-                if total_raw > 0:
-                    group_hit_rate = {
-                        'edited': total_edited,
-                        'raw': total_raw,
-                        'percentage': (total_edited / total_raw) * 100
-                    }
+            for folder_path, display_name, future in folder_list:
+                clean_name = _clean_name(display_name, replace_dots=True)
+                
+                print(f"  Processing: {display_name}")
+                
+                _, metadata_list, hit_rate, analysis_data = future.result()
+                
+                if hit_rate:
+                    print(f"    Hit Rate: {hit_rate['edited']}/{hit_rate['raw']} = {hit_rate['percentage']:.1f}%")
+                    group_edited_total += hit_rate['edited']
+                    group_raw_total += hit_rate['raw']
+                    all_individual_hit_rates[display_name] = hit_rate
+                
+                if not metadata_list:
+                    print(f"    No images found\n")
+                    continue
+                
+                print(f"    Found {len(metadata_list)} images")
+                
+                # Save raw metadata JSON in group folder
+                if save_json:
+                    json_path = os.path.join(group_json_dir, f"metadata_{clean_name}.json")
+                    save_metadata_json(json_path, metadata_list)
+                    print(f"    Saved: {json_path}")
+                
+                group_analyses.append(analysis_data)
+                all_individual_names.append(display_name)
+                
+                # Save individual analysis in group folder
+                analysis_text = format_analysis_output(analysis_data, hit_rate)
+                analysis_path = os.path.join(group_analysis_dir, f"analysis_{clean_name}.txt")
+                write_text_file(analysis_path, analysis_text)
+                print(f"    Saved: {analysis_path}\n")
             
-            group_text = format_aggregated_output(group_aggregated, group_folder_names, None, group_analyses, group_hit_rate)
+            # Aggregate within group if multiple folders
+            if len(group_analyses) > 1:
+                print(f"  Aggregating group: {group_name}")
+                group_aggregated = aggregate_analyses(group_analyses)
+                all_group_aggregates[group_name] = group_aggregated
+                group_folder_names = group_structure[group_name]
+                
+                # Calculate combined hit rate for group if applicable
+                group_hit_rate = hit_rate_from_totals(group_edited_total, group_raw_total)
+                
+                group_text = format_aggregated_output(group_aggregated, group_folder_names, None, group_analyses, group_hit_rate)
+                
+                # Save group aggregation in the group folder
+                group_agg_path = os.path.join(group_analysis_dir, f"aggregated_{group_clean}.txt")
+                write_text_file(group_agg_path, group_text)
+                print(f"  Saved group aggregation: {group_agg_path}\n")
             
-            # Save group aggregation in the group folder
-            group_agg_path = os.path.join(group_analysis_dir, f"aggregated_{group_clean}.txt")
-            with open(group_agg_path, 'w', encoding='utf-8') as f:
-                f.write(group_text)
-            print(f"  Saved group aggregation: {group_agg_path}\n")
+            all_group_analyses[group_name] = group_analyses
+            category_edited_total += group_edited_total
+            category_raw_total += group_raw_total
         
-        all_group_analyses[group_name] = group_analyses
-    
     # Create category-level aggregation (all groups combined)
     all_analyses = []
     for group_analyses in all_group_analyses.values():
@@ -991,31 +1264,21 @@ def main():
     
     if len(all_analyses) > 1:
         print(f"Creating category-level aggregation: {category_name}")
-        category_aggregated = aggregate_analyses(all_analyses)
-        
-        # Build group structure for hierarchical display
-        group_structure = {}
-        for group_name, folder_list in groups.items():
-            group_structure[group_name] = [name for _, name in folder_list]
+        if len(all_group_analyses) == 1:
+            # A single group covers every folder, so its aggregation (built
+            # above) is already the category aggregation
+            category_aggregated = next(iter(all_group_aggregates.values()))
+        else:
+            category_aggregated = aggregate_analyses(all_analyses)
         
         # Calculate combined hit rate for category if applicable
-        category_hit_rate = None
-        if all_individual_hit_rates:
-            total_edited = sum(hr['edited'] for hr in all_individual_hit_rates.values())
-            total_raw = sum(hr['raw'] for hr in all_individual_hit_rates.values())
-            if total_raw > 0:
-                category_hit_rate = {
-                    'edited': total_edited,
-                    'raw': total_raw,
-                    'percentage': (total_edited / total_raw) * 100
-                }
+        category_hit_rate = hit_rate_from_totals(category_edited_total, category_raw_total)
         
         category_text = format_aggregated_output(category_aggregated, all_individual_names, group_structure, all_analyses, category_hit_rate, all_individual_hit_rates)
         
         # Save category aggregation in the category folder root
         category_agg_path = os.path.join("metadata_analysis", category_clean, f"aggregated_{category_clean}_ALL.txt")
-        with open(category_agg_path, 'w', encoding='utf-8') as f:
-            f.write(category_text)
+        write_text_file(category_agg_path, category_text)
         print(f"Saved category aggregation: {category_agg_path}\n")
     
     # Display summary
@@ -1042,6 +1305,23 @@ def main():
 # COMBINE EXISTING ANALYSES MODE
 # ============================================================================
 
+# Patterns for reading back the "DETAILED BREAKDOWN BY LENS" part of a report
+_LENS_HEADER_RE = re.compile(r'-{20,}\s*\nLens: (.+?) \(Used (\d+) times\)')
+_SECTION_RE = re.compile(r'^(Shutter Speeds|Apertures|ISOs|Exposure Programs|Flash Modes):[ \t]*$', re.MULTILINE)
+_ROW_RE = re.compile(r'^[ \t]+(?:f/|ISO )?(.+?):[ \t]+(\d+)[ \t]+times', re.MULTILINE)
+
+# Section header -> (lens_data key, value converter). Aperture and ISO keys are
+# kept numeric so they merge with aggregate_analyses output and sort by value
+# in format_aggregated_output; counts are always ints (Counter).
+_SECTION_FIELDS = {
+    'Shutter Speeds': ('shutter_speeds', str),
+    'Apertures': ('apertures', float),
+    'ISOs': ('isos', int),
+    'Exposure Programs': ('exposure_programs', str),
+    'Flash Modes': ('flash_modes', str),
+}
+
+
 def parse_analysis_file(filepath):
     """Parse an existing analysis text file and extract lens breakdown data."""
     with open(filepath, 'r', encoding='utf-8') as f:
@@ -1056,7 +1336,7 @@ def parse_analysis_file(filepath):
         content = content.split("Detailed Breakdowns by Lens:")[1]
     
     # Split by lens headers (lines with dashes followed by "Lens:")
-    lens_sections = re.split(r'-{20,}\s*\nLens: (.+?) \(Used (\d+) times\)', content)
+    lens_sections = _LENS_HEADER_RE.split(content)
     
     # Process each lens section
     for i in range(1, len(lens_sections), 3):
@@ -1076,56 +1356,56 @@ def parse_analysis_file(filepath):
             'flash_modes': Counter()
         }
         
-        # Parse shutter speeds
-        shutter_match = re.search(r'Shutter Speeds:(.*?)(?=Apertures:|$)', lens_content, re.DOTALL)
-        if shutter_match:
-            for line in shutter_match.group(1).strip().split('\n'):
-                match = re.match(r'\s+(.+?):\s+(\d+)\s+times', line)
-                if match:
-                    speed, count = match.groups()
-                    lens_data['shutter_speeds'][speed] += int(count)
-        
-        # Parse apertures
-        aperture_match = re.search(r'Apertures:(.*?)(?=ISOs:|$)', lens_content, re.DOTALL)
-        if aperture_match:
-            for line in aperture_match.group(1).strip().split('\n'):
-                match = re.match(r'\s+f/(.+?):\s+(\d+)\s+times', line)
-                if match:
-                    aperture, count = match.groups()
-                    lens_data['apertures'][float(aperture)] += int(count)
-        
-        # Parse ISOs
-        iso_match = re.search(r'ISOs:(.*?)(?=Exposure Programs:|$)', lens_content, re.DOTALL)
-        if iso_match:
-            for line in iso_match.group(1).strip().split('\n'):
-                match = re.match(r'\s+ISO (.+?):\s+(\d+)\s+times', line)
-                if match:
-                    iso, count = match.groups()
-                    lens_data['isos'][int(iso)] += int(count)
-        
-        # Parse exposure programs
-        program_match = re.search(r'Exposure Programs:(.*?)(?=Flash Modes:|$)', lens_content, re.DOTALL)
-        if program_match:
-            for line in program_match.group(1).strip().split('\n'):
-                match = re.match(r'\s+(.+?):\s+(\d+)\s+times', line)
-                if match:
-                    program, count = match.groups()
-                    lens_data['exposure_programs'][program] += int(count)
-        
-        # Parse flash modes
-        flash_match = re.search(r'Flash Modes:(.*?)$', lens_content, re.DOTALL)
-        if flash_match:
-            for line in flash_match.group(1).strip().split('\n'):
-                match = re.match(r'\s+(.+?):\s+(\d+)\s+times', line)
-                if match:
-                    mode, count = match.groups()
-                    lens_data['flash_modes'][mode] += int(count)
+        # Each section runs from its header to the next header (or the end of
+        # the lens block); rows are scanned only within that span
+        headers = list(_SECTION_RE.finditer(lens_content))
+        for h, header in enumerate(headers):
+            field, convert = _SECTION_FIELDS[header.group(1)]
+            end = headers[h + 1].start() if h + 1 < len(headers) else len(lens_content)
+            counter = lens_data[field]
+            for row in _ROW_RE.finditer(lens_content, header.end(), end):
+                counter[convert(row.group(1))] += int(row.group(2))
         
         lens_breakdowns[lens_name] = lens_data
     
     return lens_breakdowns
 
 
+# Parsed analysis files, keyed by path + mtime + size so edits invalidate them
+_ANALYSIS_CACHE_DIR = os.path.join("metadata_analysis", ".cache")
+
+# Part of the cache key; bump whenever parse_analysis_file's output changes so
+# results from an older parser are not served
+_PARSE_CACHE_VERSION = 2
+
+
+def parse_analysis_file_cached(filepath):
+    """parse_analysis_file with an on-disk cache of the parsed lens breakdowns."""
+    stat = os.stat(filepath)
+    key = hashlib.sha1(
+        f"{_PARSE_CACHE_VERSION}:{os.path.abspath(filepath)}:{stat.st_mtime_ns}:{stat.st_size}".encode()
+    ).hexdigest()
+    cache_path = os.path.join(_ANALYSIS_CACHE_DIR, f"{key}.pkl")
+    
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+    
+    lens_breakdowns = parse_analysis_file(filepath)
+    
+    # A failed cache write only costs a re-parse next time
+    try:
+        os.makedirs(_ANALYSIS_CACHE_DIR, exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            pickle.dump(lens_breakdowns, f)
+    except OSError:
+        pass
+    
+    return lens_breakdowns
+
+
 def combine_existing_analyses():
     """Combine multiple existing analysis text files into one aggregated analysis."""
     
@@ -1143,7 +1423,7 @@ def combine_existing_analyses():
         print("No output name provided. Exiting.")
         return
     
-    output_clean = output_name.replace(' ', '_').replace('-', '_').lower()
+    output_clean = _clean_name(output_name)
     
     # Select analysis files to combine - keep selecting until cancel
     print("\nSelect analysis files to combine. Click Cancel when done.\n")
@@ -1168,50 +1448,39 @@ def combine_existing_analyses():
     print(f"\n{len(filepaths)} file(s) selected. Processing...\n")
     
     # Parse all selected files and aggregate
-    aggregated = {
-        'lenses': defaultdict(lambda: {
-            'count': 0,
-            'shutter_speeds': defaultdict(int),
-            'apertures': defaultdict(float),
-            'isos': defaultdict(int),
-            'exposure_programs': defaultdict(int),
-            'flash_modes': defaultdict(int)
-        })
-    }
+    aggregated = {'lenses': defaultdict(LensAgg)}
     
     file_names = []
     
-    for filepath in filepaths:
-        filename = os.path.basename(filepath)
-        file_names.append(filename.replace('.txt', '').replace('aggregated_', '').replace('analysis_', ''))
-        print(f"  Processing: {filename}")
+    # Parse files concurrently (reading is I/O bound); merging stays serial
+    # in the main thread so results are combined in selection order.
+    with ThreadPoolExecutor(max_workers=min(32, len(filepaths))) as executor:
+        parse_futures = {}
+        for filepath in filepaths:
+            if filepath not in parse_futures:
+                parse_futures[filepath] = executor.submit(parse_analysis_file_cached, filepath)
         
-        try:
-            lens_data = parse_analysis_file(filepath)
+        for filepath in filepaths:
+            filename = os.path.basename(filepath)
+            file_names.append(filename.replace('.txt', '').replace('aggregated_', '').replace('analysis_', ''))
+            print(f"  Processing: {filename}")
             
-            # Merge into aggregated data
-            for lens_name, data in lens_data.items():
-                agg_lens = aggregated['lenses'][lens_name]
-                agg_lens['count'] += data['count']
-                
-                for speed, count in data['shutter_speeds'].items():
-                    agg_lens['shutter_speeds'][speed] += count
-                
-                for aperture, count in data['apertures'].items():
-                    agg_lens['apertures'][aperture] += count
-                
-                for iso, count in data['isos'].items():
-                    agg_lens['isos'][iso] += count
-                
-                for program, count in data['exposure_programs'].items():
-                    agg_lens['exposure_programs'][program] += count
+            try:
+                lens_data = parse_futures[filepath].result()
                 
-                for mode, count in data['flash_modes'].items():
-                    agg_lens['flash_modes'][mode] += count
-        
-        except Exception as e:
-            print(f"    Error parsing {filename}: {e}")
-            continue
+                # Merge into aggregated data
+                for lens_name, data in lens_data.items():
+                    agg_lens = aggregated['lenses'][lens_name]
+                    agg_lens.count += data['count']
+                    agg_lens.shutter_speeds.update(data['shutter_speeds'])
+                    agg_lens.apertures.update(data['apertures'])
+                    agg_lens.isos.update(data['isos'])
+                    agg_lens.exposure_programs.update(data['exposure_programs'])
+                    agg_lens.flash_modes.update(data['flash_modes'])
+            
+            except Exception as e:
+                print(f"    Error parsing {filename}: {e}")
+                continue
     
     if not aggregated['lenses']:
         print("\nNo data was successfully parsed. Exiting.")
@@ -1227,8 +1496,7 @@ def combine_existing_analyses():
     os.makedirs(output_dir, exist_ok=True)
     output_path = os.path.join(output_dir, f"combined_{output_clean}.txt")
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(combined_text)
+    write_text_file(output_path, combined_text)
     
     print(f"\nCombined analysis saved to: {output_path}")
     print(f"Total source files: {len(filepaths)}")
@@ -1284,8 +1552,8 @@ def quick_single_folder_mode():
         print("\nNo group provided. Exiting.")
         return
     
-    category_clean = category_name.replace(' ', '_').replace('-', '_').lower()
-    analysis_clean = analysis_name.replace(' ', '_').replace('-', '_').lower()
+    category_clean = _clean_name(category_name)
+    analysis_clean = _clean_name(analysis_name)
     
     # Create category directories
     category_json_dir = os.path.join("metadata_json", category_clean)
@@ -1312,12 +1580,10 @@ def quick_single_folder_mode():
         return
     
     print(f"  Found {len(metadata_list)} images")
-    print(f"  Found {len(metadata_list)} images")
     
     # Save raw metadata JSON
     json_path = os.path.join(category_json_dir, f"metadata_{analysis_clean}.json")
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(metadata_list, f, indent=4)
+    save_metadata_json(json_path, metadata_list)
     print(f"  Saved: {json_path}")
     
     # Analyze metadata
@@ -1326,8 +1592,7 @@ def quick_single_folder_mode():
     # Save individual analysis
     analysis_text = format_analysis_output(analysis_data, hit_rate)
     analysis_path = os.path.join(category_analysis_dir, f"analysis_{analysis_clean}.txt")
-    with open(analysis_path, 'w', encoding='utf-8') as f:
-        f.write(analysis_text)
+    write_text_file(analysis_path, analysis_text)
     print(f"  Saved: {analysis_path}")
     
     print("\n" + "=" * 50)
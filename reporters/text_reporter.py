@@ -7,8 +7,10 @@ with existing report format.
 
 import os
 import logging
-from typing import Optional
+from typing import Optional, List, Tuple, Iterable, Iterator
 from fractions import Fraction
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -16,6 +18,37 @@ from models import Analysis
 
 logger = logging.getLogger(__name__)
 
+# Section rules used throughout the report layout
+_RULE = "=" * 80
+_SUBRULE = "-" * 80
+
+# One distribution row: prefix, value, count, percentage
+_ROW_FORMAT = "  %s%s: %d times (%.1f%%)"
+
+# Reports are streamed to disk in batches of roughly this many characters
+_WRITE_BATCH_SIZE = 1 << 16
+
+
+def _write_text(fd: int, text: str):
+    """Write text to a raw file descriptor as UTF-8 with platform newlines."""
+    if os.linesep != '\n':
+        text = text.replace('\n', os.linesep)
+    data = memoryview(text.encode('utf-8'))
+    # os.write may write less than requested; loop until done
+    while data:
+        written = os.write(fd, data)
+        data = data[written:]
+
+
+def _lens_rows(lenses: List[Tuple[str, int]]) -> str:
+    """Format (lens, count) pairs as one block of lens list rows."""
+    return "\n".join(["    - %s: %s photos" % pair for pair in lenses])
+
+
+def _render_report_chunks(analysis: Analysis) -> List[str]:
+    """Render an analysis into report chunks (module-level so worker processes can run it)."""
+    return list(TextReporter()._iter_report_chunks(analysis))
+
 
 class TextReporter:
     """
@@ -32,6 +65,9 @@ class TextReporter:
         >>> report_path = reporter.generate_report(analysis, 'running_sole/weekly')
     """
     
+    # Distribution block layout, built once per process by _distributions()
+    _DISTRIBUTIONS = None
+    
     def __init__(self, output_directory: str = 'metadata_analysis'):
         """
         Initialize text reporter.
@@ -40,6 +76,8 @@ class TextReporter:
             output_directory: Base directory for saving reports
         """
         self.output_directory = output_directory
+        # Directories this reporter has already created (skips repeat makedirs)
+        self._created_dirs = set()
     
     @classmethod
     def from_config(cls, config_path: str = 'config.yaml') -> 'TextReporter':
@@ -53,8 +91,13 @@ class TextReporter:
         return cls(output_directory=output_dir)
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _parse_shutter_speed(speed_str: str) -> Optional[float]:
-        """Parse shutter speed string into float for sorting."""
+        """Parse shutter speed string into float for sorting.
+        
+        Results are memoized since the same few speed strings recur in every
+        lens breakdown and report.
+        """
         if not speed_str or speed_str == "":
             return None
         try:
@@ -87,30 +130,218 @@ class TextReporter:
             ...     filename='aggregated_running_sole_ALL.txt'
             ... )
         """
-        # Format the report text
-        report_text = self._format_analysis(analysis)
-        
         # Determine output path
+        output_path = self._report_path(analysis, subdirectory, filename)
+        self._ensure_directory(os.path.dirname(output_path))
+        
+        # Format and write the report section by section
+        self._write_report(output_path, self._iter_report_chunks(analysis))
+        
+        logger.info("Generated text report: %s", output_path)
+        return output_path
+    
+    def generate_reports(self, items: List[Tuple[Analysis, Optional[str], Optional[str]]],
+                         max_workers: int = 4,
+                         render_processes: int = 0) -> List[str]:
+        """
+        Generate several text reports in one pass.
+        
+        Each output directory is created once, and the formatted reports are
+        written concurrently on a small thread pool (file writes release the GIL).
+        Formatting is pure Python, so for large batches it can optionally be
+        spread over worker processes as well.
+        
+        Args:
+            items: (analysis, subdirectory, filename) tuples, as for generate_report
+            max_workers: Maximum number of concurrent file writes
+            render_processes: Number of worker processes to format reports in
+                (0 formats them in this process, which is faster for a handful
+                of reports since analyses must be pickled to the workers)
+        
+        Returns:
+            Paths to the generated report files, in the order given. Items
+            that resolve to the same path are written once, with the last
+            such item's report.
+        
+        Example:
+            >>> paths = reporter.generate_reports([
+            ...     (analysis, 'running_sole', 'aggregated_running_sole_ALL.txt'),
+            ...     (other_analysis, 'portraits', None),
+            ... ])
+        """
+        if not items:
+            return []
+        
+        output_paths = [self._report_path(analysis, subdirectory, filename)
+                        for analysis, subdirectory, filename in items]
+        
+        # One report per distinct path (last item wins), so no two threads
+        # ever write the same file at once
+        reports = {}
+        for output_path, (analysis, _, _) in zip(output_paths, items):
+            reports[output_path] = analysis
+        unique_paths = list(reports)
+        
+        for output_dir in {os.path.dirname(path) for path in unique_paths}:
+            self._ensure_directory(output_dir)
+        
+        analyses = list(reports.values())
+        if render_processes > 1 and len(analyses) > 1:
+            workers = min(render_processes, len(analyses), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                report_chunks = list(executor.map(_render_report_chunks, analyses))
+        else:
+            report_chunks = [self._iter_report_chunks(analysis) for analysis in analyses]
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_paths))) as executor:
+            # list() surfaces the first write error, if any
+            list(executor.map(self._write_report, unique_paths, report_chunks))
+        
+        # Skip the per-report logging calls entirely when INFO is disabled
+        if logger.isEnabledFor(logging.INFO):
+            log_info = logger.info
+            for output_path in unique_paths:
+                log_info("Generated text report: %s", output_path)
+        return output_paths
+    
+    def _report_path(self, analysis: Analysis, subdirectory: Optional[str],
+                     filename: Optional[str]) -> str:
+        """Build the output path for a report (see generate_report)."""
         if subdirectory:
             output_dir = os.path.join(self.output_directory, subdirectory)
         else:
             output_dir = self.output_directory
         
-        os.makedirs(output_dir, exist_ok=True)
-        
         if not filename:
             # Sanitize analysis name for filename
             safe_name = analysis.name.replace(' ', '_').replace('/', '_')
             filename = f"analysis_{safe_name}.txt"
         
-        output_path = os.path.join(output_dir, filename)
+        return os.path.join(output_dir, filename)
+    
+    def _ensure_directory(self, output_dir: str):
+        """Create an output directory unless this reporter already made it."""
+        if output_dir not in self._created_dirs:
+            os.makedirs(output_dir, exist_ok=True)
+            self._created_dirs.add(output_dir)
+    
+    @staticmethod
+    def _write_report(output_path: str, chunks: Iterable[str]):
+        """
+        Stream report chunks to disk as UTF-8, separated by newlines.
+        
+        Chunks are encoded and written in batches with os.write, so the whole
+        report never has to be held in memory at once and the text-mode file
+        layers are bypassed. Newlines are translated to os.linesep exactly as
+        a text-mode file would.
+        """
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+        fd = os.open(output_path, flags, 0o666)
+        try:
+            pending = []
+            pending_size = 0
+            separator = ""  # every chunk but the first starts on a new line
+            for chunk in chunks:
+                pending.append(separator)
+                pending.append(chunk)
+                separator = "\n"
+                pending_size += len(chunk) + 1
+                if pending_size >= _WRITE_BATCH_SIZE:
+                    _write_text(fd, "".join(pending))
+                    pending = []
+                    pending_size = 0
+            if pending:
+                _write_text(fd, "".join(pending))
+        finally:
+            os.close(fd)
+    
+    @staticmethod
+    def _numeric_sort_key(value) -> float:
+        """
+        Sort key for apertures and ISOs: numeric values first, ascending.
+        
+        Values may be numbers or numeric strings (counters loaded from JSON
+        or the database have string keys); anything else sorts last.
+        """
+        if not value:
+            return float('inf')
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return float('inf')
+    
+    @classmethod
+    def _shutter_sort_key(cls, speed) -> float:
+        """Sort key for shutter speeds: fastest to slowest."""
+        return cls._parse_shutter_speed(speed) or 0
+    
+    @staticmethod
+    def _distribution_block(title: str, freq: dict, denominator: int,
+                            sort_key=None, prefix: str = '', skip_falsy: bool = True) -> Optional[str]:
+        """
+        Format one frequency distribution block of the report.
         
-        # Write report
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(report_text)
+        Shared by the overall metrics and every lens breakdown so both use the
+        same row layout.
         
-        logger.info(f"Generated text report: {output_path}")
-        return output_path
+        Args:
+            title: Block heading
+            freq: Mapping of value -> count
+            denominator: Count that percentages are relative to
+            sort_key: Optional key function applied to each value for ordering
+            prefix: Text placed before each value (e.g. 'f/' or 'ISO ')
+            skip_falsy: Skip falsy values if True, otherwise only empty strings
+        
+        Returns:
+            The block text (heading and rows), or None if freq is empty
+        """
+        if not freq:
+            return None
+        
+        if sort_key is None:
+            items = freq.items()
+        else:
+            # Decorate-sort-undecorate: compute each key once and let the sort
+            # compare plain tuples; the index keeps ties in insertion order
+            decorated = [(sort_key(value), i, value, count)
+                         for i, (value, count) in enumerate(freq.items())]
+            decorated.sort()
+            items = [entry[2:] for entry in decorated]
+        
+        # Join the rows here and add the block as a single chunk. Percentages
+        # keep the count / denominator * 100 order: multiplying by a
+        # precomputed 100 / denominator rounds exact halves differently
+        # (15 of 48 would print 31.3% instead of 31.2%)
+        rows = "\n".join(
+            _ROW_FORMAT % (prefix, value, count, count / denominator * 100)
+            for value, count in items
+            if (value if skip_falsy else value != "")
+        )
+        return f"{title}\n{rows}" if rows else title
+    
+    @classmethod
+    def _distributions(cls) -> tuple:
+        """
+        Get the distribution block layout shared by every report.
+        
+        Returns:
+            Tuple of (overall title, lens title, Analysis attribute,
+            lens breakdown key, sort key, value prefix, skip_falsy) entries
+        """
+        if cls._DISTRIBUTIONS is None:
+            cls._DISTRIBUTIONS = (
+                ("\nOverall Shutter Speed Distribution:", "Shutter Speeds:",
+                 'shutter_speed_freq', 'ShutterSpeed', cls._shutter_sort_key, '', True),
+                ("\nOverall Aperture Distribution:", "Apertures:",
+                 'aperture_freq', 'Aperture', cls._numeric_sort_key, 'f/', False),
+                ("\nOverall ISO Distribution:", "ISOs:",
+                 'iso_freq', 'ISO', cls._numeric_sort_key, 'ISO ', False),
+                ("\nOverall Exposure Program Distribution:", "Exposure Programs:",
+                 'exposure_program_freq', 'ExposureProgram', None, '', True),
+                ("\nOverall Flash Mode Distribution:", "Flash Modes:",
+                 'flash_mode_freq', 'FlashMode', None, '', True),
+            )
+        return cls._DISTRIBUTIONS
     
     def _format_analysis(self, analysis: Analysis) -> str:
         """
@@ -122,145 +353,98 @@ class TextReporter:
         Returns:
             Formatted text report
         """
-        lines = []
+        return "\n".join(self._iter_report_chunks(analysis))
+    
+    def _iter_report_chunks(self, analysis: Analysis) -> Iterator[str]:
+        """
+        Yield the text report for an analysis chunk by chunk.
+        
+        Chunks are joined with newlines to form the report (see
+        _format_analysis); generate_report streams them straight to disk.
+        
+        Args:
+            analysis: Analysis instance
+        
+        Yields:
+            Report lines or whole blocks, in order
+        """
+        distribution_block = self._distribution_block
+        
+        # Bind the analysis fields used below once
         total = analysis.total_photos
+        total_raw = analysis.total_raw_photos
+        hit_rate = analysis.hit_rate
+        metadata = analysis.metadata
+        lens_breakdowns = analysis.lens_breakdowns
         
         # Header
-        lines.append(f"Analysis: {analysis.name}")
-        lines.append("=" * 80)
+        yield f"Analysis: {analysis.name}"
+        yield _RULE
         
         # Category and Group info if available
-        if 'category' in analysis.metadata:
-            lines.append(f"Category: {analysis.metadata['category']}")
-        if 'group' in analysis.metadata:
-            lines.append(f"Group: {analysis.metadata['group']}")
+        if 'category' in metadata:
+            yield f"Category: {metadata['category']}"
+        if 'group' in metadata:
+            yield f"Group: {metadata['group']}"
         
-        lines.append(f"\nTotal photos analyzed: {total}")
-        lines.append("\n" + "=" * 80)
+        yield f"\nTotal photos analyzed: {total}"
+        yield "\n" + _RULE
         
-        # Calculate prime vs zoom
+        # Prime vs zoom
         prime_count = analysis.prime_count
         zoom_count = analysis.zoom_count
         
-        prime_lenses = []
-        zoom_lenses = []
-        
-        for lens, count in analysis.lens_freq.items():
-            if '-' in lens and 'mm' in lens:
-                zoom_lenses.append((lens, count))
-            else:
-                prime_lenses.append((lens, count))
-        
         # Overall metrics
-        lines.append("\nOVERALL METRICS")
-        lines.append("-" * 80)
+        yield "\nOVERALL METRICS"
+        yield _SUBRULE
         
         # Hit rate section - always show, even if unable to calculate
-        if analysis.hit_rate is not None and analysis.total_raw_photos > 0:
-            edited_photos = analysis.total_photos
-            raw_photos = analysis.total_raw_photos
-            lines.append(f"\nHit Rate: {analysis.hit_rate:.2f}%")
-            lines.append(f"  Total: {edited_photos}")
-            lines.append(f"  RAW: {raw_photos}")
-            lines.append(f"  Edited: {edited_photos}")
+        if hit_rate is not None and total_raw > 0:
+            yield f"\nHit Rate: {hit_rate:.2f}%"
+            yield f"  Total: {total}"
+            yield f"  RAW: {total_raw}"
+            yield f"  Edited: {total}"
         else:
-            lines.append(f"\nHit Rate: Unable to calculate")
-            lines.append(f"  Total: {analysis.total_photos}")
-            lines.append(f"  RAW: N/A")
-            lines.append(f"  Edited: {analysis.total_photos}")
+            yield f"\nHit Rate: Unable to calculate"
+            yield f"  Total: {total}"
+            yield f"  RAW: N/A"
+            yield f"  Edited: {total}"
         
         if prime_count or zoom_count:
-            lines.append(f"\nLens Type Distribution:")
+            prime_lenses, zoom_lenses = analysis.lenses_by_type()
+            yield f"\nLens Type Distribution:"
             if prime_count > 0:
-                lines.append(f"  Prime Lenses: {prime_count} photos ({prime_count/total*100:.1f}%)")
-                for lens, count in sorted(prime_lenses, key=lambda x: x[1], reverse=True):
-                    lines.append(f"    - {lens}: {count} photos")
+                yield f"  Prime Lenses: {prime_count} photos ({prime_count/total*100:.1f}%)"
+                if prime_lenses:
+                    yield _lens_rows(prime_lenses)
             if zoom_count > 0:
-                lines.append(f"  Zoom Lenses: {zoom_count} photos ({zoom_count/total*100:.1f}%)")
-                for lens, count in sorted(zoom_lenses, key=lambda x: x[1], reverse=True):
-                    lines.append(f"    - {lens}: {count} photos")
-        
-        # Shutter Speeds
-        if analysis.shutter_speed_freq:
-            lines.append(f"\nOverall Shutter Speed Distribution:")
-            for speed, count in sorted(analysis.shutter_speed_freq.items(),
-                                      key=lambda x: self._parse_shutter_speed(x[0]) or 0):
-                if speed:
-                    lines.append(f"  {speed}: {count} times ({count / total * 100:.1f}%)")
-        
-        # Apertures
-        if analysis.aperture_freq:
-            lines.append(f"\nOverall Aperture Distribution:")
-            for aperture, count in sorted(analysis.aperture_freq.items(),
-                                         key=lambda x: float(x[0]) if x[0] and isinstance(x[0], (int, float)) else float('inf')):
-                if aperture != "":
-                    lines.append(f"  f/{aperture}: {count} times ({count / total * 100:.1f}%)")
-        
-        # ISOs
-        if analysis.iso_freq:
-            lines.append(f"\nOverall ISO Distribution:")
-            for iso, count in sorted(analysis.iso_freq.items(),
-                                    key=lambda x: int(x[0]) if x[0] and isinstance(x[0], (int, float)) else float('inf')):
-                if iso != "":
-                    lines.append(f"  ISO {iso}: {count} times ({count / total * 100:.1f}%)")
-        
-        # Exposure Programs
-        if analysis.exposure_program_freq:
-            lines.append(f"\nOverall Exposure Program Distribution:")
-            for program, count in analysis.exposure_program_freq.items():
-                if program:
-                    lines.append(f"  {program}: {count} times ({count / total * 100:.1f}%)")
-        
-        # Flash Modes
-        if analysis.flash_mode_freq:
-            lines.append(f"\nOverall Flash Mode Distribution:")
-            for mode, count in analysis.flash_mode_freq.items():
-                if mode:
-                    lines.append(f"  {mode}: {count} times ({count / total * 100:.1f}%)")
+                yield f"  Zoom Lenses: {zoom_count} photos ({zoom_count/total*100:.1f}%)"
+                if zoom_lenses:
+                    yield _lens_rows(zoom_lenses)
+        
+        distributions = self._distributions()
+        
+        # Overall distributions
+        for title, _, attr, _, sort_key, prefix, skip_falsy in distributions:
+            block = distribution_block(title, getattr(analysis, attr), total,
+                                       sort_key, prefix, skip_falsy)
+            if block is not None:
+                yield block
         
         # Lens breakdowns
-        if analysis.lens_breakdowns:
-            lines.append("\n" + "=" * 80)
-            lines.append("DETAILED BREAKDOWN BY LENS")
-            lines.append("=" * 80)
+        if lens_breakdowns:
+            yield "\n" + _RULE
+            yield "DETAILED BREAKDOWN BY LENS"
+            yield _RULE
             
-            for lens, breakdown in analysis.lens_breakdowns.items():
+            for lens, breakdown in lens_breakdowns.items():
                 lens_count = breakdown['Count']
-                lines.append(f"\n{'-' * 80}")
-                lines.append(f"Lens: {lens} (Used {lens_count} times)")
-                lines.append(f"{'-' * 80}")
+                yield f"\n{_SUBRULE}"
+                yield f"Lens: {lens} (Used {lens_count} times)"
+                yield _SUBRULE
                 
-                if breakdown["ShutterSpeed"]:
-                    lines.append("Shutter Speeds:")
-                    for speed, count in sorted(breakdown["ShutterSpeed"].items(),
-                                              key=lambda x: self._parse_shutter_speed(x[0]) or 0):
-                        if speed:
-                            lines.append(f"  {speed}: {count} times ({count / lens_count * 100:.1f}%)")
-                
-                if breakdown["Aperture"]:
-                    lines.append("Apertures:")
-                    for aperture, count in sorted(breakdown["Aperture"].items(),
-                                                  key=lambda x: float(x[0]) if x[0] and isinstance(x[0], (int, float)) else float('inf')):
-                        if aperture != "":
-                            lines.append(f"  f/{aperture}: {count} times ({count / lens_count * 100:.1f}%)")
-                
-                if breakdown["ISO"]:
-                    lines.append("ISOs:")
-                    for iso, count in sorted(breakdown["ISO"].items(),
-                                            key=lambda x: int(x[0]) if x[0] and isinstance(x[0], (int, float)) else float('inf')):
-                        if iso != "":
-                            lines.append(f"  ISO {iso}: {count} times ({count / lens_count * 100:.1f}%)")
-                
-                if breakdown["ExposureProgram"]:
-                    lines.append("Exposure Programs:")
-                    for program, count in breakdown["ExposureProgram"].items():
-                        if program:
-                            lines.append(f"  {program}: {count} times ({count / lens_count * 100:.1f}%)")
-                
-                if breakdown["FlashMode"]:
-                    lines.append("Flash Modes:")
-                    for mode, count in breakdown["FlashMode"].items():
-                        if mode:
-                            lines.append(f"  {mode}: {count} times ({count / lens_count * 100:.1f}%)")
-        
-        return "\n".join(lines)
+                for _, title, _, key, sort_key, prefix, skip_falsy in distributions:
+                    block = distribution_block(title, breakdown[key], lens_count,
+                                               sort_key, prefix, skip_falsy)
+                    if block is not None:
+                        yield block
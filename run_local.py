@@ -20,21 +20,40 @@ import sys
 import json
 import re
 import logging
+import threading
+import subprocess
+import atexit
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, TYPE_CHECKING
 
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, request, jsonify, send_from_directory, g, Response, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from waitress import serve as waitress_serve
+except ImportError:
+    waitress_serve = None
+
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from extractors import ExifExtractor
 from analyzers import StatisticsAnalyzer
-from reporters import TextReporter
 from database import DatabaseManager
 
+if TYPE_CHECKING:
+    from extractors import ExifExtractor
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -42,15 +61,640 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that uses orjson (when it is installed).
+    
+    Responses are encoded with orjson, honoring sort_keys; values
+    orjson would encode differently (datetimes) or can't encode (Decimal,
+    ...) go through Flask's default conversion. Request bodies read with
+    request.json / get_json() are decoded with orjson too.
+    """
+    
+    @property
+    def options(self) -> int:
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        return options
+    
+    def dumps_bytes(self, obj: Any) -> bytes:
+        """Serialize obj to UTF-8 encoded JSON."""
+        return orjson.dumps(obj, default=self.default, option=self.options)
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            # Explicit json.dumps arguments; let the stdlib encoder honor them
+            return super().dumps(obj, **kwargs)
+        return self.dumps_bytes(obj).decode('utf-8')
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        # orjson.JSONDecodeError subclasses ValueError, which Flask reports
+        # as a 400 Bad Request
+        return orjson.loads(s)
+    
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumps_bytes(obj), mimetype=self.mimetype)
+
+
+class ProgressStore:
+    """
+    Thread-safe task_id -> progress map with bounded size and expiry.
+    
+    Entries expire ttl seconds after their last update, or finished_ttl
+    seconds once the task reports a final status, and the least recently
+    updated entries are dropped beyond maxsize, so a long-running server
+    doesn't accumulate every task it has ever seen. Each entry also keeps
+    its /api/progress response body, encoded once when it is written.
+    """
+    
+    FINISHED_STATUSES = frozenset({'complete', 'failed', 'error'})
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600, finished_ttl: float = 60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.finished_ttl = finished_ttl
+        # task_id -> (progress, expiry time, encoded response), least
+        # recently updated first
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def __setitem__(self, task_id: str, progress: Dict[str, Any]):
+        finished = progress.get('status') in self.FINISHED_STATUSES
+        expires = time.monotonic() + (self.finished_ttl if finished else self.ttl)
+        payload = _progress_payload(progress)
+        with self._lock:
+            self._entries[task_id] = (progress, expires, payload)
+            self._entries.move_to_end(task_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def update(self, task_id: str, progress: int, status: str,
+               total: int = 100, min_step: int = 5):
+        """
+        Record a task's progress, skipping changes too small to show.
+        
+        An update that keeps the status and total and moves progress by less
+        than min_step is dropped, so tight loops can report freely.
+        """
+        current = self.get(task_id)
+        if (current is not None and current['status'] == status
+                and current['total'] == total
+                and abs(progress - current['progress']) < min_step):
+            return
+        self[task_id] = {'progress': progress, 'total': total, 'status': status}
+    
+    def get(self, task_id: str, default: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(task_id)
+            if entry is None:
+                return default
+            if entry[1] <= time.monotonic():
+                del self._entries[task_id]
+                return default
+            return entry[0]
+    
+    def payload(self, task_id: str) -> Optional[bytes]:
+        """
+        Return the encoded progress response for task_id, or None.
+        
+        Entries are replaced rather than mutated, so this reads without
+        taking the lock; expired entries are left for writers to drop.
+        """
+        entry = self._entries.get(task_id)
+        if entry is None or entry[1] <= time.monotonic():
+            return None
+        return entry[2]
+    
+    def __contains__(self, task_id: str) -> bool:
+        return self.get(task_id) is not None
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU map of encoded response bodies.
+    
+    Keys include the database version (see _cache_version), so entries
+    for an older database are never hit and age out of the cache.
+    """
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._bodies = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key) -> Optional[bytes]:
+        with self._lock:
+            body = self._bodies.get(key)
+            if body is not None:
+                self._bodies.move_to_end(key)
+            return body
+    
+    def put(self, key, body: bytes):
+        with self._lock:
+            self._bodies[key] = body
+            self._bodies.move_to_end(key)
+            while len(self._bodies) > self.maxsize:
+                self._bodies.popitem(last=False)
+
+
 # Initialize Flask app
 app = Flask(__name__, static_folder='static', static_url_path='')
+if orjson is not None:
+    app.json = OrjsonJSONProvider(app)
+# Send compact JSON with keys in insertion order, even in debug mode
+app.json.sort_keys = False
+app.json.compact = True
 CORS(app)
 
 # Configuration
 CONFIG_PATH = 'config.yaml'
+IS_WINDOWS = sys.platform.startswith('win')
 
 # Progress tracking for long-running operations
-progress_store = {}
+progress_store = ProgressStore()
+
+# Session listing queries (see list_sessions), selecting just the columns
+# list_sessions unpacks, in order
+_SQL_SESSIONS_SELECT = ("SELECT id, name, category, group_name, total_photos, total_raw_photos, "
+                        "hit_rate, date, description FROM sessions")
+SQL_SESSIONS_ALL = _SQL_SESSIONS_SELECT + " ORDER BY date DESC"
+SQL_SESSIONS_BY_CAT = _SQL_SESSIONS_SELECT + " WHERE category = ? ORDER BY date DESC"
+SQL_SESSIONS_BY_GROUP = _SQL_SESSIONS_SELECT + " WHERE group_name = ? ORDER BY date DESC"
+SQL_SESSIONS_BY_CAT_GROUP = _SQL_SESSIONS_SELECT + " WHERE category = ? AND group_name = ? ORDER BY date DESC"
+
+# Session edit statement (see update_session). The hit rate is derived
+# from the stored total_photos and the new RAW count (bound three times),
+# in the same order of operations as elsewhere.
+SQL_UPDATE_SESSION = """
+    UPDATE sessions 
+    SET name = ?, category = ?, group_name = ?, total_raw_photos = ?,
+        hit_rate = CASE WHEN total_photos <> 0 AND ? > 0
+                        THEN ROUND((total_photos * 1.0 / ?) * 100, 1) END,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE id = ?
+"""
+
+# Sessions per chunk when streaming /api/database/overview
+OVERVIEW_BATCH_SIZE = 100
+
+# Number of database writes made through the API (see _data_write); part
+# of the response cache keys, since the file stat alone can miss a write
+_data_generation = 0
+_data_generation_lock = threading.Lock()
+
+# Encoded "All Data" /api/analyze/database responses, keyed by database
+# version (see _cache_version) and include_photos
+ANALYZE_CACHE_SIZE = 4
+_analyze_cache = ResponseCache(ANALYZE_CACHE_SIZE)
+
+# Encoded /api/categories and /api/groups responses, keyed by database
+# version and listing
+LISTING_CACHE_SIZE = 16
+_listing_cache = ResponseCache(LISTING_CACHE_SIZE)
+
+# Helper process that shows folder dialogs for /api/browse-folder
+FOLDER_PICKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'folder_picker.py')
+_folder_picker = None
+_folder_picker_lock = threading.Lock()
+
+# Idle DatabaseManagers shared between requests (see get_db); managers
+# released beyond DB_POOL_SIZE are closed
+DB_POOL_SIZE = 2 * (os.cpu_count() or 1)
+_db_pool = []
+_db_pool_lock = threading.Lock()
+
+
+def get_db() -> DatabaseManager:
+    """
+    Get the DatabaseManager for the current request.
+    
+    Managers are pooled across requests, so the config file, SQLite
+    connection and schema setup are only paid for when the pool grows. Each
+    request has its manager to itself until the request ends.
+    """
+    db = g.get('db')
+    if db is None:
+        with _db_pool_lock:
+            db = _db_pool.pop() if _db_pool else None
+        if db is None:
+            # Requests run on varying threads; the pool ensures only one
+            # request uses a connection at a time
+            db = DatabaseManager.from_config(CONFIG_PATH, check_same_thread=False)
+        g.db = db
+    return db
+
+
+def get_extractor() -> 'ExifExtractor':
+    """Get an ExifExtractor for the current request, backed by get_db()."""
+    extractor = g.get('extractor')
+    if extractor is None:
+        # Imported on first use: it pulls in pyexiftool, which endpoints that
+        # only read the database don't need
+        from extractors import ExifExtractor
+        extractor = ExifExtractor.from_config(CONFIG_PATH, db=get_db())
+        g.extractor = extractor
+    return extractor
+
+
+@app.teardown_appcontext
+def release_db(exc):
+    """Return the request's DatabaseManager to the pool (or close it if the pool is full)."""
+    g.pop('extractor', None)
+    db = g.pop('db', None)
+    if db is None:
+        return
+    try:
+        # Don't hand a half-finished transaction to the next request
+        if db.conn.in_transaction:
+            db.conn.rollback()
+    except Exception as e:
+        logger.warning(f"Discarding pooled database connection: {e}")
+        db.close()
+        return
+    with _db_pool_lock:
+        if len(_db_pool) < DB_POOL_SIZE:
+            _db_pool.append(db)
+            return
+    db.close()
+
+
+# Maximum number of folders /api/crawl extracts at once
+CRAWL_WORKERS = min(8, os.cpu_count() or 1)
+
+# Per-thread ExifExtractor for crawl workers (SQLite connections can't be
+# shared across threads)
+_crawl_local = threading.local()
+
+# Date patterns that mark a folder as a session folder when crawling
+_SESSION_DATE_PATTERNS = [
+    r'\d{4}[-_]\d{2}[-_]\d{2}',  # YYYY-MM-DD or YYYY_MM_DD
+    r'\d{2}[-_]\d{2}[-_]\d{4}',  # MM-DD-YYYY or MM_DD_YYYY
+    r'\d{8}',                      # YYYYMMDD
+    r'\d{2}[-_]\d{2}[-_]\d{2}'   # YY-MM-DD or MM-DD-YY
+]
+
+# Folder names that never name a session on their own
+_GENERIC_SESSION_FOLDERS = ['photos', 'edited', 'raw', 'images', 'jpg', 'jpeg', 'export', 'exported']
+
+
+def _crawl_session_name(folder_path: str) -> str:
+    """
+    Derive a session name for a crawled folder from its path.
+    
+    Priority: folder with date pattern > non-generic folder > endpoint folder
+    """
+    parent_parts = Path(folder_path).parts
+    date_pattern_folder = None
+    non_generic_folder = None
+    
+    for j in range(len(parent_parts) - 1, -1, -1):
+        part = parent_parts[j]
+        part_lower = part.lower()
+        
+        # Check if folder has a date pattern
+        has_date = any(re.search(pattern, part, re.IGNORECASE) for pattern in _SESSION_DATE_PATTERNS)
+        
+        if has_date and not date_pattern_folder:
+            date_pattern_folder = part
+        
+        if part_lower not in _GENERIC_SESSION_FOLDERS and not non_generic_folder:
+            non_generic_folder = part
+    
+    # Use priority order: date pattern > non-generic > endpoint
+    session_name = date_pattern_folder or non_generic_folder or os.path.basename(folder_path)
+    return session_name.replace(' ', '_')
+
+
+def _find_target_folders(parent_dir: str, target_folder: str,
+                         max_depth: Optional[int] = None) -> List[str]:
+    """
+    Find folders named target_folder (case-insensitive) below parent_dir.
+    
+    Matching folders are not searched further, hidden folders are skipped,
+    and symlinked folders are matched but never descended into.
+    
+    Args:
+        parent_dir: Directory to search
+        target_folder: Folder name to look for, e.g. "Edited"
+        max_depth: Optional maximum depth to search (1 = direct children)
+    
+    Returns:
+        Matching folder paths, in the order os.walk would report them
+    """
+    target_lower = target_folder.lower()
+    found = []
+    
+    def _search(directory: str, depth: int):
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            # Unreadable directory; skip it like os.walk does
+            return
+        
+        subdirs = []
+        for entry in entries:
+            name = entry.name
+            if name.startswith('.'):
+                continue
+            try:
+                if not entry.is_dir():
+                    continue
+                if name.lower() == target_lower:
+                    found.append(entry.path)
+                elif not entry.is_symlink():
+                    subdirs.append(entry.path)
+            except OSError:
+                continue
+        
+        if max_depth is None or depth < max_depth:
+            for subdir in subdirs:
+                _search(subdir, depth + 1)
+    
+    _search(os.fspath(parent_dir), 1)
+    return found
+
+
+def _crawl_extractor() -> 'ExifExtractor':
+    """Get this thread's ExifExtractor, creating it on first use."""
+    extractor = getattr(_crawl_local, 'extractor', None)
+    if extractor is None:
+        from extractors import ExifExtractor
+        extractor = ExifExtractor.from_config(CONFIG_PATH)
+        _crawl_local.extractor = extractor
+    return extractor
+
+
+def _crawl_folder_group(folders: List[tuple], options: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Extract a list of crawled folders in order, on a crawl worker thread.
+    
+    Folders that share a session name are handed to the same worker so the
+    "session already exists" check in extract_folder still sees earlier ones.
+    
+    Args:
+        folders: (progress label, folder_path, session_name) tuples
+        options: Keyword arguments for ExifExtractor.extract_folder
+    
+    Returns:
+        One result dict per folder, in the order given
+    """
+    extractor = _crawl_extractor()
+    results = []
+    
+    for label, folder_path, session_name in folders:
+        logger.info(f"Processing {label} - {session_name} (Category: {options['category']}, Group: {options['group']})")
+        
+        try:
+            session = extractor.extract_folder(
+                folder_path=folder_path,
+                session_name=session_name,
+                **options
+            )
+            
+            if session:
+                results.append({
+                    'success': True,
+                    'session_id': session.id,
+                    'session_name': session.name,
+                    'total_photos': session.total_photos,
+                    'hit_rate': session.hit_rate
+                })
+            else:
+                results.append({
+                    'success': False,
+                    'folder': folder_path,
+                    'error': 'Extraction returned None'
+                })
+                
+        except Exception as e:
+            logger.error(f"Error processing {folder_path}: {e}")
+            results.append({
+                'success': False,
+                'folder': folder_path,
+                'error': str(e)
+            })
+    
+    return results
+
+
+# Per-category and per-group session totals for the "All Data" view. A
+# session counts toward hit rate only with a positive RAW total that is at
+# least its photo count (prevents >100% and missing-data inflation).
+_BREAKDOWN_COLUMNS = """
+    COUNT(*) AS sessions,
+    SUM(COALESCE(total_photos, 0)) AS photos,
+    SUM(CASE WHEN total_raw_photos > 0
+              AND COALESCE(total_photos, 0) BETWEEN 0 AND total_raw_photos
+             THEN COALESCE(total_photos, 0) ELSE 0 END) AS hit_rate_photos,
+    SUM(CASE WHEN total_raw_photos > 0
+              AND COALESCE(total_photos, 0) BETWEEN 0 AND total_raw_photos
+             THEN total_raw_photos ELSE 0 END) AS raw_photos,
+    SUM(total_raw_photos IS NULL) AS missing_raw_sessions,
+    SUM(total_raw_photos IS NOT NULL
+        AND NOT (total_raw_photos > 0
+                 AND COALESCE(total_photos, 0) BETWEEN 0 AND total_raw_photos)) AS invalid_raw_sessions
+"""
+
+
+def _session_breakdowns(conn, include_raw_counts: bool = False):
+    """
+    Summarize all sessions by category and by group in SQL.
+    
+    Args:
+        conn: Database connection
+        include_raw_counts: Also report, per category/group, how many
+            sessions have no RAW total (missing_raw_sessions) or one that
+            can't be used for hit rate (invalid_raw_sessions)
+    
+    Returns:
+        Tuple of (categories, groups, group_to_category) dicts, in order of
+        each name's first session. A group's category is that of its first
+        session.
+    """
+    def _breakdown(row):
+        raw_photos = row['raw_photos']
+        breakdown = {
+            'sessions': row['sessions'],
+            'photos': row['photos'],
+            'raw_photos': raw_photos,
+            'hit_rate_photos': row['hit_rate_photos'],
+            'hit_rate': (row['hit_rate_photos'] / raw_photos) * 100 if raw_photos > 0 else None,
+        }
+        if include_raw_counts:
+            breakdown['missing_raw_sessions'] = row['missing_raw_sessions']
+            breakdown['invalid_raw_sessions'] = row['invalid_raw_sessions']
+        return breakdown
+    
+    categories = {}
+    for row in conn.execute(f"""
+        SELECT COALESCE(NULLIF(category, ''), 'Uncategorized') AS cat,
+               {_BREAKDOWN_COLUMNS}
+        FROM sessions
+        GROUP BY cat
+        ORDER BY MIN(id)
+    """):
+        categories[row['cat']] = _breakdown(row)
+    
+    # With MIN(id), SQLite takes the bare cat column from the group's first session
+    groups = {}
+    group_to_category = {}
+    for row in conn.execute(f"""
+        SELECT COALESCE(NULLIF(group_name, ''), 'Ungrouped') AS grp,
+               COALESCE(NULLIF(category, ''), 'Uncategorized') AS cat,
+               MIN(id) AS first_id,
+               {_BREAKDOWN_COLUMNS}
+        FROM sessions
+        GROUP BY grp
+        ORDER BY first_id
+    """):
+        grp = row['grp']
+        group = _breakdown(row)
+        group['category'] = row['cat']
+        groups[grp] = group
+        group_to_category[grp] = row['cat']
+    
+    return categories, groups, group_to_category
+
+
+def _pick_folder() -> str:
+    """
+    Ask the folder picker helper for a folder, starting it if needed.
+    
+    The helper keeps its Tk interpreter between picks, so only the first
+    dialog pays the startup cost.
+    
+    Returns:
+        Selected folder path, or '' if the dialog was cancelled
+    """
+    global _folder_picker
+    
+    with _folder_picker_lock:
+        # A second attempt covers a helper that died since the last pick
+        for _ in range(2):
+            if _folder_picker is None or _folder_picker.poll() is not None:
+                _folder_picker = subprocess.Popen(
+                    [sys.executable, FOLDER_PICKER_SCRIPT],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    text=True
+                )
+            
+            try:
+                _folder_picker.stdin.write('PICK\n')
+                _folder_picker.stdin.flush()
+                line = _folder_picker.stdout.readline()
+            except OSError:
+                line = ''
+            
+            if line:
+                return json.loads(line)
+            
+            _folder_picker.kill()
+            _folder_picker.wait()
+            _folder_picker = None
+        
+        raise RuntimeError('Folder picker helper exited unexpectedly (is tkinter available?)')
+
+
+@atexit.register
+def _close_folder_picker():
+    """Shut down the folder picker helper, if it was started."""
+    if _folder_picker is None or _folder_picker.poll() is not None:
+        return
+    try:
+        # Closing stdin ends the helper's read loop
+        _folder_picker.stdin.close()
+        _folder_picker.wait(timeout=2)
+    except (OSError, subprocess.TimeoutExpired):
+        _folder_picker.kill()
+
+
+def _database_version(db: DatabaseManager) -> Optional[tuple]:
+    """
+    Get a value that changes whenever the database contents change.
+    
+    For SQLite this is the modification time and size of the database file
+    and its write-ahead log, if any. Returns None when it can't be
+    determined (in-memory or non-SQLite databases).
+    """
+    if db.db_type != 'sqlite' or db.connection_string == ':memory:':
+        return None
+    
+    version = []
+    for path in (db.connection_string, db.connection_string + '-wal'):
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            version.append(None)
+            continue
+        except OSError:
+            return None
+        version.append((st.st_mtime_ns, st.st_size))
+    return tuple(version)
+
+
+@contextmanager
+def _data_write():
+    """
+    Mark a block that writes to the database.
+    
+    Bumps the data generation when the block exits, whether or not it
+    raised: batched deletes and crawls commit as they go, so a failed
+    write may still have changed the data.
+    """
+    global _data_generation
+    try:
+        yield
+    finally:
+        with _data_generation_lock:
+            _data_generation += 1
+
+
+def _cache_version(db: DatabaseManager) -> Optional[tuple]:
+    """
+    Get the database version response cache keys are built from.
+    
+    Pairs the data generation, which changes with every write made through
+    the API, with _database_version, which still catches writes from other
+    processes. The file's mtime and size alone can miss a write (coarse
+    timestamps, same-size updates). Returns None when the database can't
+    be versioned.
+    """
+    with _data_generation_lock:
+        generation = _data_generation
+    version = _database_version(db)
+    if version is None:
+        return None
+    return (generation, version)
+
+
+def _json_bytes(obj) -> bytes:
+    """Encode obj as JSON the same way jsonify does."""
+    if isinstance(app.json, OrjsonJSONProvider):
+        return app.json.dumps_bytes(obj)
+    return app.json.dumps(obj).encode('utf-8')
+
+
+def _session_ids_by_name(conn, names: List[str]) -> List[int]:
+    """
+    Look up the IDs of sessions with any of the given names.
+    
+    The names are passed as a single JSON array parameter, so the statement
+    text is the same for any number of names (SQLite can reuse the prepared
+    statement) and long selections never hit the bound-parameter limit.
+    """
+    session_rows = conn.execute(
+        "SELECT id FROM sessions WHERE name IN (SELECT value FROM json_each(?))",
+        (json.dumps(list(names)),)
+    ).fetchall()
+    return [s['id'] for s in session_rows]
 
 
 @app.route('/')
@@ -69,15 +713,13 @@ def health_check():
     })
 
 
-@app.route('/api/progress/<task_id>', methods=['GET'])
-def get_progress(task_id):
-    """Get progress for a long-running task."""
-    progress = progress_store.get(task_id, {'progress': 0, 'total': 0, 'status': 'unknown'})
+def _progress_payload(progress: Dict[str, Any]) -> bytes:
+    """Encode the /api/progress response body for a progress entry."""
     percentage = 0
     if progress['total'] > 0:
         percentage = int((progress['progress'] / progress['total']) * 100)
     
-    return jsonify({
+    return _json_bytes({
         'percentage': percentage,
         'progress': progress['progress'],
         'total': progress['total'],
@@ -85,29 +727,26 @@ def get_progress(task_id):
     })
 
 
+@app.route('/api/progress/<task_id>', methods=['GET'])
+def get_progress(task_id):
+    """Get progress for a long-running task."""
+    payload = progress_store.payload(task_id)
+    if payload is None:
+        payload = _progress_payload({'progress': 0, 'total': 0, 'status': 'unknown'})
+    return Response(payload, mimetype='application/json')
+
+
 @app.route('/api/browse-folder', methods=['POST'])
 def browse_folder():
     """
-    Open a folder picker dialog using tkinter.
+    Open a folder picker dialog using tkinter (see folder_picker.py).
     This works around browser security restrictions.
     
     Returns:
         JSON with selected folder path
     """
     try:
-        import tkinter as tk
-        from tkinter import filedialog
-        
-        # Create root window and hide it
-        root = tk.Tk()
-        root.withdraw()
-        root.attributes('-topmost', True)
-        
-        # Open folder picker
-        folder_path = filedialog.askdirectory(title='Select Folder')
-        
-        # Clean up
-        root.destroy()
+        folder_path = _pick_folder()
         
         if folder_path:
             return jsonify({
@@ -155,7 +794,7 @@ def check_duplicates():
             return jsonify({'similar_sessions': []}), 200
         
         # Connect to database
-        db = DatabaseManager.from_config(CONFIG_PATH)
+        db = get_db()
         
         # Normalize input for comparison
         norm_category = db.normalize_for_comparison(category)
@@ -309,7 +948,9 @@ def extract_metadata():
             "category": "category_name",
             "group": "group_name",
             "description": "Optional description",
-            "calculate_hit_rate": true
+            "calculate_hit_rate": true,
+            "workers": null,
+            "fast_exif": true
         }
     
     Returns:
@@ -329,6 +970,15 @@ def extract_metadata():
         group = data.get('group', 'ungrouped')
         description = data.get('description')
         calculate_hit_rate = data.get('calculate_hit_rate', True)
+        workers = data.get('workers')
+        fast_exif = data.get('fast_exif', True)
+        if workers is not None:
+            try:
+                workers = int(workers)
+            except (TypeError, ValueError):
+                return jsonify({'error': 'workers must be an integer'}), 400
+        if not isinstance(fast_exif, bool):
+            return jsonify({'error': 'fast_exif must be true or false'}), 400
         
         logger.info(f"Extract request - session_name: '{session_name}', folder: {folder_path}")
         logger.info(f"Extract request - use_date_heuristics: {use_date_heuristics}, date_str: {date_str}")
@@ -350,18 +1000,21 @@ def extract_metadata():
         logger.info(f"Processing single folder - Category: {category}, Group: {group}")
         logger.info(f"Extracting metadata from: {folder_path}")
         
-        extractor = ExifExtractor.from_config(CONFIG_PATH)
-        session = extractor.extract_folder(
-            folder_path=folder_path,
-            session_name=session_name,
-            category=category,
-            group=group,
-            description=description,
-            calculate_hit_rate=calculate_hit_rate,
-            date=session_date,
-            use_date_heuristics=use_date_heuristics,
-            use_filename_dates=use_filename_dates
-        )
+        extractor = get_extractor()
+        with _data_write():
+            session = extractor.extract_folder(
+                folder_path=folder_path,
+                session_name=session_name,
+                category=category,
+                group=group,
+                description=description,
+                calculate_hit_rate=calculate_hit_rate,
+                workers=workers,
+                fast_exif=fast_exif,
+                date=session_date,
+                use_date_heuristics=use_date_heuristics,
+                use_filename_dates=use_filename_dates
+            )
         
         if not session:
             return jsonify({'error': 'Extraction failed'}), 500
@@ -410,7 +1063,9 @@ def crawl_folders():
             "category": "category_name",
             "group": "group_name",
             "description": "Optional description",
-            "calculate_hit_rate": true
+            "calculate_hit_rate": true,
+            "max_depth": null,
+            "fast_exif": true
         }
     
     Returns:
@@ -427,6 +1082,12 @@ def crawl_folders():
         group = data.get('group', 'ungrouped')
         description = data.get('description')
         calculate_hit_rate = data.get('calculate_hit_rate', True)
+        max_depth = data.get('max_depth')
+        fast_exif = data.get('fast_exif', True)
+        if max_depth is not None:
+            max_depth = int(max_depth)
+        if not isinstance(fast_exif, bool):
+            return jsonify({'error': 'fast_exif must be true or false'}), 400
         
         if not parent_dir:
             return jsonify({'error': 'parent_dir is required'}), 400
@@ -436,16 +1097,8 @@ def crawl_folders():
         
         logger.info(f"Crawling: {parent_dir} for folders named '{target_folder}'")
         
-        extractor = ExifExtractor.from_config(CONFIG_PATH)
-        
         # Find all target folders
-        target_folders = []
-        target_lower = target_folder.lower()
-        
-        for root, dirs, files in os.walk(parent_dir):
-            for dir_name in dirs:
-                if dir_name.lower() == target_lower:
-                    target_folders.append(os.path.join(root, dir_name))
+        target_folders = _find_target_folders(parent_dir, target_folder, max_depth)
         
         if not target_folders:
             return jsonify({
@@ -465,86 +1118,43 @@ def crawl_folders():
             except ValueError:
                 logger.warning(f"Invalid date format: {date_str}")
         
-        # Process each folder
-        results = []
-        successful = 0
-        failed = 0
+        # Process folders in parallel; extraction mostly waits on exiftool
+        # and disk, so threads overlap well. Folders that map to the same
+        # session name stay together on one worker, in crawl order.
+        options = {
+            'date': session_date,
+            'use_date_heuristics': use_date_heuristics,
+            'use_filename_dates': use_filename_dates,
+            'category': category,
+            'group': group,
+            'description': description,
+            'calculate_hit_rate': calculate_hit_rate,
+            'fast_exif': fast_exif,
+            # Share the CPUs between the folders being extracted at once
+            'workers': max(1, (os.cpu_count() or 1) // CRAWL_WORKERS),
+        }
         
+        total_folders = len(target_folders)
+        folder_groups = {}
         for idx, folder_path in enumerate(target_folders, 1):
-            # Extract session name from path
-            # Priority: folder with date pattern > non-generic folder > endpoint folder
-            parent_parts = Path(folder_path).parts
-            session_name = None
-            date_pattern_folder = None
-            non_generic_folder = None
-            
-            # Date patterns to look for
-            date_patterns = [
-                r'\d{4}[-_]\d{2}[-_]\d{2}',  # YYYY-MM-DD or YYYY_MM_DD
-                r'\d{2}[-_]\d{2}[-_]\d{4}',  # MM-DD-YYYY or MM_DD_YYYY
-                r'\d{8}',                      # YYYYMMDD
-                r'\d{2}[-_]\d{2}[-_]\d{2}'   # YY-MM-DD or MM-DD-YY
+            session_name = _crawl_session_name(folder_path)
+            folder_groups.setdefault(session_name, []).append(
+                (f"{idx} of {total_folders}", folder_path, session_name)
+            )
+        
+        results_by_folder = {}
+        with _data_write(), ThreadPoolExecutor(max_workers=min(CRAWL_WORKERS, len(folder_groups))) as executor:
+            futures = [
+                (folders, executor.submit(_crawl_folder_group, folders, options))
+                for folders in folder_groups.values()
             ]
-            
-            generic_folders = ['photos', 'edited', 'raw', 'images', 'jpg', 'jpeg', 'export', 'exported']
-            
-            for j in range(len(parent_parts) - 1, -1, -1):
-                part = parent_parts[j]
-                part_lower = part.lower()
-                
-                # Check if folder has a date pattern
-                has_date = any(re.search(pattern, part, re.IGNORECASE) for pattern in date_patterns)
-                
-                if has_date and not date_pattern_folder:
-                    date_pattern_folder = part
-                
-                if part_lower not in generic_folders and not non_generic_folder:
-                    non_generic_folder = part
-            
-            # Use priority order: date pattern > non-generic > endpoint
-            session_name = date_pattern_folder or non_generic_folder or os.path.basename(folder_path)
-            session_name = session_name.replace(' ', '_')
-            
-            logger.info(f"Processing {idx} of {len(target_folders)} - {session_name} (Category: {category}, Group: {group})")
-            
-            try:
-                session = extractor.extract_folder(
-                    folder_path=folder_path,
-                    session_name=session_name,
-                    date=session_date,
-                    use_date_heuristics=use_date_heuristics,
-                    use_filename_dates=use_filename_dates,
-                    category=category,
-                    group=group,
-                    description=description,
-                    calculate_hit_rate=calculate_hit_rate
-                )
-                
-                if session:
-                    results.append({
-                        'success': True,
-                        'session_id': session.id,
-                        'session_name': session.name,
-                        'total_photos': session.total_photos,
-                        'hit_rate': session.hit_rate
-                    })
-                    successful += 1
-                else:
-                    results.append({
-                        'success': False,
-                        'folder': folder_path,
-                        'error': 'Extraction returned None'
-                    })
-                    failed += 1
-                    
-            except Exception as e:
-                logger.error(f"Error processing {folder_path}: {e}")
-                results.append({
-                    'success': False,
-                    'folder': folder_path,
-                    'error': str(e)
-                })
-                failed += 1
+            for folders, future in futures:
+                for (_, folder_path, _), result in zip(folders, future.result()):
+                    results_by_folder[folder_path] = result
+        
+        results = [results_by_folder[folder_path] for folder_path in target_folders]
+        successful = sum(1 for result in results if result['success'])
+        failed = len(results) - successful
         
         return jsonify({
             'success': True,
@@ -576,36 +1186,36 @@ def analyze():
             return jsonify({'error': 'target is required'}), 400
         
         # Initialize progress
-        progress_store[task_id] = {'progress': 0, 'total': 100, 'status': 'starting'}
+        progress_store.update(task_id, 0, 'starting')
         
-        analyzer = StatisticsAnalyzer.from_config(CONFIG_PATH)
-        db = DatabaseManager.from_config(CONFIG_PATH)
+        db = get_db()
+        analyzer = StatisticsAnalyzer(db)
         
         # Get total photo count for progress tracking
         if analysis_type == 'session':
-            progress_store[task_id] = {'progress': 25, 'total': 100, 'status': 'loading session'}
+            progress_store.update(task_id, 25, 'loading session')
             analysis = analyzer.analyze_session(int(target))
         elif analysis_type == 'group':
-            progress_store[task_id] = {'progress': 25, 'total': 100, 'status': 'loading group'}
+            progress_store.update(task_id, 25, 'loading group')
             # Analyze group across all categories
             analysis = analyzer.analyze_group(target)
         elif analysis_type == 'category':
-            progress_store[task_id] = {'progress': 25, 'total': 100, 'status': 'loading category'}
+            progress_store.update(task_id, 25, 'loading category')
             analysis = analyzer.analyze_category(target)
         else:
             return jsonify({'error': f'Invalid analysis type: {analysis_type}'}), 400
         
-        progress_store[task_id] = {'progress': 75, 'total': 100, 'status': 'analyzing'}
+        progress_store.update(task_id, 75, 'analyzing')
         
         if not analysis:
-            progress_store[task_id] = {'progress': 100, 'total': 100, 'status': 'failed'}
+            progress_store.update(task_id, 100, 'failed')
             return jsonify({'error': 'Analysis failed'}), 500
         
         # Convert analysis to dict
-        progress_store[task_id] = {'progress': 90, 'total': 100, 'status': 'formatting results'}
+        progress_store.update(task_id, 90, 'formatting results')
         analysis_dict = analysis.to_dict()
         
-        progress_store[task_id] = {'progress': 100, 'total': 100, 'status': 'complete'}
+        progress_store.update(task_id, 100, 'complete')
         
         return jsonify({
             'success': True,
@@ -615,7 +1225,7 @@ def analyze():
     except Exception as e:
         logger.error(f"Error in analyze: {e}", exc_info=True)
         if task_id in progress_store:
-            progress_store[task_id] = {'progress': 100, 'total': 100, 'status': 'error'}
+            progress_store.update(task_id, 100, 'error')
         return jsonify({'error': str(e)}), 500
 
 
@@ -648,7 +1258,7 @@ def analyze_database():
         print(f"  Filters: {filters}")
         print(f"  Include photos: {include_photos}")
         
-        db = DatabaseManager.from_config(CONFIG_PATH)
+        db = get_db()
         analyzer = StatisticsAnalyzer(db)
         
         # Get session IDs based on category/group/sessions filters
@@ -661,14 +1271,20 @@ def analyze_database():
         if 'group' in filters:
             group = filters['group']
         
+        # The unfiltered "All Data" view only changes when the database does,
+        # so serve repeat requests from the response cache
+        cache_key = None
+        if not (sessions or category or group or filters):
+            version = _cache_version(db)
+            if version is not None:
+                cache_key = (version, include_photos)
+                body = _analyze_cache.get(cache_key)
+                if body is not None:
+                    return Response(body, mimetype='application/json')
+        
         if sessions and len(sessions) > 0:
             # Get specific sessions by name
-            placeholders = ','.join('?' * len(sessions))
-            session_rows = conn.execute(
-                f"SELECT id FROM sessions WHERE name IN ({placeholders})",
-                sessions
-            ).fetchall()
-            session_ids = [s['id'] for s in session_rows]
+            session_ids = _session_ids_by_name(conn, sessions)
         elif category and group:
             # Get sessions by category and group
             session_rows = conn.execute(
@@ -714,97 +1330,7 @@ def analyze_database():
             analysis = analyzer.analyze_with_filters(session_ids, photo_filters, include_photos=include_photos)
             
             # Add categories and groups breakdown - always show ALL from database
-            conn = db.conn
-            all_sessions = conn.execute("SELECT * FROM sessions").fetchall()
-            
-            def _safe_int(v):
-                try:
-                    return int(v)
-                except Exception:
-                    return 0
-
-            def _hit_rate_contrib(total_photos, total_raw_photos):
-                if total_raw_photos is None:
-                    return None
-                raw = _safe_int(total_raw_photos)
-                photos = _safe_int(total_photos)
-                if raw <= 0:
-                    return None
-                if photos < 0:
-                    return None
-                if photos > raw:
-                    return None
-                return photos, raw
-
-            # Get category breakdown - always include all
-            categories = {}
-            for session in all_sessions:
-                cat = session['category'] or 'Uncategorized'
-                if cat not in categories:
-                    categories[cat] = {
-                        'sessions': 0,
-                        'photos': 0,
-                        'raw_photos': 0,
-                        'hit_rate_photos': 0,
-                        'hit_rate': None,
-                        'missing_raw_sessions': 0,
-                        'invalid_raw_sessions': 0,
-                    }
-                categories[cat]['sessions'] += 1
-                categories[cat]['photos'] += _safe_int(session['total_photos'])
-
-                contrib = _hit_rate_contrib(session['total_photos'], session['total_raw_photos'])
-                if contrib is None:
-                    if session['total_raw_photos'] is None:
-                        categories[cat]['missing_raw_sessions'] += 1
-                    else:
-                        categories[cat]['invalid_raw_sessions'] += 1
-                else:
-                    photos_c, raw_c = contrib
-                    categories[cat]['hit_rate_photos'] += photos_c
-                    categories[cat]['raw_photos'] += raw_c
-
-            # Calculate hit rate for each category
-            for cat in categories:
-                if categories[cat]['raw_photos'] > 0:
-                    categories[cat]['hit_rate'] = (categories[cat]['hit_rate_photos'] / categories[cat]['raw_photos']) * 100
-            
-            # Get group breakdown - always include all with category mapping
-            groups = {}
-            group_to_category = {}
-            for session in all_sessions:
-                grp = session['group_name'] or 'Ungrouped'
-                cat = session['category'] or 'Uncategorized'
-                if grp not in groups:
-                    groups[grp] = {
-                        'sessions': 0,
-                        'photos': 0,
-                        'category': cat,
-                        'raw_photos': 0,
-                        'hit_rate_photos': 0,
-                        'hit_rate': None,
-                        'missing_raw_sessions': 0,
-                        'invalid_raw_sessions': 0,
-                    }
-                    group_to_category[grp] = cat
-                groups[grp]['sessions'] += 1
-                groups[grp]['photos'] += _safe_int(session['total_photos'])
-
-                contrib = _hit_rate_contrib(session['total_photos'], session['total_raw_photos'])
-                if contrib is None:
-                    if session['total_raw_photos'] is None:
-                        groups[grp]['missing_raw_sessions'] += 1
-                    else:
-                        groups[grp]['invalid_raw_sessions'] += 1
-                else:
-                    photos_c, raw_c = contrib
-                    groups[grp]['hit_rate_photos'] += photos_c
-                    groups[grp]['raw_photos'] += raw_c
-
-            # Calculate hit rate for each group
-            for grp in groups:
-                if groups[grp]['raw_photos'] > 0:
-                    groups[grp]['hit_rate'] = (groups[grp]['hit_rate_photos'] / groups[grp]['raw_photos']) * 100
+            categories, groups, group_to_category = _session_breakdowns(db.conn, include_raw_counts=True)
             
             # Always add categories and groups metadata so they stay visible
             analysis.metadata['categories'] = categories
@@ -844,28 +1370,17 @@ def analyze_database():
             # Analyze specific group within category
             analysis = analyzer.analyze_group(group)
             
-            # Add categories and groups breakdown - always show ALL from database
-            conn = db.conn
-            all_sessions = conn.execute("SELECT * FROM sessions").fetchall()
-            
-            categories = {}
-            for session in all_sessions:
-                cat = session['category'] or 'Uncategorized'
-                if cat not in categories:
-                    categories[cat] = {'sessions': 0, 'photos': 0}
-                categories[cat]['sessions'] += 1
-                categories[cat]['photos'] += session['total_photos']
-            
-            groups = {}
-            group_to_category = {}
-            for session in all_sessions:
-                grp = session['group_name'] or 'Ungrouped'
-                cat = session['category'] or 'Uncategorized'
-                if grp not in groups:
-                    groups[grp] = {'sessions': 0, 'photos': 0, 'category': cat}
-                    group_to_category[grp] = cat
-                groups[grp]['sessions'] += 1
-                groups[grp]['photos'] += session['total_photos']
+            # Add categories and groups breakdown - always show ALL from database.
+            # This view only reports session and photo counts.
+            all_categories, all_groups, group_to_category = _session_breakdowns(db.conn)
+            categories = {
+                cat: {'sessions': stats['sessions'], 'photos': stats['photos']}
+                for cat, stats in all_categories.items()
+            }
+            groups = {
+                grp: {'sessions': stats['sessions'], 'photos': stats['photos'], 'category': stats['category']}
+                for grp, stats in all_groups.items()
+            }
             
             analysis.metadata['categories'] = categories
             analysis.metadata['groups'] = groups
@@ -876,82 +1391,7 @@ def analyze_database():
             analysis = analyzer.analyze_category(category)
             
             # Add categories and groups breakdown - always show ALL from database
-            conn = db.conn
-            all_sessions = conn.execute("SELECT * FROM sessions").fetchall()
-
-            def _safe_int(v):
-                try:
-                    return int(v)
-                except Exception:
-                    return 0
-
-            def _hit_rate_contrib(total_photos, total_raw_photos):
-                # Only count sessions with valid RAW totals; prevents >100% and missing-data inflation.
-                if total_raw_photos is None:
-                    return None
-                raw = _safe_int(total_raw_photos)
-                photos = _safe_int(total_photos)
-                if raw <= 0:
-                    return None
-                if photos < 0:
-                    return None
-                if photos > raw:
-                    return None
-                return photos, raw
-            
-            categories = {}
-            for session in all_sessions:
-                cat = session['category'] or 'Uncategorized'
-                if cat not in categories:
-                    categories[cat] = {
-                        'sessions': 0,
-                        'photos': 0,
-                        'raw_photos': 0,
-                        'hit_rate_photos': 0,
-                        'hit_rate': None,
-                    }
-                categories[cat]['sessions'] += 1
-                categories[cat]['photos'] += _safe_int(session['total_photos'])
-
-                contrib = _hit_rate_contrib(session['total_photos'], session['total_raw_photos'])
-                if contrib is not None:
-                    photos_c, raw_c = contrib
-                    categories[cat]['hit_rate_photos'] += photos_c
-                    categories[cat]['raw_photos'] += raw_c
-            
-            # Calculate hit rate for each category
-            for cat in categories:
-                if categories[cat]['raw_photos'] > 0:
-                    categories[cat]['hit_rate'] = (categories[cat]['hit_rate_photos'] / categories[cat]['raw_photos']) * 100
-            
-            groups = {}
-            group_to_category = {}
-            for session in all_sessions:
-                grp = session['group_name'] or 'Ungrouped'
-                cat = session['category'] or 'Uncategorized'
-                if grp not in groups:
-                    groups[grp] = {
-                        'sessions': 0,
-                        'photos': 0,
-                        'category': cat,
-                        'raw_photos': 0,
-                        'hit_rate_photos': 0,
-                        'hit_rate': None,
-                    }
-                    group_to_category[grp] = cat
-                groups[grp]['sessions'] += 1
-                groups[grp]['photos'] += _safe_int(session['total_photos'])
-
-                contrib = _hit_rate_contrib(session['total_photos'], session['total_raw_photos'])
-                if contrib is not None:
-                    photos_c, raw_c = contrib
-                    groups[grp]['hit_rate_photos'] += photos_c
-                    groups[grp]['raw_photos'] += raw_c
-            
-            # Calculate hit rate for each group
-            for grp in groups:
-                if groups[grp]['raw_photos'] > 0:
-                    groups[grp]['hit_rate'] = (groups[grp]['hit_rate_photos'] / groups[grp]['raw_photos']) * 100
+            categories, groups, group_to_category = _session_breakdowns(db.conn)
             
             analysis.metadata['categories'] = categories
             analysis.metadata['groups'] = groups
@@ -962,82 +1402,7 @@ def analyze_database():
             analysis = analyzer.analyze_group(group)
             
             # Add categories and groups breakdown - always show ALL from database
-            conn = db.conn
-            all_sessions = conn.execute("SELECT * FROM sessions").fetchall()
-
-            def _safe_int(v):
-                try:
-                    return int(v)
-                except Exception:
-                    return 0
-
-            def _hit_rate_contrib(total_photos, total_raw_photos):
-                # Only count sessions with valid RAW totals; prevents >100% and missing-data inflation.
-                if total_raw_photos is None:
-                    return None
-                raw = _safe_int(total_raw_photos)
-                photos = _safe_int(total_photos)
-                if raw <= 0:
-                    return None
-                if photos < 0:
-                    return None
-                if photos > raw:
-                    return None
-                return photos, raw
-            
-            categories = {}
-            for session in all_sessions:
-                cat = session['category'] or 'Uncategorized'
-                if cat not in categories:
-                    categories[cat] = {
-                        'sessions': 0,
-                        'photos': 0,
-                        'raw_photos': 0,
-                        'hit_rate_photos': 0,
-                        'hit_rate': None,
-                    }
-                categories[cat]['sessions'] += 1
-                categories[cat]['photos'] += _safe_int(session['total_photos'])
-
-                contrib = _hit_rate_contrib(session['total_photos'], session['total_raw_photos'])
-                if contrib is not None:
-                    photos_c, raw_c = contrib
-                    categories[cat]['hit_rate_photos'] += photos_c
-                    categories[cat]['raw_photos'] += raw_c
-            
-            # Calculate hit rate for each category
-            for cat in categories:
-                if categories[cat]['raw_photos'] > 0:
-                    categories[cat]['hit_rate'] = (categories[cat]['hit_rate_photos'] / categories[cat]['raw_photos']) * 100
-            
-            groups = {}
-            group_to_category = {}
-            for session in all_sessions:
-                grp = session['group_name'] or 'Ungrouped'
-                cat = session['category'] or 'Uncategorized'
-                if grp not in groups:
-                    groups[grp] = {
-                        'sessions': 0,
-                        'photos': 0,
-                        'category': cat,
-                        'raw_photos': 0,
-                        'hit_rate_photos': 0,
-                        'hit_rate': None,
-                    }
-                    group_to_category[grp] = cat
-                groups[grp]['sessions'] += 1
-                groups[grp]['photos'] += _safe_int(session['total_photos'])
-
-                contrib = _hit_rate_contrib(session['total_photos'], session['total_raw_photos'])
-                if contrib is not None:
-                    photos_c, raw_c = contrib
-                    groups[grp]['hit_rate_photos'] += photos_c
-                    groups[grp]['raw_photos'] += raw_c
-            
-            # Calculate hit rate for each group
-            for grp in groups:
-                if groups[grp]['raw_photos'] > 0:
-                    groups[grp]['hit_rate'] = (groups[grp]['hit_rate_photos'] / groups[grp]['raw_photos']) * 100
+            categories, groups, group_to_category = _session_breakdowns(db.conn)
             
             analysis.metadata['categories'] = categories
             analysis.metadata['groups'] = groups
@@ -1047,84 +1412,7 @@ def analyze_database():
             analysis = analyzer.analyze_sessions(session_ids, name="All Data")
             
             # Add categories and groups breakdown for "All Data" view
-            conn = db.conn
-            all_sessions = conn.execute("SELECT * FROM sessions").fetchall()
-
-            def _safe_int(v):
-                try:
-                    return int(v)
-                except Exception:
-                    return 0
-
-            def _hit_rate_contrib(total_photos, total_raw_photos):
-                # Only count sessions with valid RAW totals; prevents >100% and missing-data inflation.
-                if total_raw_photos is None:
-                    return None
-                raw = _safe_int(total_raw_photos)
-                photos = _safe_int(total_photos)
-                if raw <= 0:
-                    return None
-                if photos < 0:
-                    return None
-                if photos > raw:
-                    return None
-                return photos, raw
-            
-            # Get category breakdown
-            categories = {}
-            for session in all_sessions:
-                cat = session['category'] or 'Uncategorized'
-                if cat not in categories:
-                    categories[cat] = {
-                        'sessions': 0,
-                        'photos': 0,
-                        'raw_photos': 0,
-                        'hit_rate_photos': 0,
-                        'hit_rate': None,
-                    }
-                categories[cat]['sessions'] += 1
-                categories[cat]['photos'] += _safe_int(session['total_photos'])
-
-                contrib = _hit_rate_contrib(session['total_photos'], session['total_raw_photos'])
-                if contrib is not None:
-                    photos_c, raw_c = contrib
-                    categories[cat]['hit_rate_photos'] += photos_c
-                    categories[cat]['raw_photos'] += raw_c
-            
-            # Calculate hit rate for each category
-            for cat in categories:
-                if categories[cat]['raw_photos'] > 0:
-                    categories[cat]['hit_rate'] = (categories[cat]['hit_rate_photos'] / categories[cat]['raw_photos']) * 100
-            
-            # Get group breakdown with category mapping
-            groups = {}
-            group_to_category = {}
-            for session in all_sessions:
-                grp = session['group_name'] or 'Ungrouped'
-                cat = session['category'] or 'Uncategorized'
-                if grp not in groups:
-                    groups[grp] = {
-                        'sessions': 0,
-                        'photos': 0,
-                        'category': cat,
-                        'raw_photos': 0,
-                        'hit_rate_photos': 0,
-                        'hit_rate': None,
-                    }
-                    group_to_category[grp] = cat
-                groups[grp]['sessions'] += 1
-                groups[grp]['photos'] += _safe_int(session['total_photos'])
-
-                contrib = _hit_rate_contrib(session['total_photos'], session['total_raw_photos'])
-                if contrib is not None:
-                    photos_c, raw_c = contrib
-                    groups[grp]['hit_rate_photos'] += photos_c
-                    groups[grp]['raw_photos'] += raw_c
-            
-            # Calculate hit rate for each group
-            for grp in groups:
-                if groups[grp]['raw_photos'] > 0:
-                    groups[grp]['hit_rate'] = (groups[grp]['hit_rate_photos'] / groups[grp]['raw_photos']) * 100
+            categories, groups, group_to_category = _session_breakdowns(db.conn)
             
             analysis.metadata['categories'] = categories
             analysis.metadata['groups'] = groups
@@ -1138,6 +1426,14 @@ def analyze_database():
         analysis_dict['query_group'] = group
         analysis_dict['include_photos'] = include_photos
         
+        if cache_key is not None:
+            body = _json_bytes({
+                'success': True,
+                'analysis': analysis_dict
+            })
+            _analyze_cache.put(cache_key, body)
+            return Response(body, mimetype='application/json')
+        
         return jsonify({
             'success': True,
             'analysis': analysis_dict
@@ -1168,12 +1464,7 @@ def analyze_database_faceted():
 
         session_ids = []
         if sessions and len(sessions) > 0:
-            placeholders = ','.join('?' * len(sessions))
-            session_rows = conn.execute(
-                f"SELECT id FROM sessions WHERE name IN ({placeholders})",
-                sessions
-            ).fetchall()
-            session_ids = [s['id'] for s in session_rows]
+            session_ids = _session_ids_by_name(conn, sessions)
         else:
             category_list = _as_list(category)
             group_list = _as_list(group)
@@ -1205,95 +1496,7 @@ def analyze_database_faceted():
         return category, group, session_ids
 
     def _build_baseline_category_group_metadata(conn):
-        all_sessions = conn.execute("SELECT * FROM sessions").fetchall()
-
-        def _safe_int(v):
-            try:
-                return int(v)
-            except Exception:
-                return 0
-
-        def _hit_rate_contrib(total_photos, total_raw_photos):
-            # Only count sessions with valid RAW totals; prevents >100% and missing-data inflation.
-            if total_raw_photos is None:
-                return None
-            raw = _safe_int(total_raw_photos)
-            photos = _safe_int(total_photos)
-            if raw <= 0:
-                return None
-            if photos < 0:
-                return None
-            if photos > raw:
-                return None
-            return photos, raw
-
-        categories = {}
-        for session in all_sessions:
-            cat = session['category'] or 'Uncategorized'
-            if cat not in categories:
-                categories[cat] = {
-                    'sessions': 0,
-                    'photos': 0,
-                    'raw_photos': 0,
-                    'hit_rate_photos': 0,
-                    'hit_rate': None,
-                    'missing_raw_sessions': 0,
-                    'invalid_raw_sessions': 0,
-                }
-            categories[cat]['sessions'] += 1
-            categories[cat]['photos'] += _safe_int(session['total_photos'])
-
-            contrib = _hit_rate_contrib(session['total_photos'], session['total_raw_photos'])
-            if contrib is None:
-                if session['total_raw_photos'] is None:
-                    categories[cat]['missing_raw_sessions'] += 1
-                else:
-                    categories[cat]['invalid_raw_sessions'] += 1
-            else:
-                photos_c, raw_c = contrib
-                categories[cat]['hit_rate_photos'] += photos_c
-                categories[cat]['raw_photos'] += raw_c
-
-        for cat in categories:
-            if categories[cat]['raw_photos'] > 0:
-                categories[cat]['hit_rate'] = (categories[cat]['hit_rate_photos'] / categories[cat]['raw_photos']) * 100
-
-        groups = {}
-        group_to_category = {}
-        for session in all_sessions:
-            grp = session['group_name'] or 'Ungrouped'
-            cat = session['category'] or 'Uncategorized'
-            if grp not in groups:
-                groups[grp] = {
-                    'sessions': 0,
-                    'photos': 0,
-                    'category': cat,
-                    'raw_photos': 0,
-                    'hit_rate_photos': 0,
-                    'hit_rate': None,
-                    'missing_raw_sessions': 0,
-                    'invalid_raw_sessions': 0,
-                }
-                group_to_category[grp] = cat
-            groups[grp]['sessions'] += 1
-            groups[grp]['photos'] += _safe_int(session['total_photos'])
-
-            contrib = _hit_rate_contrib(session['total_photos'], session['total_raw_photos'])
-            if contrib is None:
-                if session['total_raw_photos'] is None:
-                    groups[grp]['missing_raw_sessions'] += 1
-                else:
-                    groups[grp]['invalid_raw_sessions'] += 1
-            else:
-                photos_c, raw_c = contrib
-                groups[grp]['hit_rate_photos'] += photos_c
-                groups[grp]['raw_photos'] += raw_c
-
-        for grp in groups:
-            if groups[grp]['raw_photos'] > 0:
-                groups[grp]['hit_rate'] = (groups[grp]['hit_rate_photos'] / groups[grp]['raw_photos']) * 100
-
-        return categories, groups, group_to_category
+        return _session_breakdowns(conn, include_raw_counts=True)
 
     def _overlay_filtered_category_group_counts(base_categories, base_groups, session_info_by_id, filtered_photos):
         # Start with baseline keys so everything stays visible; then overwrite sessions/photos.
@@ -1348,7 +1551,7 @@ def analyze_database_faceted():
         filters = data.get('filters', {})
         include_photos = bool(data.get('include_photos', True))
 
-        db = DatabaseManager.from_config(CONFIG_PATH)
+        db = get_db()
         analyzer = StatisticsAnalyzer(db)
         conn = db.conn
 
@@ -1464,11 +1667,11 @@ def generate_wrapped():
         task_id = data.get('task_id', 'wrapped')
         
         # Initialize progress
-        progress_store[task_id] = {'progress': 0, 'total': 100, 'status': 'starting'}
+        progress_store.update(task_id, 0, 'starting')
         
-        db = DatabaseManager.from_config(CONFIG_PATH)
+        db = get_db()
         
-        progress_store[task_id] = {'progress': 20, 'total': 100, 'status': 'loading sessions'}
+        progress_store.update(task_id, 20, 'loading sessions')
         
         # Get sessions for the group
         conn = db.conn
@@ -1480,17 +1683,17 @@ def generate_wrapped():
             ORDER BY date
         """, (category, group)).fetchall()
         
-        progress_store[task_id] = {'progress': 60, 'total': 100, 'status': 'analyzing trends'}
+        progress_store.update(task_id, 60, 'analyzing trends')
         
         if not sessions:
-            progress_store[task_id] = {'progress': 100, 'total': 100, 'status': 'complete'}
+            progress_store.update(task_id, 100, 'complete')
             return jsonify({
                 'success': True,
                 'message': 'No sessions found for this category/group',
                 'wrapped': None
             })
         
-        progress_store[task_id] = {'progress': 80, 'total': 100, 'status': 'formatting results'}
+        progress_store.update(task_id, 80, 'formatting results')
         
         sessions_data = []
         for session in sessions:
@@ -1503,7 +1706,7 @@ def generate_wrapped():
                 'date': session['date']
             })
         
-        progress_store[task_id] = {'progress': 100, 'total': 100, 'status': 'complete'}
+        progress_store.update(task_id, 100, 'complete')
         
         return jsonify({
             'success': True,
@@ -1519,7 +1722,7 @@ def generate_wrapped():
     except Exception as e:
         logger.error(f"Error in generate_wrapped: {e}", exc_info=True)
         if task_id in progress_store:
-            progress_store[task_id] = {'progress': 100, 'total': 100, 'status': 'error'}
+            progress_store.update(task_id, 100, 'error')
         return jsonify({'error': str(e)}), 500
 
 
@@ -1539,36 +1742,37 @@ def list_sessions():
         category = request.args.get('category')
         group = request.args.get('group')
         
-        db = DatabaseManager.from_config(CONFIG_PATH)
-        
-        query = "SELECT * FROM sessions WHERE 1=1"
-        params = []
-        
-        if category:
-            query += " AND category = ?"
-            params.append(category)
-        
-        if group:
-            query += " AND group_name = ?"
-            params.append(group)
-        
-        query += " ORDER BY date DESC"
+        db = get_db()
         
-        sessions = db.conn.execute(query, params).fetchall()
-        
-        sessions_list = []
-        for session in sessions:
-            sessions_list.append({
-                'id': session['id'],
-                'name': session['name'],
-                'category': session['category'],
-                'group': session['group_name'],
-                'total_photos': session['total_photos'],
-                'total_raw_photos': session['total_raw_photos'],
-                'hit_rate': session['hit_rate'],
-                'date': session['date'],
-                'description': session['description']
-            })
+        # One fixed statement per filter combination, so each is prepared once
+        # and then reused from the connection's statement cache. Rows come
+        # back as plain tuples and are unpacked by position.
+        cursor = db.conn.cursor()
+        cursor.row_factory = None
+        if category and group:
+            cursor.execute(SQL_SESSIONS_BY_CAT_GROUP, (category, group))
+        elif category:
+            cursor.execute(SQL_SESSIONS_BY_CAT, (category,))
+        elif group:
+            cursor.execute(SQL_SESSIONS_BY_GROUP, (group,))
+        else:
+            cursor.execute(SQL_SESSIONS_ALL)
+        
+        sessions_list = [
+            {
+                'id': session_id,
+                'name': name,
+                'category': category_name,
+                'group': group_name,
+                'total_photos': total_photos,
+                'total_raw_photos': total_raw_photos,
+                'hit_rate': hit_rate,
+                'date': date,
+                'description': description
+            }
+            for (session_id, name, category_name, group_name, total_photos,
+                 total_raw_photos, hit_rate, date, description) in cursor
+        ]
         
         return jsonify({
             'success': True,
@@ -1585,11 +1789,18 @@ def database_overview():
     """
     Get comprehensive database overview with summary statistics.
     
+    Query Parameters:
+        limit: Optional maximum number of sessions to list (default: all)
+        offset: Optional number of sessions to skip (default: 0)
+    
     Returns:
-        JSON with total counts and detailed session list
+        JSON with total counts and detailed session list, streamed in batches
     """
     try:
-        db = DatabaseManager.from_config(CONFIG_PATH)
+        limit = request.args.get('limit', type=int)
+        offset = max(request.args.get('offset', 0, type=int), 0)
+        
+        db = get_db()
         
         # Get total counts
         total_sessions = db.conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
@@ -1613,41 +1824,65 @@ def database_overview():
             ORDER BY group_name
         """).fetchall()
         
-        # Get all sessions with details
-        sessions = db.conn.execute("""
+        summary = {
+            'total_sessions': total_sessions,
+            'total_photos': total_photos,
+            'categories': [{'name': c['category'], 'sessions': c['session_count'], 'photos': c['photo_count']} 
+                          for c in category_stats],
+            'groups': [{'name': g['group_name'], 'sessions': g['session_count'], 'photos': g['photo_count']} 
+                      for g in group_stats]
+        }
+        
+        # Get sessions with details, optionally one page at a time
+        query = """
             SELECT id, name, category, group_name, total_photos, total_raw_photos, hit_rate, date, 
                    folder_path, date_detected
             FROM sessions
             ORDER BY date DESC
-        """).fetchall()
-        
-        sessions_list = []
-        for session in sessions:
-            sessions_list.append({
-                'id': session['id'],
-                'name': session['name'],
-                'category': session['category'] or '',
-                'group': session['group_name'] or '',
-                'total_photos': session['total_photos'],
-                'total_raw_photos': session['total_raw_photos'] or 0,
-                'hit_rate': round(session['hit_rate'], 1) if session['hit_rate'] is not None else None,
-                'date': session['date'],
-                'folder_path': session['folder_path'],
-                'date_detected': session['date_detected']
-            })
+        """
+        params = []
+        if limit is not None or offset:
+            query += " LIMIT ? OFFSET ?"
+            params = [limit if limit is not None else -1, offset]
+        # Plain tuples, unpacked by position in _session_entries
+        cursor = db.conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(query, params)
+        
+        def _session_entries(rows):
+            return [
+                {
+                    'id': session_id,
+                    'name': name,
+                    'category': category or '',
+                    'group': group_name or '',
+                    'total_photos': session_photos,
+                    'total_raw_photos': total_raw_photos or 0,
+                    'hit_rate': round(hit_rate, 1) if hit_rate is not None else None,
+                    'date': date,
+                    'folder_path': folder_path,
+                    'date_detected': date_detected
+                }
+                for (session_id, name, category, group_name, session_photos, total_raw_photos,
+                     hit_rate, date, folder_path, date_detected) in rows
+            ]
         
-        return jsonify({
-            'success': True,
-            'summary': {
-                'total_sessions': total_sessions,
-                'total_photos': total_photos,
-                'categories': [{'name': c['category'], 'sessions': c['session_count'], 'photos': c['photo_count']} 
-                              for c in category_stats],
-                'groups': [{'name': g['group_name'], 'sessions': g['session_count'], 'photos': g['photo_count']} 
-                          for g in group_stats]
-            },
-            'sessions': sessions_list
-        })
+        def generate():
+            # Summary first, then the sessions list a batch of rows at a time,
+            # so neither the rows nor the encoded response are held in full
+            yield _json_bytes({'success': True, 'summary': summary})[:-1] + b',"sessions":['
+            separator = b''
+            while True:
+                rows = cursor.fetchmany(OVERVIEW_BATCH_SIZE)
+                if not rows:
+                    break
+                yield separator + _json_bytes(_session_entries(rows))[1:-1]
+                separator = b','
+            yield b']}'
+        
+        # stream_with_context keeps the request (and its pooled connection)
+        # alive until the last chunk is sent
+        return Response(stream_with_context(generate()), mimetype='application/json')
         
     except Exception as e:
         logger.error(f"Error in database_overview: {e}", exc_info=True)
@@ -1663,7 +1898,7 @@ def get_categories_and_groups():
         JSON with categories and groups lists
     """
     try:
-        db = DatabaseManager.from_config(CONFIG_PATH)
+        db = get_db()
         categories = db.get_all_categories()
         groups = db.get_all_groups()
         
@@ -1693,8 +1928,9 @@ def reset_database():
         if not confirm:
             return jsonify({'error': 'Confirmation required'}), 400
         
-        db = DatabaseManager.from_config(CONFIG_PATH)
-        deleted_counts = db.reset_database()
+        db = get_db()
+        with _data_write():
+            deleted_counts = db.reset_database()
         
         return jsonify({
             'success': True,
@@ -1725,8 +1961,9 @@ def delete_by_category():
         if not categories:
             return jsonify({'error': 'No categories specified'}), 400
         
-        db = DatabaseManager.from_config(CONFIG_PATH)
-        deleted_count = db.delete_sessions_by_category(categories)
+        db = get_db()
+        with _data_write():
+            deleted_count = db.delete_sessions_by_category(categories)
         
         return jsonify({
             'success': True,
@@ -1757,8 +1994,9 @@ def delete_by_group():
         if not groups:
             return jsonify({'error': 'No groups specified'}), 400
         
-        db = DatabaseManager.from_config(CONFIG_PATH)
-        deleted_count = db.delete_sessions_by_group(groups)
+        db = get_db()
+        with _data_write():
+            deleted_count = db.delete_sessions_by_group(groups)
         
         return jsonify({
             'success': True,
@@ -1798,10 +2036,10 @@ def rename_sessions():
         if not all([old_category, old_group, new_category, new_group]):
             return jsonify({'error': 'All fields are required'}), 400
         
-        db = DatabaseManager.from_config(CONFIG_PATH)
+        db = get_db()
         
         # Get all sessions matching old category/group
-        with db.get_cursor() as cursor:
+        with _data_write(), db.get_cursor() as cursor:
             cursor.execute("""
                 UPDATE sessions 
                 SET category = ?, group_name = ?
@@ -1851,30 +2089,17 @@ def update_session(session_id):
         if not name:
             return jsonify({'error': 'Session name is required'}), 400
         
-        db = DatabaseManager.from_config(CONFIG_PATH)
-        
-        # Get current session to access total_photos for hit rate calculation
-        session = db.get_session(session_id)
-        if not session:
-            return jsonify({'error': 'Session not found'}), 404
+        db = get_db()
         
-        # Calculate hit rate if both total_photos and total_raw_photos are present
-        hit_rate = None
-        if session.total_photos and total_raw_photos and total_raw_photos > 0:
-            hit_rate = round((session.total_photos / total_raw_photos) * 100, 1)
-        
-        # Update session
-        with db.get_cursor() as cursor:
-            cursor.execute("""
-                UPDATE sessions 
-                SET name = ?, category = ?, group_name = ?, total_raw_photos = ?, hit_rate = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            """, (name, category, group, total_raw_photos, hit_rate, session_id))
+        # Update session, recalculating its hit rate in the same statement
+        with _data_write(), db.get_cursor() as cursor:
+            cursor.execute(SQL_UPDATE_SESSION, (name, category, group, total_raw_photos,
+                                                total_raw_photos, total_raw_photos, session_id))
             
             if cursor.rowcount == 0:
                 return jsonify({'error': 'Session not found'}), 404
         
-        logger.info(f"Updated session {session_id}: {name} (RAW: {total_raw_photos}, Hit Rate: {hit_rate}%)")
+        logger.info(f"Updated session {session_id}: {name} (RAW: {total_raw_photos})")
         
         return jsonify({
             'success': True,
@@ -1895,26 +2120,23 @@ def delete_session(session_id):
         session_id: Session ID to delete
     
     Returns:
-        JSON with success status
+        Empty 204 response on success, JSON error otherwise
     """
     try:
-        db = DatabaseManager.from_config(CONFIG_PATH)
+        db = get_db()
         
         # Get session name for logging
         session = db.get_session(session_id)
         if not session:
             return jsonify({'error': 'Session not found'}), 404
         
-        # Delete session (CASCADE will delete associated photos)
-        with db.get_cursor() as cursor:
-            cursor.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+        # Delete the photos in batches, then the session
+        with _data_write():
+            db.delete_session(session_id)
         
         logger.info(f"Deleted session {session_id}: {session.name}")
         
-        return jsonify({
-            'success': True,
-            'message': f'Session "{session.name}" deleted successfully'
-        })
+        return app.response_class(status=204)
         
     except Exception as e:
         logger.error(f"Error deleting session {session_id}: {e}", exc_info=True)
@@ -1930,21 +2152,33 @@ def list_categories():
         JSON list of categories
     """
     try:
-        db = DatabaseManager.from_config(CONFIG_PATH)
-        categories = db.list_categories()
-        
-        categories_list = []
-        for category in categories:
-            categories_list.append({
-                'name': category.name,
-                'total_sessions': category.total_sessions,
-                'total_photos': category.total_photos
-            })
+        db = get_db()
+        
+        # Serve repeat requests from the cache until the database changes
+        version = _cache_version(db)
+        cache_key = ('categories', version) if version is not None else None
+        if cache_key is not None:
+            body = _listing_cache.get(cache_key)
+            if body is not None:
+                return Response(body, mimetype='application/json')
+        
+        # Read the three reported columns straight into response dicts
+        # rather than through Category objects
+        cursor = db.conn.cursor()
+        cursor.row_factory = None
+        cursor.execute("SELECT name, total_sessions, total_photos FROM categories ORDER BY name")
+        categories_list = [
+            {'name': name, 'total_sessions': total_sessions, 'total_photos': total_photos}
+            for name, total_sessions, total_photos in cursor
+        ]
         
-        return jsonify({
+        body = _json_bytes({
             'success': True,
             'categories': categories_list
         })
+        if cache_key is not None:
+            _listing_cache.put(cache_key, body)
+        return Response(body, mimetype='application/json')
         
     except Exception as e:
         logger.error(f"Error in list_categories: {e}", exc_info=True)
@@ -1965,12 +2199,23 @@ def list_groups():
     try:
         category = request.args.get('category')
         
-        db = DatabaseManager.from_config(CONFIG_PATH)
+        db = get_db()
+        
+        # Serve repeat requests from the cache until the database changes
+        version = _cache_version(db)
+        cache_key = ('groups', category, version) if version is not None else None
+        if cache_key is not None:
+            body = _listing_cache.get(cache_key)
+            if body is not None:
+                return Response(body, mimetype='application/json')
         
         if category:
-            groups = db.list_groups_by_category(category)
+            groups_list = [
+                {'name': group.name, 'total_sessions': group.total_sessions, 'total_photos': group.total_photos}
+                for group in db.list_groups_by_category(category)
+            ]
         else:
-            # Get all groups
+            # Get all groups, straight from the aggregate rows
             query = """
                 SELECT group_name as name, 
                        COUNT(*) as total_sessions,
@@ -1979,30 +2224,21 @@ def list_groups():
                 GROUP BY group_name
                 ORDER BY name
             """
-            results = db.conn.execute(query).fetchall()
-            
-            from models import Group
-            groups = [
-                Group(
-                    name=row['name'],
-                    total_sessions=row['total_sessions'],
-                    total_photos=row['total_photos']
-                )
-                for row in results
+            cursor = db.conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(query)
+            groups_list = [
+                {'name': name, 'total_sessions': total_sessions, 'total_photos': total_photos}
+                for name, total_sessions, total_photos in cursor
             ]
         
-        groups_list = []
-        for group in groups:
-            groups_list.append({
-                'name': group.name,
-                'total_sessions': group.total_sessions,
-                'total_photos': group.total_photos
-            })
-        
-        return jsonify({
+        body = _json_bytes({
             'success': True,
             'groups': groups_list
         })
+        if cache_key is not None:
+            _listing_cache.put(cache_key, body)
+        return Response(body, mimetype='application/json')
         
     except Exception as e:
         logger.error(f"Error in list_groups: {e}", exc_info=True)
@@ -2028,7 +2264,7 @@ def analyze_trends():
         data = request.get_json() or {}
         filters = data.get('filters', {})
         
-        db = DatabaseManager.from_config(CONFIG_PATH)
+        db = get_db()
         conn = db.conn
         
         # Get all sessions
@@ -2227,7 +2463,7 @@ def analyze_correlations():
         year_filter = data.get('year')  # e.g., "2024"
         month_filter = data.get('month')  # e.g., "01"
         
-        db = DatabaseManager.from_config(CONFIG_PATH)
+        db = get_db()
         conn = db.conn
         
         # Get available years and months from photos table
@@ -2431,13 +2667,23 @@ def analyze_correlations():
         return jsonify({'error': str(e)}), 500
 
 
+def _port_in_use(port) -> bool:
+    """Check whether something accepts connections on localhost:port."""
+    import socket
+    
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.settimeout(0.5)
+        return sock.connect_ex(('127.0.0.1', port)) == 0
+
+
 def kill_process_on_port(port):
     """Kill any process listening on the specified port."""
-    import platform
-    import subprocess
+    # Usually nothing is listening; skip the netstat/lsof scan then
+    if not _port_in_use(port):
+        return
     
     try:
-        if platform.system() == 'Windows':
+        if IS_WINDOWS:
             # Find process using port
             result = subprocess.run(
                 ['netstat', '-ano'], 
@@ -2506,7 +2752,13 @@ def main():
     logger.info("Press Ctrl+C to stop the server")
     logger.info("=" * 80)
     
-    app.run(debug=False, host='0.0.0.0', port=5000)
+    # Serve each request on its own thread so /api/progress polling stays
+    # responsive while /api/extract or /api/crawl runs. Progress is kept in
+    # this process, so the app must run as a single process.
+    if waitress_serve is not None:
+        waitress_serve(app, host='0.0.0.0', port=5000, threads=min(32, 4 * (os.cpu_count() or 1)))
+    else:
+        app.run(debug=False, host='0.0.0.0', port=5000, threaded=True)
 
 
 if __name__ == '__main__':
@@ -4191,11 +4191,11 @@ async function deleteSession(sessionId, sessionName) {
             method: 'DELETE'
         });
         
-        const data = await response.json();
-        
-        if (response.ok && data.success) {
+        // Success is an empty 204; only errors carry a JSON body
+        if (response.ok) {
             await loadDatabaseOverview(); // Reload to get updated data
         } else {
+            const data = await response.json();
             alert(`Failed to delete session: ${data.error || 'Unknown error'}`);
         }
     } catch (error) {
@@ -0,0 +1,147 @@
+"""
+Analysis File Parsing Tests
+Tests: old_scripts parse_analysis_file reads every row of every lens section,
+including the first row after each section header
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add old_scripts to path
+sys.path.insert(0, str(Path(__file__).parent / 'old_scripts'))
+
+from photo_metadata_analyzer import parse_analysis_file
+
+SAMPLE_REPORT = """Analysis for: sample
+================================================================================
+
+OVERALL METRICS
+--------------------------------------------------------------------------------
+
+Lens Type Distribution:
+  Prime Lenses: 10 photos (62.5%)
+  Zoom Lenses: 6 photos (37.5%)
+
+================================================================================
+DETAILED BREAKDOWN BY LENS
+================================================================================
+
+--------------------------------------------------------------------------------
+Lens: FE 35mm F1.4 GM (Used 10 times)
+--------------------------------------------------------------------------------
+Shutter Speeds:
+  1/200: 6 times (60.0%)
+  1/1000: 4 times (40.0%)
+Apertures:
+  f/1.4: 7 times (70.0%)
+  f/2.8: 3 times (30.0%)
+ISOs:
+  ISO 100: 8 times (80.0%)
+  ISO 3200: 2 times (20.0%)
+Exposure Programs:
+  Aperture-priority AE: 9 times (90.0%)
+  Manual: 1 times (10.0%)
+Flash Modes:
+  No Flash: 10 times (100.0%)
+
+--------------------------------------------------------------------------------
+Lens: FE 24-70mm F2.8 GM II (Used 6 times)
+--------------------------------------------------------------------------------
+Shutter Speeds:
+  1/60: 6 times (100.0%)
+Apertures:
+  f/2.8: 6 times (100.0%)
+ISOs:
+  ISO 800: 5 times (83.3%)
+  ISO 1600: 1 times (16.7%)
+Exposure Programs:
+  Manual: 6 times (100.0%)
+Flash Modes:
+  Fired: 2 times (33.3%)
+  No Flash: 4 times (66.7%)
+"""
+
+
+def _parse(text):
+    fd, path = tempfile.mkstemp(suffix='.txt')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        return parse_analysis_file(path)
+    finally:
+        os.remove(path)
+
+
+def test_parses_every_lens():
+    """Test that each lens block is found with its usage count"""
+    print("\n=== Test 1: Lens Blocks ===")
+    
+    lenses = _parse(SAMPLE_REPORT)
+    
+    assert list(lenses) == ['FE 35mm F1.4 GM', 'FE 24-70mm F2.8 GM II']
+    assert lenses['FE 35mm F1.4 GM']['count'] == 10
+    assert lenses['FE 24-70mm F2.8 GM II']['count'] == 6
+    print("✓ Both lenses parsed with their counts")
+    return True
+
+
+def test_first_row_of_each_section():
+    """Test that the first row after every section header is counted"""
+    print("\n=== Test 2: First Row of Each Section ===")
+    
+    prime = _parse(SAMPLE_REPORT)['FE 35mm F1.4 GM']
+    
+    assert prime['shutter_speeds'] == {'1/200': 6, '1/1000': 4}
+    assert prime['apertures'] == {1.4: 7, 2.8: 3}
+    assert prime['isos'] == {100: 8, 3200: 2}
+    assert prime['exposure_programs'] == {'Aperture-priority AE': 9, 'Manual': 1}
+    assert prime['flash_modes'] == {'No Flash': 10}
+    print("✓ All rows parsed, including each section's first row")
+    return True
+
+
+def test_section_totals_match_lens_count():
+    """Test that every section's rows add up to the lens usage count"""
+    print("\n=== Test 3: Section Totals ===")
+    
+    for name, lens in _parse(SAMPLE_REPORT).items():
+        for field in ('shutter_speeds', 'apertures', 'isos', 'exposure_programs', 'flash_modes'):
+            assert sum(lens[field].values()) == lens['count'], (name, field)
+        print(f"✓ {name}: all sections total {lens['count']}")
+    return True
+
+
+def run_all_tests():
+    """Run all analysis file parsing tests"""
+    print("=" * 80)
+    print("PHOTOGRAPHY WRAPPED - ANALYSIS FILE PARSING")
+    print("=" * 80)
+    
+    tests = [
+        ("Lens Blocks", test_parses_every_lens),
+        ("First Row of Each Section", test_first_row_of_each_section),
+        ("Section Totals", test_section_totals_match_lens_count),
+    ]
+    
+    results = []
+    for name, test_func in tests:
+        try:
+            result = test_func()
+            results.append((name, result))
+        except Exception as e:
+            print(f"\n✗ EXCEPTION in {name}: {e!r}")
+            results.append((name, False))
+    
+    passed = sum(1 for _, result in results if result)
+    print("\n" + "=" * 80)
+    print(f"Results: {passed}/{len(results)} tests passed")
+    print("=" * 80)
+    
+    return passed == len(results)
+
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
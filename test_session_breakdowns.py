@@ -0,0 +1,171 @@
+"""
+Session Breakdown Tests
+Tests: run_local._session_breakdowns (SQL GROUP BY) matches the per-session
+Python loops it replaced, on randomized session tables
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from database.db_manager import DatabaseManager
+from run_local import _session_breakdowns
+
+CATEGORIES = ['running', 'Running', 'concerts', 'portraits', '']
+GROUPS = ['the sole', 'The Sole', 'club', 'weekly', 'solo', '']
+PHOTO_COUNTS = [None, 0, 1, 12, 40, 150, -3]
+RAW_COUNTS = [None, None, 0, -5, 1, 12, 40, 90, 400]
+
+
+def _reference_breakdowns(conn, include_raw_counts=False):
+    """The per-session loops _session_breakdowns replaced, kept as the oracle."""
+    all_sessions = conn.execute("SELECT * FROM sessions").fetchall()
+    
+    def _safe_int(v):
+        try:
+            return int(v)
+        except Exception:
+            return 0
+    
+    def _hit_rate_contrib(total_photos, total_raw_photos):
+        if total_raw_photos is None:
+            return None
+        raw = _safe_int(total_raw_photos)
+        photos = _safe_int(total_photos)
+        if raw <= 0 or photos < 0 or photos > raw:
+            return None
+        return photos, raw
+    
+    def _new_entry():
+        entry = {'sessions': 0, 'photos': 0, 'raw_photos': 0, 'hit_rate_photos': 0, 'hit_rate': None}
+        if include_raw_counts:
+            entry['missing_raw_sessions'] = 0
+            entry['invalid_raw_sessions'] = 0
+        return entry
+    
+    def _add(entry, session):
+        entry['sessions'] += 1
+        entry['photos'] += _safe_int(session['total_photos'])
+        contrib = _hit_rate_contrib(session['total_photos'], session['total_raw_photos'])
+        if contrib is None:
+            if include_raw_counts:
+                if session['total_raw_photos'] is None:
+                    entry['missing_raw_sessions'] += 1
+                else:
+                    entry['invalid_raw_sessions'] += 1
+        else:
+            entry['hit_rate_photos'] += contrib[0]
+            entry['raw_photos'] += contrib[1]
+    
+    categories = {}
+    groups = {}
+    group_to_category = {}
+    for session in all_sessions:
+        cat = session['category'] or 'Uncategorized'
+        grp = session['group_name'] or 'Ungrouped'
+        if cat not in categories:
+            categories[cat] = _new_entry()
+        if grp not in groups:
+            groups[grp] = _new_entry()
+            groups[grp]['category'] = cat
+            group_to_category[grp] = cat
+        _add(categories[cat], session)
+        _add(groups[grp], session)
+    
+    for entry in list(categories.values()) + list(groups.values()):
+        if entry['raw_photos'] > 0:
+            entry['hit_rate'] = (entry['hit_rate_photos'] / entry['raw_photos']) * 100
+    
+    return categories, groups, group_to_category
+
+
+def _random_database(seed, sessions=200):
+    """Build an in-memory database with a randomized sessions table."""
+    rng = random.Random(seed)
+    db = DatabaseManager(db_type='sqlite', connection_string=':memory:')
+    for i in range(sessions):
+        db.conn.execute(
+            "INSERT INTO sessions (name, category, group_name, total_photos, total_raw_photos, date) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (f"session {i}", rng.choice(CATEGORIES), rng.choice(GROUPS),
+             rng.choice(PHOTO_COUNTS), rng.choice(RAW_COUNTS), f"2024-01-{i % 28 + 1:02d}")
+        )
+    db.conn.commit()
+    return db
+
+
+def _check(include_raw_counts):
+    for seed in range(25):
+        db = _random_database(seed)
+        expected = _reference_breakdowns(db.conn, include_raw_counts)
+        actual = _session_breakdowns(db.conn, include_raw_counts=include_raw_counts)
+        # Compare as item lists so first-seen ordering is checked too
+        for name, exp, act in zip(('categories', 'groups', 'group_to_category'), expected, actual):
+            assert list(act.items()) == list(exp.items()), (seed, name)
+        db.close()
+
+
+def test_breakdowns_match_reference():
+    """Test category/group totals, hit rates, fallbacks and ordering"""
+    print("\n=== Test 1: Breakdowns Match Python Loops ===")
+    
+    _check(include_raw_counts=False)
+    print("✓ 25 randomized databases match")
+    return True
+
+
+def test_raw_counts_match_reference():
+    """Test missing_raw_sessions / invalid_raw_sessions counts"""
+    print("\n=== Test 2: RAW Count Breakdowns Match Python Loops ===")
+    
+    _check(include_raw_counts=True)
+    print("✓ 25 randomized databases match")
+    return True
+
+
+def test_empty_database():
+    """Test that an empty sessions table gives empty breakdowns"""
+    print("\n=== Test 3: Empty Database ===")
+    
+    db = DatabaseManager(db_type='sqlite', connection_string=':memory:')
+    assert _session_breakdowns(db.conn) == ({}, {}, {})
+    db.close()
+    print("✓ Empty breakdowns")
+    return True
+
+
+def run_all_tests():
+    """Run all session breakdown tests"""
+    print("=" * 80)
+    print("PHOTOGRAPHY WRAPPED - SESSION BREAKDOWNS")
+    print("=" * 80)
+    
+    tests = [
+        ("Breakdowns Match Python Loops", test_breakdowns_match_reference),
+        ("RAW Count Breakdowns Match Python Loops", test_raw_counts_match_reference),
+        ("Empty Database", test_empty_database),
+    ]
+    
+    results = []
+    for name, test_func in tests:
+        try:
+            result = test_func()
+            results.append((name, result))
+        except Exception as e:
+            print(f"\n✗ EXCEPTION in {name}: {e!r}")
+            results.append((name, False))
+    
+    passed = sum(1 for _, result in results if result)
+    print("\n" + "=" * 80)
+    print(f"Results: {passed}/{len(results)} tests passed")
+    print("=" * 80)
+    
+    return passed == len(results)
+
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)